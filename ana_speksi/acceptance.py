@@ -6,7 +6,9 @@ import re
 from pathlib import Path
 
 from ana_speksi.config import get_auto_confirm
+from ana_speksi.fsutil import atomic_write_text, read_bytes
 from ana_speksi.models import DocStatus, Phase, SpecStatus
+from ana_speksi.profiling import traced
 from ana_speksi.status import update_index_task_counts
 
 
@@ -55,6 +57,7 @@ _ACCEPTANCE_TARGETS: dict[Phase, dict] = {
 }
 
 
+@traced("acceptance")
 def get_acceptance_status(spec: SpecStatus) -> dict:
     """Return acceptance status for a spec (files_to_accept, already_accepted).
 
@@ -82,7 +85,7 @@ def get_acceptance_status(spec: SpecStatus) -> dict:
         proposal_path = spec.path / "proposal.md"
         if spec.proposal_status == DocStatus.ACCEPTED:
             already_accepted.append(str(proposal_path))
-        elif proposal_path.exists():
+        elif spec.has_proposal:
             files_to_accept.append(str(proposal_path))
 
     if target["check_functional_specs"]:
@@ -90,7 +93,7 @@ def get_acceptance_status(spec: SpecStatus) -> dict:
             fp = spec.path / "specs" / story.folder / "functional-spec.md"
             if story.functional_spec_status == DocStatus.ACCEPTED:
                 already_accepted.append(str(fp))
-            elif fp.exists():
+            elif story.has_functional_spec:
                 files_to_accept.append(str(fp))
 
     if target["check_technical_specs"]:
@@ -98,7 +101,7 @@ def get_acceptance_status(spec: SpecStatus) -> dict:
             fp = spec.path / "specs" / story.folder / "technical-spec.md"
             if story.technical_spec_status == DocStatus.ACCEPTED:
                 already_accepted.append(str(fp))
-            elif fp.exists():
+            elif story.has_technical_spec:
                 files_to_accept.append(str(fp))
 
     if target["check_tasks"]:
@@ -106,7 +109,7 @@ def get_acceptance_status(spec: SpecStatus) -> dict:
             fp = spec.path / "specs" / story.folder / "tasks.md"
             if story.tasks_status == DocStatus.ACCEPTED:
                 already_accepted.append(str(fp))
-            elif fp.exists():
+            elif story.has_tasks:
                 files_to_accept.append(str(fp))
 
     return {
@@ -125,14 +128,15 @@ def update_file_status(file_path: str) -> bool:
     path = Path(file_path)
     if not path.exists():
         return False
-    content = path.read_text(encoding="utf-8")
+    # Bytes round-trip keeps the file's own line endings
+    content = read_bytes(path).decode("utf-8")
     new_content = re.sub(
         r"\*\*Status\*\*:\s*Draft",
         "**Status**: Accepted",
         content,
     )
     if new_content != content:
-        path.write_text(new_content, encoding="utf-8")
+        atomic_write_text(path, new_content)
         return True
     return False
 
@@ -143,11 +147,11 @@ def update_index_entry(index_path: Path, file_path: str, spec_path: Path) -> boo
         return False
     rel_path = Path(file_path).relative_to(spec_path)
     filename = Path(file_path).name
-    content = index_path.read_text(encoding="utf-8")
+    content = read_bytes(index_path).decode("utf-8")
     old = f"- [Draft] [{filename}]({rel_path})"
     new = f"- [Accepted] [{filename}]({rel_path})"
     if old in content:
         content = content.replace(old, new)
-        index_path.write_text(content, encoding="utf-8")
+        atomic_write_text(index_path, content)
         return True
     return False
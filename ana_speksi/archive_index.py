@@ -0,0 +1,234 @@
+"""Incrementally maintained index of archived specs.
+
+archive/ only ever grows, so it is summarised once into
+``.cache/archive.jsonl``: a header line followed by one JSON object per
+archived spec (see ``ArchivedSpec``).  A warm lookup stats archive/ and
+reads the index file; only when archive/ itself changed is it listed, and
+then only folders that are new or whose own stat key changed are parsed.
+
+Edits deep inside an already archived spec (e.g. a story's tasks.md) do not
+change the folder's stat key; ``load_archive_index(rebuild=True)`` re-parses
+everything.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+from ana_speksi import iostats
+from ana_speksi.cache import get_cache_dir, stat_key
+from ana_speksi.documents import parse_doc_header
+from ana_speksi.fsutil import atomic_write_text, read_text
+from ana_speksi.models import ARCHIVE_DIR, CACHE_DIR, ArchivedSpec
+from ana_speksi.profiling import span, traced
+from ana_speksi.tasks import parse_tasks
+
+ARCHIVE_INDEX = "archive.jsonl"
+
+# Bump when the shape of ArchivedSpec changes.
+ARCHIVE_INDEX_VERSION = 1
+
+SUMMARY_CHARS = 240
+
+# <yyyy-mm-dd>-<spec name>, as written by as-docufy
+_FOLDER_RE = re.compile(r"^(?P<date>\d{4}-\d{2}-\d{2})-(?P<name>.+)$")
+
+# A truth document path mentioned anywhere in a spec document
+_TRUTH_REF_RE = re.compile(r"(?<![\w-])truth/(?P<path>[\w./-]+?\.md)\b")
+
+_SECTION_RE = re.compile(r"^## +(?P<title>.+?)\s*$", re.MULTILINE)
+
+
+def _spec_markdown(spec_dir: Path) -> list[Path]:
+    """Return every markdown file of a spec folder, in sorted order."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(spec_dir):
+        iostats.count("scandir")
+        dirnames.sort()
+        files.extend(Path(dirpath) / f for f in sorted(filenames) if f.endswith(".md"))
+    return files
+
+
+def _section_text(content: str, title: str) -> str:
+    """Return the body of the first ``## <title>`` section, or ''."""
+    matches = list(_SECTION_RE.finditer(content))
+    for i, match in enumerate(matches):
+        if match.group("title").lower() == title.lower():
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            return content[match.end() : end].strip()
+    return ""
+
+
+def _summary(proposal: str) -> str:
+    """First paragraph of the proposal's problem statement, shortened."""
+    body = _section_text(proposal, "Problem Statement") or _section_text(proposal, "Original Prompt")
+    paragraph = " ".join(body.split("\n\n", 1)[0].split()) if body else ""
+    if len(paragraph) > SUMMARY_CHARS:
+        paragraph = paragraph[: SUMMARY_CHARS - 3].rsplit(" ", 1)[0] + "..."
+    return paragraph
+
+
+def parse_archived_spec(spec_dir: Path) -> ArchivedSpec:
+    """Summarise one archived spec folder by reading its documents once."""
+    match = _FOLDER_RE.match(spec_dir.name)
+    name = match.group("name") if match else spec_dir.name
+    entry = ArchivedSpec(
+        folder=spec_dir.name,
+        name=name,
+        ticket=name.split(".", 1)[0] if "." in name else None,
+        archived=match.group("date") if match else None,
+    )
+    stories: set[str] = set()
+    truth_docs: set[str] = set()
+    with span("parse", spec=spec_dir.name):
+        for path in _spec_markdown(spec_dir):
+            content = read_text(path)
+            rel = path.relative_to(spec_dir).parts
+            if rel == ("proposal.md",):
+                header = parse_doc_header(content)
+                entry.ticket = header.ticket or entry.ticket
+                entry.created = header.date
+                entry.summary = _summary(content)
+            elif len(rel) == 3 and rel[0] == "specs":
+                stories.add(rel[1])
+                if rel[2] == "tasks.md":
+                    tasks = parse_tasks(content)
+                    entry.tasks_total += tasks.total
+                    entry.tasks_done += tasks.done
+            if "truth/" in content:
+                truth_docs.update(m.group("path") for m in _TRUTH_REF_RE.finditer(content))
+    entry.stories = sorted(stories)
+    entry.truth_docs = sorted(truth_docs)
+    return entry
+
+
+def _folder_key(entry: os.DirEntry) -> list[int]:
+    iostats.count("stat")
+    return stat_key(entry.stat())
+
+
+def _read_index(path: Path) -> tuple[list[int] | None, dict[str, dict]]:
+    """Return (archive/ key, folder -> stored entry); empty if unusable."""
+    try:
+        lines = read_text(path).splitlines()
+        header = json.loads(lines[0])
+        if header.get("version") != ARCHIVE_INDEX_VERSION:
+            return None, {}
+        entries = {}
+        for line in lines[1:]:
+            stored = json.loads(line)
+            entries[stored["folder"]] = stored
+        return header.get("key"), entries
+    except Exception:
+        return None, {}
+
+
+def _write_index(root: Path, key: list[int], stored: list[dict]) -> None:
+    lines = [json.dumps({"version": ARCHIVE_INDEX_VERSION, "key": key})]
+    lines.extend(json.dumps(s) for s in stored)
+    try:
+        get_cache_dir(root)
+        atomic_write_text(root / CACHE_DIR / ARCHIVE_INDEX, "\n".join(lines) + "\n")
+    except OSError:
+        pass
+
+
+def _to_spec(stored: dict) -> ArchivedSpec:
+    return ArchivedSpec(**{k: v for k, v in stored.items() if k != "key"})
+
+
+@traced("archive index")
+def load_archive_index(root: Path, rebuild: bool = False, jobs: int = 1) -> list[ArchivedSpec]:
+    """Return every archived spec, newest first, updating the index as needed.
+
+    ``jobs`` > 1 parses new or changed folders on that many threads.
+    """
+    archive = root / ARCHIVE_DIR
+    try:
+        iostats.count("stat")
+        archive_key = stat_key(archive.stat())
+    except FileNotFoundError:
+        return []
+    key, stored = (None, {}) if rebuild else _read_index(root / CACHE_DIR / ARCHIVE_INDEX)
+
+    if key != archive_key:
+        iostats.count("scandir")
+        with span("walk", dir=ARCHIVE_DIR), os.scandir(archive) as it:
+            folders = {e.name: e for e in it if e.is_dir() and not e.name.startswith(".")}
+        current: dict[str, dict] = {}
+        stale: list[tuple[os.DirEntry, list[int]]] = []
+        for name, dir_entry in folders.items():
+            folder_key = _folder_key(dir_entry)
+            previous = stored.get(name)
+            if previous is not None and previous.get("key") == folder_key:
+                current[name] = previous
+            else:
+                stale.append((dir_entry, folder_key))
+
+        pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 and len(stale) > 1 else None
+        run = pool.map if pool else map
+        try:
+            parsed = list(run(parse_archived_spec, [Path(e.path) for e, _ in stale]))
+        finally:
+            if pool:
+                pool.shutdown()
+        for (dir_entry, folder_key), spec in zip(stale, parsed):
+            current[dir_entry.name] = {"key": folder_key, **asdict(spec)}
+
+        stored = dict(sorted(current.items(), reverse=True))
+        _write_index(root, archive_key, list(stored.values()))
+
+    specs = [_to_spec(s) for s in stored.values()]
+    specs.sort(key=lambda s: (s.archived or "", s.folder), reverse=True)
+    return specs
+
+
+def find_archived_spec(specs: list[ArchivedSpec], query: str) -> list[ArchivedSpec]:
+    """Return archived specs matching a folder name, spec name or ticket."""
+    exact = [s for s in specs if query in (s.folder, s.name)]
+    if exact:
+        return exact
+    lowered = query.lower()
+    return [
+        s
+        for s in specs
+        if (s.ticket or "").lower() == lowered
+        or s.name.lower().startswith(f"{lowered}.")
+        or s.name.lower().endswith(f".{lowered}")
+    ]
+
+
+def search_archive(specs: list[ArchivedSpec], query: str) -> list[tuple[int, ArchivedSpec]]:
+    """Rank archived specs against whitespace-separated query terms.
+
+    Every term must occur in one of the fields; matches in the ticket or
+    name weigh more than matches in story names, truth documents or the
+    summary.  Returns (score, spec) pairs, best first.
+    """
+    terms = query.lower().split()
+    results = []
+    for spec in specs:
+        fields = (
+            (10, (spec.ticket or "").lower()),
+            (5, spec.name.lower()),
+            (3, " ".join(spec.stories).lower()),
+            (2, " ".join(spec.truth_docs).lower()),
+            (1, spec.summary.lower()),
+        )
+        score = 0
+        for term in terms:
+            term_score = sum(weight for weight, text in fields if term in text)
+            if not term_score:
+                break
+            score += term_score
+        else:
+            if terms:
+                results.append((score, spec))
+    # Stable sort: equal scores keep the newest-first order of ``specs``
+    results.sort(key=lambda r: -r[0])
+    return results
@@ -0,0 +1,145 @@
+"""Persistent per-file caches stored under ana-speksi/.cache/.
+
+Entries are keyed by the file's path and its (mtime_ns, size, inode) stat
+triple, so a warm run only re-parses files that actually changed.  The cache
+is purely an optimisation: a missing, corrupt or foreign cache file is
+silently treated as empty.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ana_speksi import iostats
+from ana_speksi.fsutil import atomic_write_text, read_text
+from ana_speksi.models import CACHE_DIR
+from ana_speksi.profiling import traced
+
+# Bump when the shape of cached facts changes.
+CACHE_VERSION = 4
+
+# Caches kept in memory between commands by a long-running process (serve).
+_resident: dict[Path, FileCache] | None = None
+
+
+def keep_resident() -> None:
+    """Keep loaded caches in memory for the lifetime of the process.
+
+    Used by ``ana-speksi serve`` so repeated commands skip re-reading the
+    cache files as well as the documents.
+    """
+    global _resident
+    if _resident is None:
+        _resident = {}
+
+
+def get_cache_dir(root: Path) -> Path:
+    """Return the cache directory for an ana-speksi root, creating it if needed.
+
+    A ``.gitignore`` is dropped into the directory so caches are never
+    committed.
+    """
+    cache_dir = root / CACHE_DIR
+    if not cache_dir.is_dir():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / ".gitignore").write_text("*\n", encoding="utf-8")
+    return cache_dir
+
+
+def stat_key(st: os.stat_result) -> list[int]:
+    """Return the cache key for a stat result."""
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+class FileCache:
+    """JSON-backed map of file path -> facts, validated by stat key.
+
+    Only entries looked up or stored during the current run are written back
+    on ``save``, which keeps the file from accumulating entries for specs
+    that have since been archived.  ``get`` and ``put`` only do single dict
+    operations, so one instance can be shared by scanner threads.
+    """
+
+    def __init__(self, path: Path, base: Path) -> None:
+        self.path = path
+        self.base = base
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._seen: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+
+    @classmethod
+    @traced("cache load")
+    def load(cls, root: Path, name: str) -> FileCache:
+        """Load the cache ``name`` (e.g. ``status.json``) for a root."""
+        path = root / CACHE_DIR / name
+        if _resident is not None and path in _resident:
+            cache = _resident[path]
+            cache._seen = {}
+            return cache
+        cache = cls(path, root)
+        try:
+            data = json.loads(read_text(cache.path))
+            entries = data["entries"] if data.get("version") == CACHE_VERSION else {}
+            if isinstance(entries, dict) and all(isinstance(e, dict) for e in entries.values()):
+                cache._entries = entries
+        except Exception:
+            cache._entries = {}
+        if _resident is not None:
+            _resident[path] = cache
+        return cache
+
+    def _rel(self, file_path: Path) -> str:
+        try:
+            return file_path.relative_to(self.base).as_posix()
+        except ValueError:
+            return str(file_path)
+
+    def get(self, file_path: Path, st: os.stat_result) -> dict[str, Any] | None:
+        """Return cached facts for ``file_path`` if its stat key still matches."""
+        rel = self._rel(file_path)
+        entry = self._entries.get(rel)
+        if entry is None or entry.get("key") != stat_key(st) or "facts" not in entry:
+            iostats.count("cache_miss")
+            return None
+        iostats.count("cache_hit")
+        self._seen[rel] = entry
+        return entry["facts"]
+
+    def put(self, file_path: Path, st: os.stat_result, facts: dict[str, Any]) -> None:
+        """Store facts for ``file_path`` under its current stat key."""
+        rel = self._rel(file_path)
+        entry = {"key": stat_key(st), "facts": facts}
+        self._entries[rel] = entry
+        self._seen[rel] = entry
+        self._dirty = True
+
+    @traced("cache save")
+    def save(self, prune: bool = True) -> None:
+        """Write the cache back to disk.
+
+        With ``prune`` only entries touched during this run are kept; pass
+        False after a partial scan.  Nothing is written on a fully warm run.
+        Writes are atomic, so concurrent invocations can only ever replace a
+        valid cache with another valid cache.
+        """
+        if prune:
+            if not self._dirty and len(self._seen) == len(self._entries):
+                return
+            entries = self._seen
+        else:
+            if not self._dirty:
+                return
+            entries = self._entries
+        try:
+            get_cache_dir(self.base)
+            atomic_write_text(
+                self.path,
+                json.dumps({"version": CACHE_VERSION, "entries": entries}),
+            )
+        except OSError:
+            return
+        self._entries = dict(entries)
+        self._dirty = False
@@ -1,43 +1,144 @@
 """CLI entry point for ana_speksi.
 
 Commands are defined in ``ana_speksi.cli_commands``.  This module only
-creates the Typer app and wires them together.
+creates the Typer app and wires them together.  Command modules are
+imported when their command is invoked, so e.g. ``status --toon`` does not
+import the skill generator, rich or yaml.
 """
 
 from __future__ import annotations
 
+import importlib
+import os
+import time
+from pathlib import Path
+
 import typer
+from typer.core import TyperGroup
+
+from ana_speksi import iostats, profiling
+
+# Command name -> "module:attribute" of a command function or Typer sub-app.
+LAZY_COMMANDS: dict[str, str] = {
+    # Infrastructure
+    "init": "ana_speksi.cli_commands.init:init_command",
+    "update": "ana_speksi.cli_commands.update:update_command",
+    "new": "ana_speksi.cli_commands.new:new_command",
+    # Utility
+    "status": "ana_speksi.cli_commands.status:status_command",
+    "accept": "ana_speksi.cli_commands.accept:accept_command",
+    "continue": "ana_speksi.cli_commands.continue_cmd:continue_command",
+    "sync-counts": "ana_speksi.cli_commands.sync_counts:sync_counts_command",
+    "what-to-code-next": "ana_speksi.cli_commands.what_to_code_next:what_to_code_next_command",
+    "lint": "ana_speksi.cli_commands.lint:lint_command",
+    "context": "ana_speksi.cli_commands.context:context_command",
+    "serve": "ana_speksi.cli_commands.serve:serve_command",
+    # Sub-apps
+    "truth": "ana_speksi.cli_commands.truth:truth_app",
+    "archive": "ana_speksi.cli_commands.archive:archive_app",
+    "dev": "ana_speksi.cli_commands.dev:dev_app",
+}
+
+
+def _load_command(name: str):
+    """Import a command's module and build its click command."""
+    module_name, _, attr = LAZY_COMMANDS[name].partition(":")
+    start = time.perf_counter_ns()
+    target = getattr(importlib.import_module(module_name), attr)
+    profiling.record("import", start, time.perf_counter_ns(), module=module_name)
+    wrapper = typer.Typer(add_completion=False)
+    if isinstance(target, typer.Typer):
+        wrapper.add_typer(target, name=name)
+    else:
+        wrapper.command(name)(target)
+    # A callback makes Typer build a group even for a single command
+    wrapper.callback()(lambda: None)
+    return typer.main.get_command(wrapper).commands[name]
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports command modules on first use."""
+
+    def list_commands(self, ctx) -> list[str]:
+        return list(LAZY_COMMANDS)
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name not in self.commands and cmd_name in LAZY_COMMANDS:
+            self.add_command(_load_command(cmd_name), cmd_name)
+        return self.commands.get(cmd_name)
 
-from ana_speksi.cli_commands.accept import accept_command
-from ana_speksi.cli_commands.continue_cmd import continue_command
-from ana_speksi.cli_commands.init import init_command
-from ana_speksi.cli_commands.new import new_command
-from ana_speksi.cli_commands.status import status_command
-from ana_speksi.cli_commands.sync_counts import sync_counts_command
-from ana_speksi.cli_commands.truth import truth_app
-from ana_speksi.cli_commands.update import update_command
-from ana_speksi.cli_commands.what_to_code_next import what_to_code_next_command
 
 app = typer.Typer(
     name="ana_speksi",
     help="Skill-driven spec development framework.",
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
-# Infrastructure
-app.command("init")(init_command)
-app.command("update")(update_command)
-app.command("new")(new_command)
 
-# Utility
-app.command("status")(status_command)
-app.command("accept")(accept_command)
-app.command("continue")(continue_command)
-app.command("sync-counts")(sync_counts_command)
-app.command("what-to-code-next")(what_to_code_next_command)
+@app.callback()
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help=(
+            "Record timing spans and write them as a Chrome trace "
+            f"(same as {profiling.PROFILE_ENV}=1, or {profiling.PROFILE_ENV}=<path>)."
+        ),
+    ),
+    profile_output: Path = typer.Option(
+        None,
+        "--profile-output",
+        help="Path of the trace file (default: ana-speksi-profile-<time>.json).",
+    ),
+    profile_python: bool = typer.Option(
+        False,
+        "--profile-python",
+        help="With profiling, also write a cProfile dump (<trace>.prof).",
+    ),
+    profile_memory: bool = typer.Option(
+        False,
+        "--profile-memory",
+        help="With profiling, also write top tracemalloc allocations (<trace>.memory.txt).",
+    ),
+    metrics: bool = typer.Option(
+        False,
+        "--metrics",
+        help=(
+            "Report I/O counters: a _metrics block in --toon/--json output, "
+            f"otherwise on stderr (same as {iostats.METRICS_ENV}=1)."
+        ),
+    ),
+) -> None:
+    """Skill-driven spec development framework."""
+    iostats.begin_command(metrics or bool(os.environ.get(iostats.METRICS_ENV)))
+    ctx.call_on_close(_print_unreported_metrics)
+
+    env_value = os.environ.get(profiling.PROFILE_ENV)
+    if not (profile or profile_output or env_value):
+        return
+    output = profile_output or profiling.default_output(env_value)
+    profiling.start(output, python=profile_python, memory=profile_memory)
+
+    def finish() -> None:
+        from ana_speksi.console import err_console
+
+        for path in profiling.stop():
+            err_console.print(f"[dim]profile: {path}[/dim]")
+
+    # Close callbacks run last-in first-out: the span ends, then the trace is written
+    ctx.call_on_close(finish)
+    ctx.with_resource(profiling.span("command", command=ctx.invoked_subcommand))
+
+
+def _print_unreported_metrics() -> None:
+    """Print metrics to stderr for commands without TOON/JSON output."""
+    metrics = iostats.unreported_metrics()
+    if metrics is not None:
+        from ana_speksi.console import err_console
 
-# Sub-apps
-app.add_typer(truth_app, name="truth")
+        err_console.print(f"[dim]metrics: {iostats.format_counters(metrics)}[/dim]")
 
 
 if __name__ == "__main__":
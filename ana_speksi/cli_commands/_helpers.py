@@ -2,10 +2,49 @@
 
 from __future__ import annotations
 
+import json
+import sys
+from typing import Any
+
 import typer
-from rich.console import Console
 
-console = Console()
+from ana_speksi import iostats
+from ana_speksi.console import console, err_console
+from ana_speksi.profiling import span
+
+
+def _with_metrics(data: Any) -> Any:
+    """Add the ``_metrics`` block to output data when --metrics is on."""
+    if not isinstance(data, dict):
+        return data
+    metrics = iostats.report_metrics()
+    if metrics is None:
+        return data
+    return {**data, "_metrics": metrics}
+
+
+def print_toon(data: Any) -> None:
+    """Write ``data`` as TOON to stdout.
+
+    Written directly rather than through rich, which would import rich,
+    interpret brackets as markup and hard-wrap long rows.
+    """
+    import toons
+
+    data = _with_metrics(data)
+    with span("toon serialization"):
+        text = toons.dumps(data)
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+
+def print_json(data: Any, indent: int | None = 2) -> None:
+    """Write ``data`` as JSON to stdout (one line with ``indent=None``)."""
+    data = _with_metrics(data)
+    with span("json serialization"):
+        text = json.dumps(data, indent=indent)
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
 
 
 def find_spec(specs: list, name: str | None):
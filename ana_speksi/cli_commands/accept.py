@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import toons
 import typer
 
 from ana_speksi.acceptance import (
@@ -10,7 +9,8 @@ from ana_speksi.acceptance import (
     update_file_status,
     update_index_entry,
 )
-from ana_speksi.cli_commands._helpers import console, find_spec
+from ana_speksi.cli_commands._helpers import console, find_spec, print_toon
+from ana_speksi.config import get_jobs
 from ana_speksi.status import (
     get_ana_speksi_root,
     list_ongoing_specs,
@@ -28,10 +28,24 @@ def accept_command(
         "--toon",
         help="Output as TOON (token-friendly format for AI agents).",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the status cache and parse every document from scratch.",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Threads used to scan specs (default: 'jobs' in config.yml).",
+    ),
 ) -> None:
     """Mark the current phase's outputs as Accepted."""
     root = get_ana_speksi_root()
-    specs = list_ongoing_specs(root)
+    specs = list_ongoing_specs(
+        root, use_cache=not no_cache, jobs=jobs or get_jobs(root)
+    )
 
     if not specs:
         console.print("[yellow]No ongoing specs found.[/yellow]")
@@ -49,7 +63,7 @@ def accept_command(
         raise typer.Exit(1)
 
     if as_toon:
-        console.print(toons.dumps(acceptance))
+        print_toon(acceptance)
         return
 
     console.print(f"\n[bold]Spec: {spec.name}[/bold]")
@@ -73,10 +87,10 @@ def accept_command(
                 else "[yellow]no Draft status found[/yellow]"
             )
             console.print(f"  {f} -- {status}")
-        count_updates = update_index_task_counts(spec.path)
-        if count_updates:
+        count_sync = update_index_task_counts(spec.path, spec.stories)
+        if count_sync.updated:
             console.print("\nSynced task counts:")
-            for story, total, done in count_updates:
+            for story, total, done in count_sync.updated:
                 console.print(f"  {story}: {done}/{total}")
         console.print("\n[green]Acceptance complete.[/green]")
     else:
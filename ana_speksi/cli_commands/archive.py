@@ -0,0 +1,146 @@
+"""The ``archive`` sub-app: query archived specs through the archive index."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import typer
+
+from ana_speksi.archive_index import (
+    find_archived_spec,
+    load_archive_index,
+    search_archive,
+)
+from ana_speksi.cli_commands._helpers import console, print_toon
+from ana_speksi.config import get_jobs
+from ana_speksi.models import ARCHIVE_DIR, ArchivedSpec
+from ana_speksi.status import get_ana_speksi_root
+
+archive_app = typer.Typer(
+    name="as-archive",
+    help="Query archived specs.",
+    no_args_is_help=True,
+    add_completion=False,
+)
+
+_REBUILD_HELP = "Re-parse every archived spec instead of reusing the index."
+
+
+def _load(rebuild: bool) -> list[ArchivedSpec]:
+    root = get_ana_speksi_root()
+    return load_archive_index(root, rebuild=rebuild, jobs=get_jobs(root))
+
+
+def _row(spec: ArchivedSpec) -> dict:
+    """Compact listing row (no summary or truth documents)."""
+    return {
+        "folder": spec.folder,
+        "ticket": spec.ticket,
+        "archived": spec.archived,
+        "stories": len(spec.stories),
+        "tasks_done": spec.tasks_done,
+        "tasks_total": spec.tasks_total,
+    }
+
+
+def _print_rows(specs: list[ArchivedSpec], total: int) -> None:
+    if not specs:
+        console.print("[dim]No archived specs found.[/dim]")
+        return
+    for spec in specs:
+        console.print(
+            f"  {spec.archived or '----------'}  [bold cyan]{spec.name}[/bold cyan]"
+            f"  [dim]{len(spec.stories)} stories, "
+            f"{spec.tasks_done}/{spec.tasks_total} tasks[/dim]"
+        )
+    if total > len(specs):
+        console.print(f"[dim]... {total - len(specs)} more[/dim]")
+
+
+@archive_app.command("list")
+def archive_list(
+    limit: int = typer.Option(50, "--limit", help="Show at most this many specs (0 = all)."),
+    since: str = typer.Option(
+        None, "--since", help="Only specs archived on or after this date (yyyy-mm-dd)."
+    ),
+    rebuild: bool = typer.Option(False, "--rebuild", help=_REBUILD_HELP),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """List archived specs, newest first."""
+    specs = _load(rebuild)
+    if since:
+        specs = [s for s in specs if (s.archived or "") >= since]
+    shown = specs[:limit] if limit else specs
+
+    if as_toon:
+        print_toon({"total": len(specs), "archived": [_row(s) for s in shown]})
+        return
+    _print_rows(shown, len(specs))
+
+
+@archive_app.command("search")
+def archive_search(
+    query: str = typer.Argument(
+        ..., help="Terms matched against ticket, name, stories, truth documents and summary."
+    ),
+    limit: int = typer.Option(20, "--limit", help="Show at most this many matches (0 = all)."),
+    rebuild: bool = typer.Option(False, "--rebuild", help=_REBUILD_HELP),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Find archived specs, e.g. prior work on a ticket or truth document."""
+    results = search_archive(_load(rebuild), query)
+    shown = results[:limit] if limit else results
+
+    if as_toon:
+        print_toon(
+            {
+                "query": query,
+                "total": len(results),
+                "matches": [{"score": score, **_row(s)} for score, s in shown],
+            }
+        )
+        return
+    _print_rows([s for _, s in shown], len(results))
+
+
+@archive_app.command("show")
+def archive_show(
+    spec: str = typer.Argument(..., help="Archive folder, spec name or ticket ID."),
+    rebuild: bool = typer.Option(False, "--rebuild", help=_REBUILD_HELP),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Show the indexed details of one archived spec."""
+    matches = find_archived_spec(_load(rebuild), spec)
+    if not matches:
+        console.print(f"[red]Archived spec not found: {spec}[/red]")
+        raise typer.Exit(1)
+
+    if as_toon:
+        data = asdict(matches[0])
+        data["path"] = f"{ARCHIVE_DIR}/{matches[0].folder}"
+        if len(matches) > 1:
+            data["other_matches"] = [m.folder for m in matches[1:]]
+        print_toon(data)
+        return
+
+    for match in matches:
+        console.print(f"[bold cyan]{match.name}[/bold cyan]  [dim]{ARCHIVE_DIR}/{match.folder}[/dim]")
+        console.print(f"  Ticket: {match.ticket or '-'}")
+        console.print(f"  Created: {match.created or '-'}  Archived: {match.archived or '-'}")
+        console.print(f"  Tasks: {match.tasks_done}/{match.tasks_total}")
+        console.print(f"  Stories: {', '.join(match.stories) or '-'}")
+        console.print(f"  Truth documents: {', '.join(match.truth_docs) or '-'}")
+        if match.summary:
+            console.print(f"  {match.summary}")
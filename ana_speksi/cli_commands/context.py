@@ -0,0 +1,88 @@
+"""The ``context`` command."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import asdict
+
+import typer
+
+from ana_speksi.cli_commands._helpers import console, find_spec, print_toon
+from ana_speksi.config import get_jobs
+from ana_speksi.context_pack import build_context
+from ana_speksi.status import get_ana_speksi_root, list_ongoing_specs
+
+DEFAULT_BUDGET = 8000
+
+
+def context_command(
+    name: str = typer.Argument(
+        None,
+        help="Name of the spec (e.g. PROJ-123.add-user-auth).",
+    ),
+    story: str = typer.Option(
+        None,
+        "--story",
+        "-s",
+        help="Story folder (default: the first story with open tasks).",
+    ),
+    budget: int = typer.Option(
+        DEFAULT_BUDGET,
+        "--budget",
+        "-b",
+        min=1,
+        help="Approximate token budget of the bundle.",
+    ),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Bundle the next task, story specs and related truth within a token budget.
+
+    Replaces reading the story documents and truth files one by one: parts
+    are ranked (next task, functional spec, technical spec, data model, API
+    contract, linked truth, matching truth sections, open tasks, test plans)
+    and the bundle is cut off at the budget.
+    """
+    root = get_ana_speksi_root()
+    specs = list_ongoing_specs(root, jobs=get_jobs(root))
+    if not specs:
+        console.print("[yellow]No ongoing specs found.[/yellow]")
+        raise typer.Exit(1)
+    spec = find_spec(specs, name)
+
+    if story:
+        selected = next(
+            (s for s in spec.stories if s.folder == story or story in s.folder), None
+        )
+        if selected is None:
+            console.print(f"[red]Error: Story '{story}' not found in spec.[/red]")
+            raise typer.Exit(1)
+    else:
+        selected = next(
+            (s for s in spec.stories if s.has_tasks and s.tasks_done < s.tasks_total),
+            spec.stories[0] if spec.stories else None,
+        )
+        if selected is None:
+            console.print(f"[red]Error: Spec '{spec.name}' has no stories yet.[/red]")
+            raise typer.Exit(1)
+
+    bundle = build_context(root, spec.path, selected.folder, budget)
+
+    if as_toon:
+        print_toon(asdict(bundle))
+        return
+
+    out = sys.stdout
+    for part in bundle.parts:
+        cut = ", truncated" if part.truncated else ""
+        out.write(f"<!-- {part.path} > {part.heading or '(top)'}{cut} -->\n\n{part.text}\n\n")
+    for entry in bundle.omitted:
+        out.write(
+            f"<!-- omitted: {entry['path']} ({entry['sections']} sections, "
+            f"~{entry['approx_tokens']} tokens) -->\n"
+        )
+    out.write(f"<!-- ~{bundle.approx_tokens} of {bundle.budget} tokens -->\n")
+    out.flush()
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import toons
 import typer
 
-from ana_speksi.cli_commands._helpers import console, find_spec
+from ana_speksi.cli_commands._helpers import console, find_spec, print_toon
+from ana_speksi.config import get_jobs
 from ana_speksi.acceptance import get_acceptance_status
 from ana_speksi.models import PHASE_DESCRIPTIONS
 from ana_speksi.skill_generator import phase_to_skill
@@ -27,10 +27,24 @@ def continue_command(
         "--toon",
         help="Output status as TOON (token-friendly format for AI agents).",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the status cache and parse every document from scratch.",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Threads used to scan specs (default: 'jobs' in config.yml).",
+    ),
 ) -> None:
     """Continue working on a spec by advancing to the next phase."""
     root = get_ana_speksi_root()
-    specs = list_ongoing_specs(root)
+    specs = list_ongoing_specs(
+        root, use_cache=not no_cache, jobs=jobs or get_jobs(root)
+    )
 
     if not specs:
         console.print("[yellow]No ongoing specs found. Run as-new first.[/yellow]")
@@ -41,7 +55,7 @@ def continue_command(
     acceptance = get_acceptance_status(spec)
 
     if as_toon:
-        data = print_status_json(root)
+        data = print_status_json(root, specs)
         for s in data["ongoing"]:
             if s["name"] == spec.name:
                 s["next_phase"] = spec.phase.value
@@ -55,7 +69,7 @@ def continue_command(
                     "already_accepted": acceptance["already_accepted"],
                 }
                 break
-        console.print(toons.dumps(data))
+        print_toon(data)
         return
 
     if acceptance["files_to_accept"]:
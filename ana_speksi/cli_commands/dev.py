@@ -0,0 +1,81 @@
+"""The ``dev`` sub-app: tools for developing and benchmarking ana-speksi."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from ana_speksi.cli_commands._helpers import console, print_toon
+from ana_speksi.workspace_generator import MAX_TRUTH_BREADTH, generate_workspace
+
+dev_app = typer.Typer(
+    name="as-dev",
+    help="Tools for developing and benchmarking ana-speksi.",
+    no_args_is_help=True,
+    add_completion=False,
+)
+
+
+@dev_app.command("generate-workspace")
+def generate_workspace_command(
+    target: Path = typer.Argument(
+        ...,
+        help="Directory to create the ana-speksi/ folder in.",
+    ),
+    specs: int = typer.Option(20, "--specs", min=0, help="Number of ongoing specs."),
+    stories: int = typer.Option(4, "--stories", min=1, help="Stories per spec."),
+    tasks: int = typer.Option(20, "--tasks", min=1, help="Tasks per story."),
+    archived: int = typer.Option(50, "--archived", min=0, help="Number of archived specs."),
+    truth_depth: int = typer.Option(
+        4, "--truth-depth", min=1, help="Levels of truth/ features."
+    ),
+    truth_breadth: int = typer.Option(
+        4,
+        "--truth-breadth",
+        min=1,
+        max=MAX_TRUTH_BREADTH,
+        clamp=True,
+        help=f"Features per truth/ level (at most; up to {MAX_TRUTH_BREADTH}).",
+    ),
+    seed: int = typer.Option(0, "--seed", help="Seed; equal seeds give identical files."),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Generate a deterministic synthetic workspace for benchmarks."""
+    try:
+        result = generate_workspace(
+            target,
+            specs=specs,
+            stories=stories,
+            tasks=tasks,
+            archived=archived,
+            truth_depth=truth_depth,
+            truth_breadth=truth_breadth,
+            seed=seed,
+        )
+    except FileExistsError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+
+    if as_toon:
+        print_toon(
+            {
+                "root": str(result.root),
+                "files": result.files,
+                "ongoing": [
+                    {"name": name, "phase": phase.value}
+                    for name, phase in result.phases.items()
+                ],
+                "archived": len(result.archived),
+            }
+        )
+        return
+
+    console.print(f"Generated [bold cyan]{result.root}[/bold cyan]")
+    console.print(f"  Ongoing specs: {len(result.phases)}")
+    console.print(f"  Archived specs: {len(result.archived)}")
+    console.print(f"  Files: {result.files}")
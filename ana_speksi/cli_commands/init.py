@@ -85,6 +85,10 @@ auto_confirm: false
 # the codify phase without asking for confirmation between stories.
 auto_story_implementation_continue: false
 
+# Threads used by the CLI to scan ongoing specs (default 1). Raise it on
+# network-mounted checkouts or cold CI containers.
+# jobs: 8
+
 # Project context injected into all skill instructions.
 # Helps the AI understand your project's conventions.
 context: |
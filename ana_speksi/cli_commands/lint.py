@@ -0,0 +1,56 @@
+"""The ``lint`` command."""
+
+from __future__ import annotations
+
+import typer
+
+from ana_speksi.cli_commands._helpers import console, print_toon
+from ana_speksi.documents import find_status_outside_header
+from ana_speksi.fsutil import read_text
+from ana_speksi.models import ONGOING_DIR
+from ana_speksi.status import get_ana_speksi_root
+
+
+def lint_command(
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Check ongoing spec documents for structural problems.
+
+    Currently reports documents whose **Status** line sits below the header
+    block, where status detection does not look for it.  Exits with code 1
+    when problems are found.
+    """
+    root = get_ana_speksi_root()
+    ongoing = root / ONGOING_DIR
+
+    problems: list[dict] = []
+    if ongoing.exists():
+        for doc in sorted(ongoing.rglob("*.md")):
+            line = find_status_outside_header(read_text(doc))
+            if line is not None:
+                problems.append(
+                    {
+                        "file": str(doc.relative_to(root)),
+                        "line": line,
+                        "check": "status-outside-header",
+                    }
+                )
+
+    if as_toon:
+        print_toon({"problems": problems})
+    elif problems:
+        console.print(f"[red]{len(problems)} problem(s) found:[/red]")
+        for p in problems:
+            console.print(
+                f"  {p['file']}:{p['line']} -- **Status** line is outside the "
+                "document header; move it up next to the other header fields."
+            )
+    else:
+        console.print("[green]No problems found.[/green]")
+
+    if problems:
+        raise typer.Exit(1)
@@ -0,0 +1,56 @@
+"""The ``serve`` command."""
+
+from __future__ import annotations
+
+import typer
+
+from ana_speksi.cli_commands._helpers import console, err_console
+from ana_speksi.daemon import serve_socket, serve_stdio, socket_path, stop
+from ana_speksi.status import get_ana_speksi_root
+
+
+def serve_command(
+    stdio: bool = typer.Option(
+        False,
+        "--stdio",
+        help="Serve JSON-RPC on stdin/stdout instead of a unix socket.",
+    ),
+    stop_daemon: bool = typer.Option(
+        False, "--stop", help="Stop the daemon serving this project."
+    ),
+) -> None:
+    """Run a long-lived daemon that answers CLI commands from a warm cache.
+
+    While it runs, status, accept, continue, sync-counts, what-to-code-next
+    and lint invocations from scripts and agents (non-interactive stdout)
+    are forwarded to it automatically.  Set ANA_SPEKSI_NO_DAEMON=1 to opt
+    out.  With --stdio, a client keeps one pipe open and sends
+    newline-delimited JSON-RPC requests such as
+    {"jsonrpc": "2.0", "id": 1, "method": "run", "params": {"argv": ["status", "--toon"]}}.
+    """
+    root = get_ana_speksi_root()
+    if stop_daemon:
+        if stop(root):
+            console.print("[green]Daemon stopped.[/green]")
+        else:
+            console.print("[yellow]No daemon is running for this project.[/yellow]")
+        return
+
+    if stdio:
+        serve_stdio(root)
+        return
+
+    if not root.is_dir():
+        console.print(f"[red]ana-speksi is not initialized here: {root}[/red]")
+        raise typer.Exit(1)
+    err_console.print(
+        f"Serving [cyan]{root}[/cyan] on [cyan]{socket_path(root)}[/cyan]. "
+        "Press Ctrl+C to stop."
+    )
+    try:
+        serve_socket(root)
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
@@ -2,25 +2,117 @@
 
 from __future__ import annotations
 
-import toons
+import sys
+from datetime import datetime
+
 import typer
 
-from ana_speksi.cli_commands._helpers import console
-from ana_speksi.status import get_ana_speksi_root, print_status, print_status_json
+from ana_speksi import iostats
+from ana_speksi.cache import FileCache
+from ana_speksi.cli_commands._helpers import console, err_console, print_json, print_toon
+from ana_speksi.config import get_jobs
+from ana_speksi.models import ONGOING_DIR
+from ana_speksi.status import (
+    STATUS_CACHE,
+    get_ana_speksi_root,
+    list_ongoing_specs,
+    print_status,
+    print_status_json,
+    spec_to_dict,
+)
 
 
 def status_command(
     as_toon: bool = typer.Option(False, "--toon", help="Output as TOON."),
+    as_json: bool = typer.Option(False, "--json", help="Output as JSON."),
     name: str = typer.Option(
         None, "--name", "-n", help="Show status for a specific spec."
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the status cache and parse every document from scratch.",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Threads used to scan specs (default: 'jobs' in config.yml).",
+    ),
+    debug: bool = typer.Option(
+        False, "--debug", help="Print I/O counters of the scan to stderr."
+    ),
+    watch: bool = typer.Option(
+        False,
+        "--watch",
+        "-w",
+        help="Keep running and update the output whenever a spec file changes. "
+        "Also keeps index.md task counts in sync.",
+    ),
+    poll: bool = typer.Option(
+        False, "--poll", help="With --watch, poll instead of using inotify."
+    ),
+    interval: float = typer.Option(
+        0.5, "--interval", help="With --watch --poll, seconds between polls."
+    ),
 ) -> None:
     """Show the current status of all ongoing specs."""
     root = get_ana_speksi_root()
-    if as_toon:
-        data = print_status_json(root)
+    if watch:
+        _watch(root, as_toon, as_json, name, no_cache, poll, interval)
+        return
+    specs = list_ongoing_specs(
+        root, use_cache=not no_cache, jobs=jobs or get_jobs(root)
+    )
+    if as_toon or as_json:
         if name:
-            data["ongoing"] = [s for s in data["ongoing"] if s["name"] == name]
-        console.print(toons.dumps(data))
+            specs = [s for s in specs if s.name == name]
+        data = print_status_json(root, specs)
+        if as_json:
+            print_json(data)
+        else:
+            print_toon(data)
     else:
-        print_status(root)
+        print_status(root, specs)
+    if debug:
+        err_console.print(f"[dim]io: {iostats.format_counters(iostats.snapshot())}[/dim]")
+
+
+def _watch(root, as_toon, as_json, name, no_cache, poll, interval) -> None:
+    """Run ``status --watch``: redraw the table or emit one record per change."""
+    from ana_speksi.watch import watch_status
+
+    if not (root / ONGOING_DIR).is_dir():
+        console.print("[yellow]No ongoing specs found.[/yellow]")
+        raise typer.Exit(1)
+
+    def on_change(model, changed, removed) -> None:
+        if as_toon or as_json:
+            data = {
+                "ongoing": [
+                    spec_to_dict(s) for s in changed if not name or s.name == name
+                ],
+                "removed": [r for r in removed if not name or r == name],
+            }
+            if not data["ongoing"] and not data["removed"]:
+                return
+            if as_json:
+                print_json(data, indent=None)
+            else:
+                print_toon(data)
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+            return
+        specs = model.sorted_specs()
+        if name:
+            specs = [s for s in specs if s.name == name]
+        console.clear()
+        print_status(root, specs)
+        console.print(
+            f"\n[dim]Watching {root / ONGOING_DIR} -- updated "
+            f"{datetime.now():%H:%M:%S}. Press Ctrl+C to stop.[/dim]"
+        )
+
+    cache = None if no_cache else FileCache.load(root, STATUS_CACHE)
+    watch_status(root, on_change, cache, poll, interval)
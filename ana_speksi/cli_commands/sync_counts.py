@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import toons
 import typer
 
-from ana_speksi.cli_commands._helpers import console
+from ana_speksi.cli_commands._helpers import console, print_toon
+from ana_speksi.config import get_jobs
 from ana_speksi.status import (
     get_ana_speksi_root,
     list_ongoing_specs,
@@ -23,10 +23,24 @@ def sync_counts_command(
         "--toon",
         help="Output as TOON (token-friendly format for AI agents).",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the status cache and parse every document from scratch.",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Threads used to scan specs (default: 'jobs' in config.yml).",
+    ),
 ) -> None:
     """Update task counts in index.md by reading actual tasks.md files."""
     root = get_ana_speksi_root()
-    specs = list_ongoing_specs(root)
+    specs = list_ongoing_specs(
+        root, use_cache=not no_cache, jobs=jobs or get_jobs(root)
+    )
 
     if not specs:
         console.print("[yellow]No ongoing specs found.[/yellow]")
@@ -41,8 +55,10 @@ def sync_counts_command(
 
     results = []
     for spec in targets:
-        updated = update_index_task_counts(spec.path)
-        results.append({"spec": spec.name, "updated": updated})
+        sync = update_index_task_counts(spec.path, spec.stories)
+        results.append(
+            {"spec": spec.name, "updated": sync.updated, "missing": sync.missing}
+        )
 
     if as_toon:
         toon_data = []
@@ -54,9 +70,10 @@ def sync_counts_command(
                         {"story": s, "total": t, "done": d}
                         for s, t, d in r["updated"]
                     ],
+                    "missing_index_lines": r["missing"],
                 }
             )
-        console.print(toons.dumps({"synced": toon_data}))
+        print_toon({"synced": toon_data})
     else:
         for r in results:
             console.print(f"\n[bold]{r['spec']}[/bold]")
@@ -65,3 +82,7 @@ def sync_counts_command(
                     console.print(f"  {story}: {done}/{total} tasks complete")
             else:
                 console.print("  [dim]No changes needed.[/dim]")
+            for story in r["missing"]:
+                console.print(
+                    f"  [yellow]{story}: no tasks.md count line in index.md[/yellow]"
+                )
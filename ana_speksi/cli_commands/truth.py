@@ -2,33 +2,395 @@
 
 from __future__ import annotations
 
+import itertools
+import posixpath
+from dataclasses import asdict
+
 import typer
-from rich.tree import Tree
 
-from ana_speksi.cli_commands._helpers import console
+from ana_speksi.cli_commands._helpers import console, print_toon
 from ana_speksi.models import TRUTH_DIR
-from ana_speksi.status import build_truth_tree, get_ana_speksi_root
+from ana_speksi.status import get_ana_speksi_root, iter_truth_tree
 
 truth_app = typer.Typer(
     name="as-truth",
     help="Manage the ground truth hierarchy.",
     no_args_is_help=True,
+    add_completion=False,
 )
 
 
 @truth_app.command("show")
-def truth_show() -> None:
-    """Display the current ground truth hierarchy."""
+def truth_show(
+    path: str = typer.Argument(
+        "", help="Only show paths under truth/ starting with this prefix."
+    ),
+    depth: int = typer.Option(
+        None,
+        "--depth",
+        min=0,
+        help="Levels to expand; deeper directories show counts only.",
+    ),
+    glob: str = typer.Option(
+        None, "--glob", help="Only show files matching this pattern (e.g. '*-spec.md')."
+    ),
+    max_entries: int = typer.Option(
+        0,
+        "--max-entries",
+        min=0,
+        help="Entries shown per directory before the rest is counted (default 0 = all).",
+    ),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Display the current ground truth hierarchy.
+
+    Rows are printed while the directories are walked, so the start of a
+    large hierarchy appears immediately.
+    """
     root = get_ana_speksi_root()
     truth_dir = root / TRUTH_DIR
+    rows = iter_truth_tree(
+        truth_dir,
+        prefix=path,
+        max_depth=depth,
+        glob=glob,
+        max_entries=max_entries or None,
+    )
+
+    if as_toon:
+        print_toon({"root": f"{TRUTH_DIR}/", "entries": [asdict(r) for r in rows]})
+        return
+
+    first = next(rows, None)
+    if first is None:
+        if path or glob:
+            console.print("[dim]No matching ground truth documents.[/dim]")
+        else:
+            console.print(
+                "[dim]Ground truth is empty. "
+                "Run as-docufy or as-from-changes to populate it.[/dim]"
+            )
+        return
+
+    console.print("[bold]ana-speksi/truth/[/bold]")
+    for row in itertools.chain([first], rows):
+        indent = "  " * (row.depth + 1)
+        name = row.path.rsplit("/", 1)[-1]
+        if row.kind == "file":
+            console.print(f"{indent}{name}", markup=False, highlight=False)
+        elif row.kind == "dir":
+            console.print(f"{indent}[bold]{name}/[/bold]", highlight=False)
+        elif row.kind == "collapsed":
+            console.print(
+                f"{indent}[bold]{name}/[/bold] [dim]({_counts(row.files, row.dirs)})[/dim]",
+                highlight=False,
+            )
+        else:
+            console.print(
+                f"{indent}[dim]... {_counts(row.files, row.dirs)} more[/dim]", highlight=False
+            )
+
+
+def _counts(files: int, dirs: int) -> str:
+    parts = [f"{files} file{'s' if files != 1 else ''}"]
+    if dirs:
+        parts.append(f"{dirs} dir{'s' if dirs != 1 else ''}")
+    return ", ".join(parts)
+
+
+@truth_app.command("search")
+def truth_search(
+    query: str = typer.Argument(..., help="Words to look for."),
+    limit: int = typer.Option(5, "--limit", help="Number of sections to return."),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Search the ground truth; returns the best matching sections (BM25)."""
+    from ana_speksi.truth_index import search_truth
+
+    hits = search_truth(get_ana_speksi_root(), query, limit)
+
+    if as_toon:
+        print_toon({"query": query, "results": [asdict(h) for h in hits]})
+        return
+    if not hits:
+        console.print("[dim]No matches.[/dim]")
+        return
+    for hit in hits:
+        console.print(
+            f"[bold cyan]{hit.file}[/bold cyan]:{hit.line}  "
+            f"[bold]{hit.heading or '(top)'}[/bold]  [dim]{hit.score}[/dim]"
+        )
+        if hit.snippet:
+            console.print(f"  {hit.snippet}", markup=False)
+
+
+def _doc_path(root_relative: str, known: set[str]) -> str:
+    """Accept document paths relative to ana-speksi/ or to truth/."""
+    path = root_relative.strip("/")
+    if path not in known and f"{TRUTH_DIR}/{path}" in known:
+        return f"{TRUTH_DIR}/{path}"
+    return path
+
+
+@truth_app.command("links")
+def truth_links(
+    document: str = typer.Argument(
+        "",
+        help=(
+            "Document to show inbound and outbound links for (relative to "
+            "ana-speksi/ or truth/).  With --check, a path prefix to check."
+        ),
+    ),
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Report broken links and exit with code 1 if there are any.",
+    ),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Show the links of a document, or all broken links.
 
-    if not truth_dir.exists() or not any(truth_dir.iterdir()):
+    Covers relative links in every markdown file under ana-speksi/.  Suited
+    to a pre-commit hook: ``ana-speksi truth links --check``.
+    """
+    from ana_speksi.links import build_link_graph
+
+    prefix = document if check else ""
+    graph = build_link_graph(get_ana_speksi_root(), prefix)
+
+    if document and not check:
+        doc = _doc_path(document, graph.documents)
+        if doc not in graph.documents:
+            console.print(f"[red]Document not found: {document}[/red]")
+            raise typer.Exit(1)
+        outbound = graph.outbound.get(doc, [])
+        inbound = [l for l in graph.inbound.get(doc, []) if l.source != doc]
+        if as_toon:
+            print_toon(
+                {
+                    "document": doc,
+                    "outbound": [
+                        {"target": l.target, "line": l.line, "broken": l.broken} for l in outbound
+                    ],
+                    "inbound": [{"source": l.source, "line": l.line} for l in inbound],
+                }
+            )
+            return
+        console.print(f"[bold cyan]{doc}[/bold cyan]")
+        console.print(f"  Outbound ({len(outbound)}):")
+        for l in outbound:
+            mark = " [red](broken)[/red]" if l.broken else ""
+            console.print(f"    {l.line}: {l.target}{mark}", highlight=False)
+        console.print(f"  Inbound ({len(inbound)}):")
+        for l in inbound:
+            console.print(f"    {l.source}:{l.line}", highlight=False)
+        return
+
+    broken = graph.broken()
+    if as_toon:
+        print_toon(
+            {
+                "documents": len(graph.documents),
+                "links": len(graph.links),
+                "broken": [{"source": l.source, "line": l.line, "target": l.target} for l in broken],
+            }
+        )
+    elif broken:
+        console.print(f"[red]{len(broken)} broken link(s):[/red]")
+        for l in broken:
+            console.print(f"  {l.source}:{l.line} -> {l.target}", highlight=False)
+    else:
         console.print(
-            "[dim]Ground truth is empty. "
-            "Run as-docufy or as-from-changes to populate it.[/dim]"
+            f"[green]No broken links[/green] [dim]({len(graph.documents)} documents)[/dim]"
+        )
+
+    if check and broken:
+        raise typer.Exit(1)
+
+
+@truth_app.command("orphans")
+def truth_orphans(
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """List truth documents that no other document links to."""
+    from ana_speksi.links import build_link_graph
+
+    orphans = build_link_graph(get_ana_speksi_root()).orphans()
+
+    if as_toon:
+        print_toon({"orphans": orphans})
+    elif orphans:
+        console.print(f"{len(orphans)} truth document(s) without inbound links:")
+        for doc in orphans:
+            console.print(f"  {doc}", highlight=False)
+    else:
+        console.print("[green]Every truth document is linked.[/green]")
+
+
+@truth_app.command("manifest")
+def truth_manifest(
+    since: str = typer.Option(
+        None,
+        "--since",
+        help="Manifest hash from an earlier call; only changed entries are listed.",
+    ),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """List truth files with content hash, size, approximate tokens and headings.
+
+    Keep the returned manifest hash and pass it to --since next time: only
+    documents that were added or changed since then are listed, so unchanged
+    ones need not be read again.
+    """
+    from ana_speksi.truth_manifest import (
+        build_manifest,
+        load_snapshot,
+        manifest_delta,
+        manifest_hash,
+        save_snapshot,
+    )
+
+    root = get_ana_speksi_root()
+    entries = build_manifest(root)
+    digest = manifest_hash(entries)
+    save_snapshot(root, digest, entries)
+
+    data: dict = {"manifest": digest, "files": len(entries)}
+    if since:
+        previous = load_snapshot(root, since)
+        data["since"] = since
+        data["since_found"] = previous is not None
+        if previous is not None:
+            entries, removed = manifest_delta(entries, previous)
+            data["removed"] = removed
+    else:
+        data["approx_tokens"] = sum(e["approx_tokens"] for e in entries)
+    data["entries"] = entries
+
+    if as_toon:
+        print_toon(data)
+        return
+
+    console.print(
+        f"Manifest [bold cyan]{digest}[/bold cyan] ({len(entries)} of {data['files']} files)"
+    )
+    if since and not data["since_found"]:
+        console.print(f"[yellow]Unknown manifest {since}; listing every file.[/yellow]")
+    for e in entries:
+        console.print(
+            f"  {e['hash']}  {e['approx_tokens']:>7} tok  {e['path']}", highlight=False
+        )
+    for path in data.get("removed", []):
+        console.print(f"  [red]removed[/red]  {path}", highlight=False)
+
+
+def _truth_path(path: str) -> str | None:
+    """Normalise a path given relative to truth/ or to ana-speksi/.
+
+    Returns None for a path that resolves outside truth/.
+    """
+    path = path.replace("\\", "/").strip("/")
+    if path != TRUTH_DIR and not path.startswith(f"{TRUTH_DIR}/"):
+        path = f"{TRUTH_DIR}/{path}"
+    path = posixpath.normpath(path)
+    if path == TRUTH_DIR or path.startswith(f"{TRUTH_DIR}/"):
+        return path
+    return None
+
+
+@truth_app.command("mv")
+def truth_mv(
+    src: str = typer.Argument(..., help="Truth file or directory to move."),
+    dst: str = typer.Argument(..., help="New path (an existing directory moves src into it)."),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Only print the planned move and link edits."
+    ),
+    as_toon: bool = typer.Option(
+        False,
+        "--toon",
+        help="Output as TOON (token-friendly format for AI agents).",
+    ),
+) -> None:
+    """Move a truth file or directory and rewrite every link to it.
+
+    Relative links across ana-speksi/ (truth, ongoing, archive, ...) that
+    point into the moved path are rewritten, as are the moved documents'
+    own links to the rest of the tree.  Each file is written once,
+    atomically, before the move.
+    """
+    import shutil
+
+    from ana_speksi.fsutil import atomic_write_bytes
+    from ana_speksi.links import build_link_graph, plan_move
+
+    root = get_ana_speksi_root()
+    src_rel, dst_rel = _truth_path(src), _truth_path(dst)
+    for given, rel in ((src, src_rel), (dst, dst_rel)):
+        if rel is None:
+            console.print(f"[red]Path is outside truth/: {given}[/red]")
+            raise typer.Exit(1)
+    if src_rel == TRUTH_DIR or not (root / src_rel).exists():
+        console.print(f"[red]Not found in truth/: {src}[/red]")
+        raise typer.Exit(1)
+    if (root / dst_rel).is_dir():
+        dst_rel = f"{dst_rel}/{posixpath.basename(src_rel)}"
+    if (root / dst_rel).exists():
+        console.print(f"[red]Already exists: {dst_rel}[/red]")
+        raise typer.Exit(1)
+    if dst_rel == src_rel or dst_rel.startswith(f"{src_rel}/"):
+        console.print(f"[red]Cannot move {src_rel} into itself.[/red]")
+        raise typer.Exit(1)
+
+    try:
+        plan = plan_move(root, build_link_graph(root), src_rel, dst_rel)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(1)
+    edits = [edit for _, file_edits in plan.values() for edit in file_edits]
+
+    if not dry_run:
+        for file, (content, _) in plan.items():
+            atomic_write_bytes(root / file, content)
+        (root / dst_rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(root / src_rel), str(root / dst_rel))
+
+    if as_toon:
+        print_toon(
+            {
+                "from": src_rel,
+                "to": dst_rel,
+                "dry_run": dry_run,
+                "files_changed": len(plan),
+                "edits": [asdict(e) for e in edits],
+            }
         )
         return
 
-    tree = Tree("[bold]ana-speksi/truth/[/bold]")
-    build_truth_tree(truth_dir, tree)
-    console.print(tree)
+    verb = "Would move" if dry_run else "Moved"
+    console.print(f"{verb} [bold cyan]{src_rel}[/bold cyan] -> [bold cyan]{dst_rel}[/bold cyan]")
+    for e in edits:
+        console.print(f"  {e.file}:{e.line}  {e.old} -> {e.new}", markup=False, highlight=False)
+    console.print(
+        f"[dim]{len(edits)} link(s) in {len(plan)} file(s) "
+        f"{'to rewrite' if dry_run else 'rewritten'}[/dim]"
+    )
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import toons
 import typer
 
-from ana_speksi.cli_commands._helpers import console
+from ana_speksi.cache import FileCache
+from ana_speksi.cli_commands._helpers import console, print_toon
+from ana_speksi.config import get_jobs
+from ana_speksi.fsutil import read_text
 from ana_speksi.status import (
+    STATUS_CACHE,
     extract_next_task,
     get_ana_speksi_root,
-    get_spec_status,
     list_story_files,
+    scan_specs,
 )
 
 
@@ -26,6 +29,18 @@ def what_to_code_next_command(
         help="Specific story folder to analyze.",
     ),
     as_toon: bool = typer.Option(False, "--toon", help="Output as TOON."),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the status cache and parse every document from scratch.",
+    ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Threads used to scan specs (default: 'jobs' in config.yml).",
+    ),
 ) -> None:
     """Determine the next task to implement in a spec during codify phase."""
     root = get_ana_speksi_root()
@@ -60,7 +75,10 @@ def what_to_code_next_command(
             return
         spec_path = specs_list[0]
 
-    spec_status = get_spec_status(spec_path)
+    cache = None if no_cache else FileCache.load(root, STATUS_CACHE)
+    spec_status = scan_specs([spec_path], cache, jobs or get_jobs(root))[0]
+    if cache is not None:
+        cache.save(prune=False)
 
     story_status = None
     if story:
@@ -94,7 +112,7 @@ def what_to_code_next_command(
         )
         return
 
-    content = tasks_file.read_text(encoding="utf-8")
+    content = read_text(tasks_file)
     next_task_info = extract_next_task(content)
 
     story_dir = spec_path / "specs" / story_status.folder
@@ -109,7 +127,7 @@ def what_to_code_next_command(
             "next_task": next_task_info,
             "story_files": story_files_info,
         }
-        console.print(toons.dumps(output))
+        print_toon(output)
     else:
         console.print(f"\n[bold]Spec:[/bold] {spec_status.name}")
         console.print(f"[bold]Story:[/bold] {story_status.folder}")
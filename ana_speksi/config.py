@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any
 
+from ana_speksi.cache import FileCache
+from ana_speksi.fsutil import read_text
 from ana_speksi.status import get_ana_speksi_root
 
+# Scanning is serial unless configured: on local disks with a warm page cache
+# threads only add overhead, on network mounts they hide per-file latency.
+DEFAULT_JOBS = 1
+
+CONFIG_CACHE = "config.json"
+
 
 # ---------------------------------------------------------------------------
 # Project config (ana-speksi/config.yml)
@@ -17,20 +26,41 @@ def load_config(root: Path | None = None) -> dict[str, Any]:
     """Load ana-speksi/config.yml and return its contents.
 
     Returns an empty dict if the file does not exist or cannot be parsed.
+    The parsed config is cached by stat key, so unless config.yml changed
+    yaml is not even imported.  Only a config that survives a JSON
+    round-trip unchanged is cached, so a warm run sees exactly what a cold
+    run parses.
     """
     if root is None:
         root = get_ana_speksi_root()
 
     config_path = root / "config.yml"
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return {}
 
+    cache = FileCache.load(root, CONFIG_CACHE)
+    facts = cache.get(config_path, st)
+    if facts is not None:
+        return facts["config"]
+
     try:
         import yaml
 
-        return yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        config = yaml.safe_load(read_text(config_path)) or {}
     except Exception:
         return {}
+    try:
+        cacheable = json.loads(json.dumps(config)) == config
+    except (TypeError, ValueError):
+        cacheable = False
+    if not cacheable:
+        # e.g. YAML dates, int keys or NaN; still usable, just not cacheable
+        return config
+    cache.put(config_path, st, {"config": config})
+    cache.save()
+    return config
 
 
 def get_auto_confirm(root: Path | None = None) -> bool:
@@ -45,6 +75,15 @@ def get_auto_story_implementation_continue(root: Path | None = None) -> bool:
     return bool(cfg.get("auto_story_implementation_continue", False))
 
 
+def get_jobs(root: Path | None = None) -> int:
+    """Return the jobs setting (scanner threads) from ana-speksi/config.yml."""
+    cfg = load_config(root)
+    try:
+        return max(1, int(cfg.get("jobs", DEFAULT_JOBS)))
+    except (TypeError, ValueError):
+        return DEFAULT_JOBS
+
+
 def get_context(config: dict[str, Any]) -> str | None:
     """Return the project context string from config, or None."""
     ctx = config.get("context")
@@ -0,0 +1,30 @@
+"""Shared rich consoles, created on first use.
+
+Importing rich costs tens of milliseconds, which is most of the start-up
+time of commands that only print TOON.  The consoles here look like
+``rich.console.Console`` instances but only import rich when something is
+actually printed through them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class LazyConsole:
+    """Proxy that creates a ``rich.console.Console`` on first attribute access."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs = kwargs
+        self._console = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return getattr(self._console, name)
+
+
+console = LazyConsole()
+err_console = LazyConsole(stderr=True)
@@ -0,0 +1,248 @@
+"""Token-budgeted context bundle for working on one story.
+
+Instead of reading every story document one by one, an agent asks for a
+bundle: the next open task, the story's specs split into sections, the truth
+documents the story links to and the truth sections that best match the
+story (BM25, see ``truth_index``).  Parts are taken in that order of
+relevance until the token budget is spent; the part that crosses the budget
+is cut at a line boundary and everything after it is listed as omitted.
+
+Bundles are cached in ``.cache/context.json`` under a key derived from the
+request, the content of the story documents and the content hash of the
+truth index, so any change to truth/ -- also to documents that only might
+rank as search hits -- builds a new bundle.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from ana_speksi.cache import get_cache_dir
+from ana_speksi.documents import parse_doc_header
+from ana_speksi.fsutil import atomic_write_text, read_text
+from ana_speksi.links import extract_links, resolve_link
+from ana_speksi.models import CACHE_DIR, TRUTH_DIR
+from ana_speksi.profiling import traced
+from ana_speksi.tasks import parse_tasks
+from ana_speksi.tokens import approx_tokens
+from ana_speksi.truth_index import TruthIndex, split_sections
+
+CONTEXT_CACHE = "context.json"
+
+# Bump when the bundle layout or ranking changes.
+CONTEXT_CACHE_VERSION = 2
+
+MAX_CACHED_BUNDLES = 32
+
+# Story documents in order of relevance; tasks.md is handled separately.
+STORY_DOCS = ("functional-spec.md", "technical-spec.md", "data-model.md", "api-contract.md")
+TEST_DOCS = ("test-automation-plan.md", "manual-testing-plan.md")
+
+# Truth sections found by search, after the linked truth documents
+SEARCH_HITS = 3
+
+# A part is only cut to fit when at least this many tokens are left
+MIN_PART_TOKENS = 40
+
+_COMMENT_RE = re.compile(r"<!--.*?-->\s*", re.DOTALL)
+
+
+@dataclass
+class ContextPart:
+    """One section of a document included in the bundle."""
+
+    path: str
+    heading: str
+    text: str
+    approx_tokens: int = 0
+    truncated: bool = False
+
+
+@dataclass
+class ContextBundle:
+    """The parts selected for a story within a token budget."""
+
+    spec: str
+    story: str
+    budget: int
+    approx_tokens: int = 0
+    parts: list[ContextPart] = field(default_factory=list)
+    # Sections that did not fit completely, summed per document
+    omitted: list[dict] = field(default_factory=list)
+    cached: bool = False
+
+
+def _sections(path: str, content: str) -> list[ContextPart]:
+    """Split a document into parts, dropping HTML comments and empty sections."""
+    parts = []
+    for heading, _, text in split_sections(_COMMENT_RE.sub("", content)):
+        text = text.strip()
+        if text and text.lstrip("#").strip() != heading:
+            parts.append(ContextPart(path, heading, text))
+    return parts
+
+
+def _task_parts(path: str, content: str) -> tuple[list[ContextPart], list[ContextPart]]:
+    """Return ([next task], [remaining open tasks]) parts from tasks.md."""
+    index = parse_tasks(content)
+    task = index.next_open()
+    if task is None:
+        return [], []
+    lines = [f"- [ ] {task.text}"]
+    if task.details:
+        lines += ["", "### Details", "", task.details]
+    if task.context:
+        lines += ["", "### Implementation Context", "", task.context]
+    first = [ContextPart(path, "Next task", "\n".join(lines))]
+    rest = [f"- [ ] {t.text}" for t in index.tasks if not t.checked and t is not task]
+    return first, [ContextPart(path, "Open tasks", "\n".join(rest))] if rest else []
+
+
+def _story_query(story_folder: str, functional: str | None) -> str:
+    """Search terms describing the story: its folder name and spec title."""
+    words = re.sub(r"^\d+-", "", story_folder).replace("-", " ")
+    title = parse_doc_header(functional).title if functional else None
+    if title:
+        words += " " + title.split(":", 1)[-1]
+    return words
+
+
+def _fit(part: ContextPart, tokens: int) -> ContextPart:
+    """Cut ``part`` at a line boundary to at most ``tokens`` tokens."""
+    kept, used = [], 0
+    for line in part.text.split("\n"):
+        cost = approx_tokens(line) + 1
+        if used + cost > tokens:
+            break
+        kept.append(line)
+        used += cost
+    return ContextPart(part.path, part.heading, "\n".join(kept), used, truncated=True)
+
+
+def pack(bundle: ContextBundle, candidates: list[ContextPart]) -> None:
+    """Fill ``bundle`` with candidates in order until the budget is spent."""
+    left = bundle.budget
+    omitted: dict[str, dict] = {}
+    for part in candidates:
+        part.approx_tokens = approx_tokens(part.text)
+        if part.approx_tokens <= left:
+            bundle.parts.append(part)
+            left -= part.approx_tokens
+            continue
+        if left >= MIN_PART_TOKENS:
+            cut = _fit(part, left)
+            if cut.text:
+                bundle.parts.append(cut)
+                left -= cut.approx_tokens
+        entry = omitted.setdefault(
+            part.path, {"path": part.path, "sections": 0, "approx_tokens": 0}
+        )
+        entry["sections"] += 1
+        entry["approx_tokens"] += part.approx_tokens
+    bundle.omitted = list(omitted.values())
+    bundle.approx_tokens = bundle.budget - left
+
+
+def _load_cache(root: Path) -> dict:
+    try:
+        data = json.loads(read_text(root / CACHE_DIR / CONTEXT_CACHE))
+        if data.get("version") == CONTEXT_CACHE_VERSION:
+            return data["entries"]
+    except Exception:
+        pass
+    return {}
+
+
+def _save_cache(root: Path, entries: dict) -> None:
+    """Write the cache, keeping the most recently built bundles."""
+    newest = sorted(entries.items(), key=lambda item: item[1]["created"])[-MAX_CACHED_BUNDLES:]
+    try:
+        get_cache_dir(root)
+        atomic_write_text(
+            root / CACHE_DIR / CONTEXT_CACHE,
+            json.dumps({"version": CONTEXT_CACHE_VERSION, "entries": dict(newest)}),
+        )
+    except OSError:
+        pass
+
+
+@traced("context pack")
+def build_context(root: Path, spec_path: Path, story_folder: str, budget: int) -> ContextBundle:
+    """Return the context bundle for a story, from the cache when still valid."""
+    story_dir = spec_path / "specs" / story_folder
+    story_rel = story_dir.relative_to(root).as_posix()
+    docs: dict[str, str] = {}
+    for name in ("tasks.md", *STORY_DOCS, *TEST_DOCS):
+        try:
+            docs[name] = read_text(story_dir / name, errors="replace")
+        except FileNotFoundError:
+            continue
+
+    # Refreshing the index only stats truth/ unless something changed there
+    index = TruthIndex.load(root)
+    index.refresh()
+    index.save()
+
+    digest = hashlib.sha1(f"{story_rel}\0{budget}\0{index.content_hash()}\0".encode("utf-8"))
+    for name, content in docs.items():
+        digest.update(f"{name}\0{content}\0".encode("utf-8"))
+    key = digest.hexdigest()
+
+    entries = _load_cache(root)
+    cached = entries.get(key)
+    if cached is not None:
+        result = cached["result"]
+        parts = [ContextPart(**p) for p in result.pop("parts")]
+        return ContextBundle(**{**result, "parts": parts, "cached": True})
+
+    def rel(name: str) -> str:
+        return f"{story_rel}/{name}"
+
+    next_task, open_tasks = _task_parts(rel("tasks.md"), docs.get("tasks.md", ""))
+    candidates = list(next_task)
+    for name in STORY_DOCS:
+        if name in docs:
+            candidates += _sections(rel(name), docs[name])
+
+    # Truth documents linked from the story, then the best search hits
+    truth: dict[str, str] = {}
+    for name, content in docs.items():
+        for target, _ in extract_links(content):
+            path = resolve_link(rel(name), target)
+            if path.startswith(f"{TRUTH_DIR}/") and path.endswith(".md") and path not in truth:
+                try:
+                    truth[path] = read_text(root / path, errors="replace")
+                except OSError:
+                    continue
+    for path, content in truth.items():
+        candidates += _sections(path, content)
+
+    query = _story_query(story_folder, docs.get("functional-spec.md"))
+    linked = set(truth)
+    hits = [h for h in index.search(query, SEARCH_HITS + len(linked)) if h.file not in linked]
+    for hit in hits[:SEARCH_HITS]:
+        if hit.file not in truth:
+            truth[hit.file] = read_text(root / hit.file, errors="replace")
+        sections = _sections(hit.file, truth[hit.file])
+        section = next((s for s in sections if s.heading == hit.heading), None)
+        if section is not None:
+            candidates.append(section)
+
+    candidates += open_tasks
+    for name in TEST_DOCS:
+        if name in docs:
+            candidates += _sections(rel(name), docs[name])
+
+    bundle = ContextBundle(spec=spec_path.name, story=story_folder, budget=budget)
+    pack(bundle, candidates)
+
+    result = asdict(bundle)
+    result.pop("cached")
+    entries[key] = {"result": result, "created": time.time()}
+    _save_cache(root, entries)
+    return bundle
@@ -0,0 +1,352 @@
+"""Long-running ``ana-speksi serve`` daemon and its client side.
+
+The daemon speaks newline-delimited JSON-RPC 2.0, either on a unix socket
+(one per ana-speksi root) or on stdin/stdout.  Its main method, ``run``,
+executes a CLI command in-process and returns the captured output, so the
+interpreter start-up, the imports and -- through resident caches -- the
+document parsing are paid once instead of on every call.
+
+The client half (``socket_path``, ``forward``) only imports the standard
+library, and imports socket, hashlib and tempfile only when the command could
+be forwarded at all, so running locally stays cheap.
+
+Sockets live in ``$XDG_RUNTIME_DIR`` or else in a private (0700) per-user
+directory under the temp directory.  The client only connects to a socket
+owned by the current user in a directory nobody else can write to, so
+another local user cannot plant a socket that feeds output to agents.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+from ana_speksi.iostats import METRICS_ENV
+from ana_speksi.models import ANA_SPEKSI_DIR
+from ana_speksi.profiling import PROFILE_ENV
+
+# Commands that may be answered by a running daemon.  Interactive commands
+# (init, new, update) and long-running ones always run locally.
+FORWARDED_COMMANDS = {
+    "status",
+    "accept",
+    "continue",
+    "sync-counts",
+    "what-to-code-next",
+    "lint",
+}
+
+# Set to any non-empty value to never forward to a daemon.
+NO_DAEMON_ENV = "ANA_SPEKSI_NO_DAEMON"
+
+CONNECT_TIMEOUT = 0.05
+REQUEST_TIMEOUT = 60.0
+# How long the daemon waits for a connected client to send its request
+READ_TIMEOUT = 1.0
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def find_root(cwd: Path | None = None) -> Path | None:
+    """Return the ana-speksi root above ``cwd``, or None if there is none.
+
+    Mirrors ``status.get_ana_speksi_root`` without importing it, which would
+    pull in rich.
+    """
+    current = cwd or Path.cwd()
+    while current != current.parent:
+        candidate = current / ANA_SPEKSI_DIR
+        if candidate.is_dir():
+            return candidate
+        current = current.parent
+    return None
+
+
+def _uid() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def socket_dir() -> Path:
+    """Return the per-user directory holding daemon sockets.
+
+    Socket paths are limited to about 100 bytes, so this is
+    ``$XDG_RUNTIME_DIR`` when set, else ``ana-speksi-<uid>`` in the temp
+    directory.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return Path(runtime)
+    import tempfile
+
+    return Path(tempfile.gettempdir()) / f"ana-speksi-{_uid()}"
+
+
+def socket_path(root: Path) -> Path:
+    """Return the unix socket path of the daemon serving ``root``."""
+    import hashlib
+
+    digest = hashlib.sha1(str(root.resolve()).encode()).hexdigest()[:12]
+    return socket_dir() / f"ana-speksi-{digest}.sock"
+
+
+def _is_private_dir(path: Path) -> bool:
+    """True if ``path`` is a real directory of ours that others cannot write."""
+    try:
+        st = path.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == _uid()
+        and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def is_trusted_socket(sock_path: Path) -> bool:
+    """True if ``sock_path`` is a socket of ours in a private directory."""
+    try:
+        st = sock_path.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and st.st_uid == _uid()
+        and _is_private_dir(sock_path.parent)
+    )
+
+
+def _request(sock_path: Path, method: str, params: dict) -> dict:
+    """Send one JSON-RPC request and return its result."""
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(sock_path))
+        sock.settimeout(REQUEST_TIMEOUT)
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            response = json.loads(f.readline())
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run a command through a running daemon.
+
+    Returns the exit code, or None when the command must run locally: no
+    daemon for this root, a command that is not forwarded, an interactive
+    terminal (so rich keeps its colours and width), forwarding disabled
+    through ``ANA_SPEKSI_NO_DAEMON``, profiling or metrics requested
+    through the environment, or a request the daemon failed to handle.
+    """
+    if os.name != "posix" or any(
+        os.environ.get(env) for env in (NO_DAEMON_ENV, PROFILE_ENV, METRICS_ENV)
+    ):
+        return None
+    if not argv or argv[0] not in FORWARDED_COMMANDS or "--watch" in argv:
+        return None
+    if sys.stdout.isatty():
+        return None
+    root = find_root()
+    if root is None:
+        return None
+    sock_path = socket_path(root)
+    if not is_trusted_socket(sock_path):
+        return None
+    try:
+        result = _request(sock_path, "run", {"argv": argv, "cwd": os.getcwd()})
+    except (OSError, ValueError, RuntimeError):
+        # Unreachable daemon or a command that failed inside it; running
+        # locally reports the error the usual way
+        return None
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return result["exit_code"]
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+
+class Daemon:
+    """Dispatches JSON-RPC requests to in-process command runs."""
+
+    def __init__(self, root: Path) -> None:
+        import typer
+
+        from ana_speksi.cache import keep_resident
+        from ana_speksi.cli import app
+
+        keep_resident()
+        self.root = root
+        self.command = typer.main.get_command(app)
+        self.running = True
+
+    def handle(self, line: bytes) -> dict:
+        """Handle one request line and return the response object."""
+        try:
+            request = json.loads(line)
+            req_id = request.get("id")
+            method = request["method"]
+            params = request.get("params") or {}
+        except (ValueError, KeyError, AttributeError) as e:
+            return _error(None, -32700, f"Parse error: {e}")
+        handler = getattr(self, f"rpc_{method.replace('-', '_')}", None)
+        if handler is None:
+            return _error(req_id, -32601, f"Method not found: {method}")
+        try:
+            result = handler(**params)
+        except TypeError as e:
+            return _error(req_id, -32602, f"Invalid params: {e}")
+        except Exception as e:  # a failing command must not stop the daemon
+            return _error(req_id, -32000, f"{type(e).__name__}: {e}")
+        return {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    def rpc_ping(self) -> dict:
+        return {"root": str(self.root), "pid": os.getpid()}
+
+    def rpc_shutdown(self) -> dict:
+        self.running = False
+        return {"stopped": True}
+
+    def rpc_status(self) -> dict:
+        """Return ``status --toon`` data as a structured object."""
+        from ana_speksi.config import get_jobs
+        from ana_speksi.status import list_ongoing_specs, print_status_json
+
+        specs = list_ongoing_specs(self.root, jobs=get_jobs(self.root))
+        return print_status_json(self.root, specs)
+
+    def rpc_run(self, argv: list[str], cwd: str | None = None) -> dict:
+        """Run a CLI command and return its exit code and captured output."""
+        import contextlib
+        import io
+
+        import typer
+
+        if not argv or argv[0] not in FORWARDED_COMMANDS:
+            raise ValueError(f"Command cannot run in the daemon: {argv[:1]}")
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd = os.getcwd()
+        exit_code = 0
+        try:
+            os.chdir(cwd or self.root.parent)
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    rv = self.command.main(
+                        args=list(argv),
+                        prog_name="ana-speksi",
+                        standalone_mode=False,
+                    )
+                    exit_code = rv if isinstance(rv, int) else 0
+                except typer.Exit as e:
+                    exit_code = e.exit_code
+                except typer.Abort:
+                    exit_code = 1
+                except Exception as e:
+                    # Usage errors; shown the way the CLI would show them
+                    if not hasattr(e, "show"):
+                        raise
+                    e.show()
+                    exit_code = getattr(e, "exit_code", 1)
+        finally:
+            os.chdir(previous_cwd)
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+
+def _error(req_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
+
+
+def serve_socket(root: Path) -> None:
+    """Serve requests on the root's unix socket until shut down.
+
+    Each connection carries one request.  Commands run one at a time (they
+    change the working directory and redirect stdout), so a client that
+    connects and sends nothing is dropped after ``READ_TIMEOUT`` instead of
+    blocking everyone else.
+    """
+    import socket
+
+    sock_path = socket_path(root)
+    directory = sock_path.parent
+    if not directory.exists():
+        directory.mkdir(mode=0o700, parents=True)
+    if not _is_private_dir(directory):
+        raise RuntimeError(
+            f"Socket directory {directory} must be owned by you and not "
+            "writable by others"
+        )
+    if os.path.lexists(sock_path):
+        try:
+            _request(sock_path, "ping", {})
+            raise RuntimeError(f"A daemon is already serving {root} ({sock_path})")
+        except OSError:
+            sock_path.unlink()
+
+    daemon = Daemon(root)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(sock_path))
+        os.chmod(sock_path, 0o600)
+        server.listen()
+        while daemon.running:
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(READ_TIMEOUT)
+                try:
+                    with conn.makefile("rwb") as f:
+                        line = f.readline()
+                        if not line.strip():
+                            continue
+                        response = daemon.handle(line)
+                        conn.settimeout(REQUEST_TIMEOUT)
+                        f.write(json.dumps(response).encode() + b"\n")
+                        f.flush()
+                except OSError:
+                    # Idle, slow or vanished client
+                    continue
+    finally:
+        server.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def serve_stdio(root: Path) -> None:
+    """Serve requests read line by line from stdin, answering on stdout."""
+    out = sys.stdout
+    daemon = Daemon(root)
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        out.write(json.dumps(daemon.handle(line)) + "\n")
+        out.flush()
+        if not daemon.running:
+            break
+
+
+def stop(root: Path) -> bool:
+    """Ask the daemon serving ``root`` to stop.  Returns False if none runs."""
+    sock_path = socket_path(root)
+    if not is_trusted_socket(sock_path):
+        return False
+    try:
+        _request(sock_path, "shutdown", {})
+    except (OSError, ValueError, RuntimeError):
+        return False
+    return True
@@ -0,0 +1,67 @@
+"""Header parsing for spec documents.
+
+Every spec document starts with a title and a block of ``**Key**: value``
+lines (Ticket, Created, Status, ...).  Only that block is needed to know a
+document's status, so readers here read at most the first ``HEADER_BYTES``
+bytes of a file and the parser stops at the first heading after the block.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+from ana_speksi import iostats
+from ana_speksi.models import DocHeader, DocStatus
+
+# Upper bound for how much of a file is read to find its header.
+HEADER_BYTES = 4096
+
+_FIELD_RE = re.compile(r"^\*\*(?P<key>[^*]+)\*\*:\s*(?P<value>.*?)\s*$")
+_STATUS_RE = re.compile(r"\*\*Status\*\*:\s*(\S+)")
+
+
+def parse_doc_header(content: str) -> DocHeader:
+    """Parse the header block from the beginning of markdown content."""
+    header = DocHeader()
+    for line in content.splitlines():
+        if line.startswith("#"):
+            if header.title is None and not header.fields and line.startswith("# "):
+                header.title = line[2:].strip()
+                continue
+            break
+        match = _FIELD_RE.match(line)
+        if match:
+            header.fields[match.group("key").strip()] = match.group("value")
+    status = header.fields.get("Status", "").split(" ", 1)[0]
+    header.status = DocStatus.ACCEPTED if status == "Accepted" else DocStatus.DRAFT
+    return header
+
+
+def read_doc_head(file_path: Path) -> bytes:
+    """Read at most the first ``HEADER_BYTES`` bytes of a document."""
+    with open(file_path, "rb") as f:
+        head = f.read(HEADER_BYTES)
+    iostats.count("open")
+    iostats.count("bytes_read", len(head))
+    return head
+
+
+def read_doc_header(file_path: Path) -> DocHeader:
+    """Read and parse a document header without reading the whole file."""
+    return parse_doc_header(read_doc_head(file_path).decode("utf-8", errors="ignore"))
+
+
+def find_status_outside_header(content: str) -> int | None:
+    """Return the 1-based line of a ``**Status**:`` line below the header.
+
+    Returns None when the header has its own status line or when there is
+    no status line at all.  Such documents are reported by ``lint`` because
+    their status is invisible to the header-only reader.
+    """
+    if "Status" in parse_doc_header(content).fields:
+        return None
+    for lineno, line in enumerate(content.splitlines(), start=1):
+        if _STATUS_RE.search(line):
+            return lineno
+    return None
@@ -0,0 +1,86 @@
+"""Small filesystem helpers shared by commands that read and write files.
+
+All of them count their I/O in ``iostats``.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import stat
+from collections.abc import Iterator
+from pathlib import Path
+
+from ana_speksi import iostats
+
+
+def read_bytes(path: Path) -> bytes:
+    """Read a whole file."""
+    data = path.read_bytes()
+    iostats.count("open")
+    iostats.count("bytes_read", len(data))
+    return data
+
+
+def read_text(path: Path, errors: str = "strict") -> str:
+    """Read a UTF-8 file with universal newlines, like ``Path.read_text``."""
+    text = read_bytes(path).decode("utf-8", errors=errors)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def walk_files(directory: Path, suffix: str = ".md") -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative posix path, entry)`` for files below ``directory``.
+
+    Directories are listed once each with ``os.scandir`` and visited in
+    sorted order; hidden entries are skipped.  A missing directory yields
+    nothing.
+    """
+    stack = [(directory, "")]
+    while stack:
+        path, prefix = stack.pop()
+        iostats.count("scandir")
+        try:
+            with os.scandir(path) as it:
+                entries = sorted((e for e in it if not e.name.startswith(".")), key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append((Path(entry.path), f"{prefix}{entry.name}/"))
+            elif entry.name.endswith(suffix):
+                yield f"{prefix}{entry.name}", entry
+        stack.extend(reversed(subdirs))
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temp file and rename.
+
+    Readers either see the old content or the new content, never a partially
+    written file -- also when the process is interrupted mid-write.  The
+    permissions of an existing file are preserved; new files get the usual
+    umask-derived mode.
+    """
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+        iostats.count("write")
+        iostats.count("bytes_written", len(data))
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` as UTF-8 to ``path`` atomically."""
+    atomic_write_bytes(path, text.encode("utf-8"))
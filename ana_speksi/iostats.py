@@ -0,0 +1,89 @@
+"""Process-wide I/O counters for measuring how much work a scan does.
+
+Scanning code calls ``count`` next to each filesystem operation it performs
+(``scandir``, ``stat``, ``open``, ``bytes_read``, ``write``, ``bytes_written``)
+and caches count their ``cache_hit``/``cache_miss`` lookups.  With the global
+``--metrics`` option the totals are added to TOON/JSON output as a
+``_metrics`` block (or printed to stderr), so a change that starts
+re-reading whole trees shows up and CI can assert I/O budgets.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+
+# Set to any non-empty value to report metrics, like the --metrics option.
+METRICS_ENV = "ANA_SPEKSI_METRICS"
+
+# Counter name -> key in the reported metrics; every key is always present.
+METRICS = {
+    "open": "files_opened",
+    "bytes_read": "bytes_read",
+    "stat": "stat_calls",
+    "scandir": "dir_scans",
+    "write": "files_written",
+    "bytes_written": "bytes_written",
+    "cache_hit": "cache_hits",
+    "cache_miss": "cache_misses",
+}
+
+_lock = threading.Lock()
+_counters: Counter[str] = Counter()
+
+# Whether the current command reports metrics, and whether it already did
+_report = False
+_reported = False
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Add ``amount`` to counter ``name``."""
+    with _lock:
+        _counters[name] += amount
+
+
+def snapshot() -> dict[str, int]:
+    """Return a copy of all counters."""
+    with _lock:
+        return dict(_counters)
+
+
+def reset() -> None:
+    """Reset all counters to zero."""
+    with _lock:
+        _counters.clear()
+
+
+def metrics() -> dict[str, int]:
+    """Return the counters under their reported names."""
+    counters = snapshot()
+    return {key: counters.get(name, 0) for name, key in METRICS.items()}
+
+
+def begin_command(report: bool) -> None:
+    """Reset the counters for a new command and set whether it reports them."""
+    global _report, _reported
+    reset()
+    _report = report
+    _reported = False
+
+
+def report_metrics() -> dict[str, int] | None:
+    """Return the metrics to embed in command output, or None if not requested."""
+    global _reported
+    if not _report:
+        return None
+    _reported = True
+    return metrics()
+
+
+def unreported_metrics() -> dict[str, int] | None:
+    """Return the metrics if requested but not yet embedded in any output."""
+    if not _report or _reported:
+        return None
+    return metrics()
+
+
+def format_counters(counters: dict[str, int]) -> str:
+    """Format counters as a single ``key=value`` line."""
+    return " ".join(f"{k}={v}" for k, v in sorted(counters.items())) or "no I/O"
@@ -0,0 +1,25 @@
+"""Console-script entry point.
+
+Forwards the command to a running ``ana-speksi serve`` daemon when there is
+one, and only imports the Typer app when the command has to run locally.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from ana_speksi.daemon import forward
+
+
+def main() -> None:
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from ana_speksi.cli import app
+
+    app(prog_name="ana-speksi")
+
+
+if __name__ == "__main__":
+    main()
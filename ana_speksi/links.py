@@ -0,0 +1,286 @@
+"""Cross-reference graph of the relative markdown links under ana-speksi/.
+
+Links are extracted from every markdown file below the ana-speksi root
+(``.cache`` excluded) and kept per file in ``.cache/links.json``, keyed by
+stat, so a warm run only lists directories and stats files.  Link targets
+are resolved against the linking file; external URLs and in-page anchors
+are ignored.  A link to a directory counts as a link to the documents
+directly inside it.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote
+
+from ana_speksi import iostats
+from ana_speksi.cache import FileCache
+from ana_speksi.fsutil import read_bytes, read_text, walk_files
+from ana_speksi.models import TRUTH_DIR
+from ana_speksi.profiling import span, traced
+
+LINKS_CACHE = "links.json"
+
+# [text](target) and ![alt](target), with an optional "title"
+_INLINE_LINK_RE = re.compile(r"!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+[\"'][^)]*)?\)")
+# [label]: target
+_REFERENCE_RE = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*<?([^\s>]+)>?")
+_CODE_SPAN_RE = re.compile(r"`[^`]*`")
+_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+@dataclass
+class Link:
+    """A resolved link between two paths relative to the ana-speksi root."""
+
+    source: str
+    target: str
+    line: int
+    broken: bool = False
+
+
+@dataclass
+class LinkGraph:
+    """Every markdown document and the links between them."""
+
+    documents: set[str] = field(default_factory=set)
+    outbound: dict[str, list[Link]] = field(default_factory=dict)
+    inbound: dict[str, list[Link]] = field(default_factory=dict)
+
+    @property
+    def links(self) -> list[Link]:
+        return [link for links in self.outbound.values() for link in links]
+
+    def broken(self, prefix: str = "") -> list[Link]:
+        """Broken links from documents under ``prefix``."""
+        return [l for l in self.links if l.broken and l.source.startswith(prefix)]
+
+    def orphans(self, prefix: str = f"{TRUTH_DIR}/") -> list[str]:
+        """Documents under ``prefix`` that no other document links to.
+
+        The index.md at the top of ``prefix`` is the entry point and never
+        counts as an orphan.
+        """
+        entry = f"{prefix}index.md"
+
+        def linked(doc: str) -> bool:
+            for target in (doc, posixpath.dirname(doc)):
+                if any(l.source != doc for l in self.inbound.get(target, ())):
+                    return True
+            return False
+
+        return sorted(
+            doc
+            for doc in self.documents
+            if doc.startswith(prefix) and doc != entry and not linked(doc)
+        )
+
+
+def _link_spans(content: str) -> Iterator[tuple[int, int, int, str]]:
+    """Yield ``(line number, start, end, raw target)`` for every link.
+
+    ``start`` and ``end`` are offsets of the target within its line.  Links
+    in fenced code blocks and inline code are skipped.
+    """
+    in_fence = False
+    for number, line in enumerate(content.split("\n"), start=1):
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        if in_fence or ("](" not in line and "]:" not in line):
+            continue
+        code = [m.span() for m in _CODE_SPAN_RE.finditer(line)]
+        matches = list(_INLINE_LINK_RE.finditer(line))
+        reference = _REFERENCE_RE.match(line)
+        if reference:
+            matches.append(reference)
+        for match in matches:
+            start, end = match.span(1)
+            if not any(a <= start < b for a, b in code):
+                yield number, start, end, match.group(1)
+
+
+def _link_path(raw: str) -> str | None:
+    """Return the path part of a raw link target, or None if not a file link."""
+    if _SCHEME_RE.match(raw):
+        return None
+    target = unquote(raw.split("#", 1)[0].split("?", 1)[0])
+    return target if "/" in target or "." in target else None
+
+
+def extract_links(content: str) -> list[list]:
+    """Return ``[target, line]`` for each relative link in markdown content.
+
+    Fenced code blocks and inline code are skipped.  Anchors and query
+    strings are dropped from targets.  Left out are links that are only an
+    anchor, links with a URL scheme (https:, mailto:, ...) and bare words
+    without a dot or slash, e.g. ``REFERENCES [table](id)`` in data-model
+    tables.
+    """
+    links = []
+    for number, _, _, raw in _link_spans(content):
+        target = _link_path(raw)
+        if target is not None:
+            links.append([target, number])
+    return links
+
+
+def resolve_link(source: str, target: str) -> str:
+    """Resolve ``target`` as linked from ``source`` (both root-relative)."""
+    if target.startswith("/"):
+        # Relative to the repository, i.e. the parent of the ana-speksi root
+        return posixpath.normpath(f"..{target}")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+
+
+@traced("link graph")
+def build_link_graph(root: Path, prefix: str = "", use_cache: bool = True) -> LinkGraph:
+    """Extract the links of markdown files under ``root`` and resolve them.
+
+    With ``prefix`` (a directory such as ``truth`` or any path prefix) only
+    the documents under it are read; that is enough for their outbound and
+    broken links, but inbound links from elsewhere are then missing.
+    """
+    cache = FileCache.load(root, LINKS_CACHE) if use_cache else None
+    prefix = prefix.strip("/")
+    if prefix and (root / prefix).is_dir():
+        top = prefix
+        prefix = f"{prefix}/"
+    else:
+        top = prefix.rpartition("/")[0]
+    base = f"{top}/" if top else ""
+    raw: dict[str, list[list]] = {}
+    for rel, entry in walk_files(root / top):
+        rel = base + rel
+        if not rel.startswith(prefix):
+            continue
+        path = Path(entry.path)
+        if cache is not None:
+            iostats.count("stat")
+            st = entry.stat()
+            facts = cache.get(path, st)
+            if facts is not None:
+                raw[rel] = facts["links"]
+                continue
+        with span("parse", file=rel):
+            links = extract_links(read_text(path, errors="replace"))
+        raw[rel] = links
+        if cache is not None:
+            cache.put(path, st, {"links": links})
+    if cache is not None:
+        cache.save(prune=not prefix)
+
+    graph = LinkGraph(documents=set(raw))
+    exists: dict[str, bool] = {}
+    for source, links in raw.items():
+        resolved = []
+        for target, line in links:
+            path = resolve_link(source, target)
+            if path not in graph.documents and path not in exists:
+                iostats.count("stat")
+                exists[path] = os.path.exists(root / path)
+            link = Link(source, path, line, broken=not (path in graph.documents or exists[path]))
+            resolved.append(link)
+            graph.inbound.setdefault(path, []).append(link)
+        graph.outbound[source] = resolved
+    return graph
+
+
+# ---------------------------------------------------------------------------
+# Moving documents
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class LinkEdit:
+    """One rewritten link target; ``file`` is the path before the move."""
+
+    file: str
+    line: int
+    old: str
+    new: str
+
+
+def _moved(path: str, src: str, dst: str) -> str:
+    """Return where ``path`` ends up when ``src`` is moved to ``dst``."""
+    if path == src:
+        return dst
+    if path.startswith(f"{src}/"):
+        return dst + path[len(src) :]
+    return path
+
+
+def _relative(target: str, source: str) -> str:
+    return posixpath.relpath(target, posixpath.dirname(source) or ".")
+
+
+def rewrite_links(content: str, file: str, src: str, dst: str) -> tuple[str, list[LinkEdit]]:
+    """Rewrite the links of ``file`` for moving ``src`` to ``dst``.
+
+    Links into the moved path are pointed at the new location, and when
+    ``file`` itself moves, its links to anything outside the moved path are
+    adjusted to its new directory.  Anchors, query strings and trailing
+    slashes are kept; repository-absolute links (``/...``) are left alone.
+    """
+    new_file = _moved(file, src, dst)
+    lines = content.split("\n")
+    edits: list[LinkEdit] = []
+    spans: dict[int, list[tuple[int, int, str]]] = {}
+    for number, start, end, raw in _link_spans(content):
+        path = _link_path(raw)
+        if path is None or path.startswith("/"):
+            continue
+        target = resolve_link(file, path)
+        new_target = _moved(target, src, dst)
+        if resolve_link(new_file, path) == new_target:
+            continue
+        new_path = _relative(new_target, new_file)
+        if path.endswith("/"):
+            new_path += "/"
+        suffix = raw[len(raw.split("#", 1)[0].split("?", 1)[0]) :]
+        new_raw = new_path.replace(" ", "%20") + suffix
+        if new_raw == raw:
+            continue
+        spans.setdefault(number, []).append((start, end, new_raw))
+        edits.append(LinkEdit(file, number, raw, new_raw))
+    for number, replacements in spans.items():
+        line = lines[number - 1]
+        for start, end, new_raw in sorted(replacements, reverse=True):
+            line = line[:start] + new_raw + line[end:]
+        lines[number - 1] = line
+    return "\n".join(lines), edits
+
+
+@traced("plan move")
+def plan_move(
+    root: Path, graph: LinkGraph, src: str, dst: str
+) -> dict[str, tuple[bytes, list[LinkEdit]]]:
+    """Return file -> (new content, edits) for every file whose links change.
+
+    Files are found through the link graph: those linking into ``src`` and
+    the documents being moved.  Each is read and rewritten once; files are
+    returned under their path before the move.  Raises ValueError if one of
+    them is not valid UTF-8, since rewriting it would corrupt its content.
+    """
+    files = {doc for doc in graph.documents if _moved(doc, src, dst) != doc}
+    for target, links in graph.inbound.items():
+        if _moved(target, src, dst) != target:
+            files.update(l.source for l in links)
+
+    plan = {}
+    for file in sorted(files):
+        if not graph.outbound.get(file):
+            continue
+        try:
+            content = read_bytes(root / file).decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError(f"Not valid UTF-8, cannot rewrite its links: {file}") from None
+        new_content, edits = rewrite_links(content, file, src, dst)
+        if edits:
+            plan[file] = (new_content.encode("utf-8"), edits)
+    return plan
@@ -25,6 +25,9 @@ TRUTH_ENUMS_DIR = "enums"
 
 SUBDIRS = [ONGOING_DIR, TRUTH_DIR, ARCHIVE_DIR, TECHNICAL_DEBT_DIR]
 
+# Derived data (caches, indexes) -- safe to delete, never committed
+CACHE_DIR = ".cache"
+
 
 # ---------------------------------------------------------------------------
 # Phases
@@ -64,12 +67,53 @@ PHASE_DESCRIPTIONS: dict[Phase, str] = {
     Phase.DOCUFY: "Archive completed spec and update ground truth",
 }
 
+# Phase mapping for skills -- since frontmatter `phase` gets stripped by IDE
+# linters, we maintain the mapping in code as the single source of truth.
+SKILL_PHASES: dict[str, str] = {
+    "as-new": "proposal",
+    "as-storify": "storify",
+    "as-techify": "research",
+    "as-taskify": "taskify",
+    "as-codify": "codify",
+    "as-docufy": "docufy",
+}
+
 
 # ---------------------------------------------------------------------------
 # Spec metadata
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class DocHeader:
+    """Metadata block at the top of a spec document.
+
+    ``fields`` holds every ``**Key**: value`` line of the header, e.g.
+    ``{"Ticket": "PROJ-1", "Created": "2026-01-01", "Status": "Draft"}``.
+    """
+
+    title: str | None = None
+    status: DocStatus = DocStatus.DRAFT
+    fields: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ticket(self) -> str | None:
+        return self.fields.get("Ticket") or self.fields.get("Ticket ID")
+
+    @property
+    def date(self) -> str | None:
+        return self.fields.get("Created")
+
+
+@dataclass
+class DocumentSize:
+    """Size of one markdown document, for planning agent context."""
+
+    name: str
+    bytes: int = 0
+    approx_tokens: int = 0
+
+
 @dataclass
 class StoryStatus:
     """Status of a single user story."""
@@ -88,6 +132,10 @@ class StoryStatus:
     functional_spec_status: DocStatus = DocStatus.EMPTY
     technical_spec_status: DocStatus = DocStatus.EMPTY
     tasks_status: DocStatus = DocStatus.EMPTY
+    # Every markdown document in the story folder and their totals
+    documents: list[DocumentSize] = field(default_factory=list)
+    bytes: int = 0
+    approx_tokens: int = 0
 
 
 @dataclass
@@ -102,6 +150,64 @@ class SpecStatus:
     has_research: bool = False
     proposal_status: DocStatus = DocStatus.EMPTY
     stories: list[StoryStatus] = field(default_factory=list)
+    # Markdown documents at the top of the spec folder (stories excluded)
+    documents: list[DocumentSize] = field(default_factory=list)
+
+
+@dataclass
+class IndexCountSync:
+    """Result of syncing task counts from tasks.md files into index.md."""
+
+    updated: list[tuple[str, int, int]] = field(default_factory=list)
+    # Story folders with a tasks.md but no "(n/m tasks complete)" index line
+    missing: list[str] = field(default_factory=list)
+
+
+@dataclass
+class GeneratedWorkspace:
+    """Summary of a synthetic workspace built for benchmarks."""
+
+    root: Path
+    # Ongoing spec folder name -> the phase it was generated in
+    phases: dict[str, Phase] = field(default_factory=dict)
+    archived: list[str] = field(default_factory=list)
+    files: int = 0
+
+
+@dataclass
+class TruthTreeEntry:
+    """One row of the truth/ tree, as yielded while it is walked.
+
+    ``kind`` is ``dir``, ``file``, ``collapsed`` (a directory below the depth
+    limit, summarised by its counts) or ``more`` (the entries of ``path`` left
+    out beyond the per-directory limit).  ``files`` and ``dirs`` are only set
+    for the summarising kinds.
+    """
+
+    path: str
+    depth: int
+    kind: str
+    files: int = 0
+    dirs: int = 0
+
+
+@dataclass
+class ArchivedSpec:
+    """Summary of one archived spec, as kept in the archive index."""
+
+    # Folder name under archive/, e.g. 2026-01-31-PROJ-1.add-login
+    folder: str
+    # Spec name without the archive date, e.g. PROJ-1.add-login
+    name: str
+    ticket: str | None = None
+    archived: str | None = None
+    created: str | None = None
+    summary: str = ""
+    stories: list[str] = field(default_factory=list)
+    tasks_total: int = 0
+    tasks_done: int = 0
+    # Truth documents (relative to truth/) referenced by the spec's documents
+    truth_docs: list[str] = field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,182 @@
+"""Opt-in timing spans, written as a Chrome trace.
+
+Enabled with the global ``--profile`` option or ``ANA_SPEKSI_PROFILE``.  Spans
+are recorded around the expensive stages of a command (root discovery,
+directory walks, document parses, phase detection, acceptance, serialization
+and rendering) and written as Chrome trace JSON, which chrome://tracing and
+https://ui.perfetto.dev open directly.  A cProfile dump and the top
+tracemalloc allocations can be written next to the trace.
+
+When profiling is off, ``span`` returns a shared no-op context manager and
+``traced`` functions only pay one extra call, so the hooks can stay in hot
+paths.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Set to 1 (or any true value) to profile with the default output path, or
+# to the path of the trace file to write.
+PROFILE_ENV = "ANA_SPEKSI_PROFILE"
+
+_NULL_SPAN = contextlib.nullcontext()
+
+_recorder: _Recorder | None = None
+
+# Spans finished before profiling was started (lazy command imports)
+_early: list[tuple[str, int, int, dict[str, Any]]] = []
+
+
+class _Recorder:
+    """Collects complete ("X") trace events for one command run."""
+
+    def __init__(self, output: Path, python: bool, memory: bool) -> None:
+        self.output = output
+        self.origin = min([start for _, start, _, _ in _early] + [time.perf_counter_ns()])
+        self.pid = os.getpid()
+        self.events: list[dict[str, Any]] = []
+        self.threads: dict[int, str] = {}
+        self.profiler = None
+        self.memory = memory
+        if python:
+            import cProfile
+
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        if memory:
+            import tracemalloc
+
+            tracemalloc.start()
+
+    def add(self, name: str, start: int, end: int, args: dict[str, Any]) -> None:
+        tid = threading.get_ident()
+        if tid not in self.threads:
+            self.threads[tid] = threading.current_thread().name
+        event = {
+            "name": name,
+            "cat": "ana-speksi",
+            "ph": "X",
+            "ts": (start - self.origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": self.pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name: str, args: dict[str, Any]):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.perf_counter_ns(), args)
+
+    def write(self) -> list[Path]:
+        """Stop the optional profilers and write every output file."""
+        written = [self.output]
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.memory:
+            import tracemalloc
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                    tracemalloc.Filter(False, "*/cProfile.py"),
+                ]
+            )
+            tracemalloc.stop()
+            memory_path = self.output.with_suffix(".memory.txt")
+            lines = [str(stat) for stat in snapshot.statistics("lineno")[:50]]
+            memory_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            written.append(memory_path)
+        if self.profiler is not None:
+            prof_path = self.output.with_suffix(".prof")
+            self.profiler.dump_stats(prof_path)
+            written.append(prof_path)
+
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self.threads.items()
+        ]
+        trace = {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+        self.output.write_text(json.dumps(trace), encoding="utf-8")
+        return written
+
+
+def default_output(env_value: str | None = None) -> Path:
+    """Return the trace path for an ``ANA_SPEKSI_PROFILE`` value.
+
+    A path is used as is; a flag value such as ``1`` means a timestamped
+    file in the current directory.
+    """
+    if env_value and env_value.lower() not in ("1", "true", "yes", "on"):
+        return Path(env_value)
+    return Path(f"ana-speksi-profile-{time.strftime('%Y%m%d-%H%M%S')}.json")
+
+
+def start(output: Path, python: bool = False, memory: bool = False) -> None:
+    """Start recording spans; ``stop`` writes them to ``output``."""
+    global _recorder
+    _recorder = _Recorder(output, python, memory)
+    for name, begin, end, args in _early:
+        _recorder.add(name, begin, end, args)
+
+
+def stop() -> list[Path]:
+    """Stop recording and return the paths of the files written."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    _early.clear()
+    if recorder is None:
+        return []
+    return recorder.write()
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def span(name: str, **args: Any):
+    """Context manager recording ``name`` (with JSON-able ``args``) as a span."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _recorder.span(name, args)
+
+
+def record(name: str, start_ns: int, end_ns: int, **args: Any) -> None:
+    """Record an already measured span (``time.perf_counter_ns`` values).
+
+    Spans recorded before profiling starts are kept and added once it does.
+    """
+    if _recorder is None:
+        _early.append((name, start_ns, end_ns, args))
+    else:
+        _recorder.add(name, start_ns, end_ns, args)
+
+
+def traced(name: str) -> Callable:
+    """Decorator recording every call of the function as a span."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with _recorder.span(name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
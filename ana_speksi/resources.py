@@ -1,4 +1,9 @@
-"""Resource file loading utilities for ana_speksi skills and templates."""
+"""Resource file loading utilities for ana_speksi skills and templates.
+
+Installed wheels ship a precompiled bundle of all skills (see
+``skill_bundle``), which is preferred when present; otherwise the files
+under ``skills/`` are read directly.
+"""
 
 from __future__ import annotations
 
@@ -7,6 +12,24 @@ from pathlib import Path
 SKILLS_DIR = Path(__file__).parent / "skills"
 
 
+def _bundle() -> dict | None:
+    from ana_speksi.skill_bundle import load_bundle
+
+    return load_bundle()
+
+
+def _bundled_skill(bundle: dict, skill_name: str) -> dict:
+    try:
+        return bundle["skills"][skill_name]
+    except KeyError:
+        raise FileNotFoundError(f"Skill not found: {skill_name}") from None
+
+
+def normalize_newlines(text: str) -> str:
+    """Convert CRLF and CR line endings to LF, like universal newlines."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def get_skill_path(skill_name: str) -> Path:
     """Return the path to a skill's SKILL.md file."""
     return SKILLS_DIR / skill_name / "SKILL.md"
@@ -19,12 +42,46 @@ def get_resource_path(skill_name: str, filename: str) -> Path:
 
 def read_skill(skill_name: str) -> str:
     """Read a skill's SKILL.md content."""
+    bundle = _bundle()
+    if bundle is not None:
+        return normalize_newlines(_bundled_skill(bundle, skill_name)["source"])
     return get_skill_path(skill_name).read_text(encoding="utf-8")
 
 
+def load_skill(skill_name: str) -> tuple[dict[str, str], str]:
+    """Return a skill's parsed frontmatter and body (see parse_skill_frontmatter)."""
+    bundle = _bundle()
+    if bundle is not None:
+        skill = _bundled_skill(bundle, skill_name)
+        return dict(skill["meta"]), skill["body"]
+    return parse_skill_frontmatter(read_skill(skill_name))
+
+
+def list_resources(skill_name: str) -> list[str]:
+    """Return the sorted relative paths of the files in a skill's resources/."""
+    bundle = _bundle()
+    if bundle is not None:
+        return sorted(_bundled_skill(bundle, skill_name)["resources"])
+    src = SKILLS_DIR / skill_name / "resources"
+    if not src.is_dir():
+        return []
+    return sorted(p.relative_to(src).as_posix() for p in src.rglob("*") if p.is_file())
+
+
+def read_resource_bytes(skill_name: str, filename: str) -> bytes:
+    """Read a skill resource file as stored, line endings included."""
+    bundle = _bundle()
+    if bundle is not None:
+        resources = _bundled_skill(bundle, skill_name)["resources"]
+        if filename not in resources:
+            raise FileNotFoundError(f"Resource not found: {skill_name}/{filename}")
+        return resources[filename].encode("utf-8")
+    return get_resource_path(skill_name, filename).read_bytes()
+
+
 def read_resource(skill_name: str, filename: str) -> str:
     """Read a skill resource file."""
-    return get_resource_path(skill_name, filename).read_text(encoding="utf-8")
+    return normalize_newlines(read_resource_bytes(skill_name, filename).decode("utf-8"))
 
 
 def read_template(skill_name: str, filename: str, **kwargs: str) -> str:
@@ -35,6 +92,9 @@ def read_template(skill_name: str, filename: str, **kwargs: str) -> str:
 
 def list_skills() -> list[str]:
     """Return a sorted list of all skill names (folder names under skills/)."""
+    bundle = _bundle()
+    if bundle is not None:
+        return sorted(bundle["skills"])
     if not SKILLS_DIR.exists():
         return []
     return sorted(
@@ -0,0 +1,75 @@
+"""Precompiled bundle of the packaged skills.
+
+The wheel build (``hatch_build.py``) compiles the ``skills/`` folder into a
+single JSON file shipped inside the package: per skill the SKILL.md source,
+its parsed frontmatter and body and its resource files.  ``resources`` reads
+it through ``importlib.resources`` with one open, which also works from
+zipped installs.  A source checkout or editable install has no bundle and
+reads ``skills/`` from the filesystem instead.
+
+Only the standard library and modules without third-party imports are used
+here, so the build hook can import this module.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import cache
+from importlib.resources import files
+from pathlib import Path
+
+from ana_speksi import iostats
+from ana_speksi.resources import SKILLS_DIR, normalize_newlines, parse_skill_frontmatter
+
+BUNDLE_NAME = "skills.bundle.json"
+
+# Bump when the bundle layout changes.
+BUNDLE_VERSION = 2
+
+
+def _skill_entry(skill_dir: Path) -> dict:
+    source = (skill_dir / "SKILL.md").read_bytes().decode("utf-8")
+    meta, body = parse_skill_frontmatter(normalize_newlines(source))
+    resources_dir = skill_dir / "resources"
+    resources = {}
+    if resources_dir.is_dir():
+        for path in sorted(resources_dir.rglob("*")):
+            if path.is_file():
+                rel = path.relative_to(resources_dir).as_posix()
+                resources[rel] = path.read_bytes().decode("utf-8")
+    return {"source": source, "meta": meta, "body": body, "resources": resources}
+
+
+def build_bundle(skills_dir: Path = SKILLS_DIR) -> dict:
+    """Compile every skill folder under ``skills_dir`` into a bundle.
+
+    File contents are kept with their original line endings.
+    """
+    skills = {
+        skill_dir.name: _skill_entry(skill_dir)
+        for skill_dir in sorted(skills_dir.iterdir())
+        if skill_dir.is_dir() and (skill_dir / "SKILL.md").is_file()
+    }
+    return {"version": BUNDLE_VERSION, "skills": skills}
+
+
+def write_bundle(path: Path, skills_dir: Path = SKILLS_DIR) -> None:
+    """Write the bundle for ``skills_dir`` to ``path``."""
+    data = json.dumps(build_bundle(skills_dir), ensure_ascii=False, sort_keys=True)
+    path.write_bytes(data.encode("utf-8"))
+
+
+@cache
+def load_bundle() -> dict | None:
+    """Return the bundle shipped with the package, or None if there is none."""
+    try:
+        data = (files("ana_speksi") / BUNDLE_NAME).read_bytes()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    iostats.count("open")
+    iostats.count("bytes_read", len(data))
+    try:
+        bundle = json.loads(data)
+    except ValueError:
+        return None
+    return bundle if bundle.get("version") == BUNDLE_VERSION else None
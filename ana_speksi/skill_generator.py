@@ -1,33 +1,46 @@
-"""Skill generation logic -- writes skill/prompt files for each agent framework."""
+"""Skill generation logic -- writes skill/prompt files for each agent framework.
+
+Generation is incremental: every output is rendered in memory first and a
+file is only written when its bytes differ from what is on disk.  The
+content hash and stat key of each generated file are recorded in
+``ana-speksi/.cache/skills-manifest.json``, so an unchanged file is
+recognised without reading it, and files generated by an earlier run that
+no longer correspond to a skill are removed.
+"""
 
 from __future__ import annotations
 
-import shutil
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from rich.console import Console
-
+from ana_speksi.cache import get_cache_dir, stat_key
 from ana_speksi.config import inject_config_into_skill, load_config
-from ana_speksi.models import AgentFramework, AGENT_SKILL_PATHS, AGENT_COMMAND_PATHS, Phase
+from ana_speksi.console import console
+from ana_speksi.fsutil import atomic_write_bytes, atomic_write_text, read_bytes, read_text
+from ana_speksi.models import (
+    ANA_SPEKSI_DIR,
+    CACHE_DIR,
+    AgentFramework,
+    AGENT_SKILL_PATHS,
+    AGENT_COMMAND_PATHS,
+    SKILL_PHASES,
+    Phase,
+)
 from ana_speksi.resources import (
-    SKILLS_DIR,
+    list_resources,
     list_skills,
-    parse_skill_frontmatter,
-    read_skill,
+    load_skill,
+    read_resource_bytes,
 )
 
-console = Console()
-
-# Phase mapping for skills -- since frontmatter `phase` gets stripped by IDE
-# linters, we maintain the mapping in code as the single source of truth.
-SKILL_PHASES: dict[str, str] = {
-    "as-new": "proposal",
-    "as-storify": "storify",
-    "as-techify": "research",
-    "as-taskify": "taskify",
-    "as-codify": "codify",
-    "as-docufy": "docufy",
-}
+SKILLS_MANIFEST = "skills-manifest.json"
+
+# Bump when the manifest layout changes.
+SKILLS_MANIFEST_VERSION = 1
 
 # Inverse mapping: Phase -> skill name
 _PHASE_TO_SKILL: dict[Phase, str] = {
@@ -77,90 +90,219 @@ def _make_command_stub(
     return f"---\nname: {name}\ndescription: {description}\n---\n\n{body}\n"
 
 
-def _copy_resources(src_skill_name: str, dest_dir: Path) -> None:
-    """Copy the resources/ folder for a skill into the destination directory."""
-    src = SKILLS_DIR / src_skill_name / "resources"
-    if not src.exists() or not any(src.iterdir()):
-        return
-    dest = dest_dir / "resources"
-    if dest.exists():
-        shutil.rmtree(dest)
-    shutil.copytree(src, dest)
+def _output_bytes(text: str) -> bytes:
+    """Encode generated text the way ``Path.write_text`` writes it."""
+    return text.replace("\n", os.linesep).encode("utf-8")
 
 
-def generate_skills(project_root: Path, frameworks: list[AgentFramework]) -> None:
-    """Generate skill and command files for the selected agent frameworks."""
-    config = load_config(project_root / "ana-speksi")
-    for framework in frameworks:
-        _generate_for_framework(project_root, framework, config)
+def _resource_files(skill_name: str) -> dict[str, bytes]:
+    """Return relative path -> content of the files in a skill's resources/."""
+    return {
+        rel: read_resource_bytes(skill_name, rel) for rel in list_resources(skill_name)
+    }
 
 
-def _generate_for_framework(
-    project_root: Path,
-    framework: AgentFramework,
-    config: dict,
-) -> None:
-    """Generate all skills for a single framework."""
-    skill_base = project_root / AGENT_SKILL_PATHS[framework]
-    command_base = project_root / AGENT_COMMAND_PATHS[framework]
+@dataclass
+class RenderedSkill:
+    """A skill parsed and rendered once, shared by all frameworks."""
+
+    name: str
+    description: str
+    # Encoded skill document: Claude/Copilot SKILL.md and Cursor rule
+    skill_md: bytes
+    rule_md: bytes
+    resources: dict[str, bytes] = field(default_factory=dict)
+
 
+def render_skills(config: dict) -> list[RenderedSkill]:
+    """Read, parse and render every skill with the project config injected."""
+    rendered = []
     for skill_name in list_skills():
-        raw = read_skill(skill_name)
-        meta, body = parse_skill_frontmatter(raw)
+        meta, body = load_skill(skill_name)
         name = meta.get("name", skill_name)
         description = meta.get("description", "")
         phase = SKILL_PHASES.get(name)
 
         # Inject project config (context + phase rules)
         body = inject_config_into_skill(body, config, phase)
-
-        if framework == AgentFramework.CLAUDE:
-            # Skill
-            skill_dir = skill_base / name
-            skill_dir.mkdir(parents=True, exist_ok=True)
-            (skill_dir / "SKILL.md").write_text(
-                _wrap_frontmatter(framework, name, description, body),
-                encoding="utf-8",
-            )
-            _copy_resources(skill_name, skill_dir)
-            # Command -- simple stub
-            command_base.mkdir(parents=True, exist_ok=True)
-            (command_base / f"{name}.md").write_text(
-                _make_command_stub(framework, name, description),
-                encoding="utf-8",
+        rendered.append(
+            RenderedSkill(
+                name=name,
+                description=description,
+                skill_md=_output_bytes(
+                    _wrap_frontmatter(AgentFramework.CLAUDE, name, description, body)
+                ),
+                rule_md=_output_bytes(
+                    _wrap_frontmatter(AgentFramework.CURSOR, name, description, body)
+                ),
+                resources=_resource_files(skill_name),
             )
+        )
+    return rendered
 
-        elif framework == AgentFramework.COPILOT:
-            # Skill
-            skill_dir = skill_base / name
-            skill_dir.mkdir(parents=True, exist_ok=True)
-            (skill_dir / "SKILL.md").write_text(
-                _wrap_frontmatter(framework, name, description, body),
-                encoding="utf-8",
-            )
-            _copy_resources(skill_name, skill_dir)
-            # Prompt -- simple stub
-            command_base.mkdir(parents=True, exist_ok=True)
-            (command_base / f"{name}.prompt.md").write_text(
-                _make_command_stub(framework, name, description),
-                encoding="utf-8",
-            )
 
-        elif framework == AgentFramework.CURSOR:
-            # Rule
-            skill_base.mkdir(parents=True, exist_ok=True)
-            (skill_base / f"{name}.md").write_text(
-                _wrap_frontmatter(framework, name, description, body),
-                encoding="utf-8",
-            )
-            # Command -- simple stub
-            command_base.mkdir(parents=True, exist_ok=True)
-            (command_base / f"{name}.md").write_text(
-                _make_command_stub(framework, name, description),
-                encoding="utf-8",
-            )
+def _framework_outputs(
+    framework: AgentFramework, skills: list[RenderedSkill]
+) -> tuple[dict[str, bytes], list[str]]:
+    """Lay out the rendered skills for a single framework.
+
+    Returns (output path -> content, resources directories), with paths
+    relative to the project root.  The resources directories are owned by
+    the generator: files in them that are not outputs get removed.
+    """
+    skill_base = AGENT_SKILL_PATHS[framework]
+    command_base = AGENT_COMMAND_PATHS[framework]
+    outputs: dict[str, bytes] = {}
+    resource_dirs: list[str] = []
+
+    for skill in skills:
+        name = skill.name
+        stub = _output_bytes(_make_command_stub(framework, name, skill.description))
+
+        if framework == AgentFramework.CURSOR:
+            # Rule plus command stub
+            outputs[f"{skill_base}/{name}.md"] = skill.rule_md
+            outputs[f"{command_base}/{name}.md"] = stub
+            continue
+
+        # Claude and Copilot: skill folder with resources, plus command or
+        # prompt stub
+        outputs[f"{skill_base}/{name}/SKILL.md"] = skill.skill_md
+        if skill.resources:
+            resource_dirs.append(f"{skill_base}/{name}/resources")
+            for rel, data in skill.resources.items():
+                outputs[f"{skill_base}/{name}/resources/{rel}"] = data
+        suffix = ".prompt.md" if framework == AgentFramework.COPILOT else ".md"
+        outputs[f"{command_base}/{name}{suffix}"] = stub
 
-    console.print(f"  Generated skills for [cyan]{framework.value}[/cyan]")
+    return outputs, resource_dirs
+
+
+def _remove_generated(project_root: Path, rel: str, framework: AgentFramework) -> bool:
+    """Delete a generated file and the directories it leaves empty."""
+    path = project_root / rel
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    bases = {
+        project_root / AGENT_SKILL_PATHS[framework],
+        project_root / AGENT_COMMAND_PATHS[framework],
+    }
+    parent = path.parent
+    while parent not in bases and parent != project_root:
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
+    return True
+
+
+def _sync_outputs(
+    project_root: Path,
+    framework: AgentFramework,
+    outputs: dict[str, bytes],
+    resource_dirs: list[str],
+    previous: dict[str, dict],
+) -> tuple[dict[str, dict], int, int]:
+    """Bring the project in line with ``outputs``.
+
+    ``previous`` is the manifest of the last run for this framework.  A file
+    whose hash and stat key match it is skipped without being read; any
+    other file is compared byte for byte and only written when different.
+    Returns (new manifest, files written, files removed).
+    """
+    entries: dict[str, dict] = {}
+    written = 0
+    for rel, data in outputs.items():
+        path = project_root / rel
+        digest = hashlib.sha1(data).hexdigest()
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            st = None
+        old = previous.get(rel)
+        if st is not None and old == {"hash": digest, "key": stat_key(st)}:
+            entries[rel] = old
+            continue
+        if st is None or read_bytes(path) != data:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(path, data)
+            written += 1
+            st = path.stat()
+        entries[rel] = {"hash": digest, "key": stat_key(st)}
+
+    stale = {rel for rel in previous if rel not in outputs}
+    for directory in resource_dirs:
+        for dirpath, _, filenames in os.walk(project_root / directory):
+            for filename in filenames:
+                rel = Path(dirpath, filename).relative_to(project_root).as_posix()
+                if rel not in outputs:
+                    stale.add(rel)
+    removed = sum(_remove_generated(project_root, rel, framework) for rel in sorted(stale))
+    return entries, written, removed
+
+
+def _load_manifest(root: Path) -> dict[str, dict[str, dict]]:
+    try:
+        data = json.loads(read_text(root / CACHE_DIR / SKILLS_MANIFEST))
+        if data.get("version") == SKILLS_MANIFEST_VERSION:
+            return data["frameworks"]
+    except Exception:
+        pass
+    return {}
+
+
+def _save_manifest(root: Path, frameworks: dict[str, dict[str, dict]]) -> None:
+    try:
+        get_cache_dir(root)
+        atomic_write_text(
+            root / CACHE_DIR / SKILLS_MANIFEST,
+            json.dumps({"version": SKILLS_MANIFEST_VERSION, "frameworks": frameworks}),
+        )
+    except OSError:
+        pass
+
+
+def generate_skills(project_root: Path, frameworks: list[AgentFramework]) -> None:
+    """Generate skill and command files for the selected agent frameworks.
+
+    Every skill is rendered once; the frameworks then lay out and sync
+    their files concurrently.  Only files whose content changed are written,
+    and files left over from skills that no longer exist are removed.
+    """
+    root = project_root / ANA_SPEKSI_DIR
+    config = load_config(root)
+    manifest = _load_manifest(root)
+    skills = render_skills(config)
+
+    def sync(framework: AgentFramework) -> tuple[dict[str, dict], int, int]:
+        outputs, resource_dirs = _framework_outputs(framework, skills)
+        previous = manifest.get(framework.value, {})
+        return _sync_outputs(project_root, framework, outputs, resource_dirs, previous)
+
+    frameworks = list(dict.fromkeys(frameworks))
+    if len(frameworks) > 1:
+        with ThreadPoolExecutor(max_workers=len(frameworks)) as pool:
+            results = list(pool.map(sync, frameworks))
+    else:
+        results = [sync(f) for f in frameworks]
+
+    changed = False
+    for framework, (entries, written, removed) in zip(frameworks, results):
+        if entries != manifest.get(framework.value, {}):
+            manifest[framework.value] = entries
+            changed = True
+        if written or removed:
+            console.print(
+                f"  Generated skills for [cyan]{framework.value}[/cyan] "
+                f"({written} written, {removed} removed)"
+            )
+        else:
+            console.print(f"  Skills for [cyan]{framework.value}[/cyan] are up to date")
+    if changed:
+        _save_manifest(root, manifest)
 
 
 def detect_frameworks(project_root: Path) -> list[AgentFramework]:
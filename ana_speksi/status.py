@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from functools import partial
 from pathlib import Path
 
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
-
+from ana_speksi import iostats
+from ana_speksi.cache import FileCache
+from ana_speksi.console import console
+from ana_speksi.documents import parse_doc_header, read_doc_header
+from ana_speksi.fsutil import atomic_write_text, read_bytes, read_text
 from ana_speksi.models import (
     ARCHIVE_DIR,
     ANA_SPEKSI_DIR,
@@ -16,14 +22,21 @@ from ana_speksi.models import (
     TECHNICAL_DEBT_DIR,
     TRUTH_DIR,
     DocStatus,
+    DocumentSize,
+    IndexCountSync,
     Phase,
     SpecStatus,
     StoryStatus,
+    TruthTreeEntry,
 )
+from ana_speksi.profiling import span, traced
+from ana_speksi.tasks import parse_tasks
+from ana_speksi.tokens import approx_tokens
 
-console = Console()
+STATUS_CACHE = "status.json"
 
 
+@traced("root discovery")
 def get_ana_speksi_root(cwd: Path | None = None) -> Path:
     """Return the ana_speksi root directory, searching upward from cwd."""
     start = cwd or Path.cwd()
@@ -59,24 +72,24 @@ def ensure_dirs(root: Path) -> None:
 
 def detect_phase(spec_path: Path) -> Phase:
     """Detect the current phase of a spec by examining its contents."""
-    proposal = spec_path / "proposal.md"
-    index = spec_path / "index.md"
-    research = spec_path / "research.md"
-    specs_dir = spec_path / "specs"
+    return get_spec_status(spec_path).phase
+
 
-    if not proposal.exists():
+@traced("phase detection")
+def resolve_phase(spec: SpecStatus) -> Phase:
+    """Derive the phase of an already scanned spec without touching the disk."""
+    if not spec.has_proposal:
         return Phase.PROPOSAL
 
     # Proposal must be accepted before storify can proceed
-    proposal_status = read_doc_status(proposal)
-    if proposal_status != DocStatus.ACCEPTED:
+    if spec.proposal_status != DocStatus.ACCEPTED:
         return Phase.PROPOSAL
 
-    if not index.exists():
+    if not spec.has_index:
         return Phase.STORIFY
 
     # Check if functional specs exist
-    stories = list_stories(spec_path)
+    stories = spec.stories
     if not stories:
         return Phase.STORIFY
 
@@ -87,7 +100,7 @@ def detect_phase(spec_path: Path) -> Phase:
         return Phase.STORIFY
 
     # Check research
-    if not research.exists():
+    if not spec.has_research:
         return Phase.RESEARCH
 
     # Check technical specs
@@ -116,119 +129,282 @@ def read_doc_status(file_path: Path) -> DocStatus:
     """Read the **Status**: value from a markdown file's header."""
     if not file_path.exists():
         return DocStatus.EMPTY
-    content = file_path.read_text(encoding="utf-8")
-    match = re.search(r"\*\*Status\*\*:\s*(\S+)", content)
-    if not match:
-        return DocStatus.DRAFT
-    value = match.group(1)
-    if value == "Accepted":
-        return DocStatus.ACCEPTED
-    return DocStatus.DRAFT
+    return read_doc_header(file_path).status
 
 
-def list_stories(spec_path: Path) -> list[StoryStatus]:
-    """List all stories in a spec directory."""
-    specs_dir = spec_path / "specs"
-    if not specs_dir.exists():
-        return []
+def parse_doc_status(content: str) -> DocStatus:
+    """Parse the **Status**: value from the header of markdown content."""
+    return parse_doc_header(content).status
+
+
+def read_doc_facts(
+    file_path: Path,
+    cache: FileCache | None = None,
+    with_tasks: bool = False,
+    entry: os.DirEntry | None = None,
+) -> dict | None:
+    """Return the parsed facts of a spec document, or None if it is missing.
+
+    Facts are ``{"status": ..., "bytes": ..., "approx_tokens": ...}`` plus
+    ``"tasks": [total, done]`` when ``with_tasks`` is set.  The whole file
+    is read so the token count is exact; bytes that are not valid UTF-8 are
+    replaced, never fatal.  With a cache, the file is only read when its
+    stat key changed since the last run.
+    Pass the ``DirEntry`` from a directory listing to reuse its stat result.
+    """
+    try:
+        st = entry.stat() if entry is not None else file_path.stat()
+    except FileNotFoundError:
+        return None
+    iostats.count("stat")
+    facts = cache.get(file_path, st) if cache is not None else None
+    if facts is None:
+        with span("parse", file=file_path.name):
+            data = read_bytes(file_path)
+            content = data.decode("utf-8", errors="replace")
+            facts = {
+                "status": parse_doc_status(content).value,
+                "bytes": st.st_size,
+                "approx_tokens": approx_tokens(data),
+            }
+            if with_tasks:
+                facts["tasks"] = list(parse_task_counts(content))
+        if cache is not None:
+            cache.put(file_path, st, facts)
+    return facts
+
+
+def _document_facts(
+    entries: dict[str, os.DirEntry], cache: FileCache | None
+) -> dict[str, dict]:
+    """Return the facts of every markdown document in a directory listing."""
+    facts = {}
+    for name, entry in sorted(entries.items()):
+        if name.endswith(".md") and entry.is_file():
+            doc = read_doc_facts(Path(entry.path), cache, name == "tasks.md", entry)
+            if doc is not None:
+                facts[name] = doc
+    return facts
+
+
+def _document_sizes(facts: dict[str, dict]) -> list[DocumentSize]:
+    return [DocumentSize(name, f["bytes"], f["approx_tokens"]) for name, f in facts.items()]
+
+
+@traced("walk")
+def _list_dir(path: Path) -> dict[str, os.DirEntry]:
+    """List a directory once; a missing directory lists as empty."""
+    iostats.count("scandir")
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _facts_status(facts: dict | None) -> DocStatus:
+    return DocStatus.EMPTY if facts is None else DocStatus(facts["status"])
+
 
-    stories = []
-    for child in sorted(specs_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        story = StoryStatus(folder=child.name, name=child.name)
-        story.has_functional_spec = (child / "functional-spec.md").exists()
-        story.has_technical_spec = (child / "technical-spec.md").exists()
-        story.has_data_model = (child / "data-model.md").exists()
-        story.has_api_contract = (child / "api-contract.md").exists()
-        story.has_test_plan = (child / "test-automation-plan.md").exists()
-        story.has_manual_test_plan = (child / "manual-testing-plan.md").exists()
-        story.has_tasks = (child / "tasks.md").exists()
-        if story.has_tasks:
-            story.tasks_total, story.tasks_done = count_tasks(child / "tasks.md")
-        story.functional_spec_status = read_doc_status(child / "functional-spec.md")
-        story.technical_spec_status = read_doc_status(child / "technical-spec.md")
-        story.tasks_status = read_doc_status(child / "tasks.md")
-        stories.append(story)
-    return stories
+def _story_dirs(spec_path: Path) -> list[Path]:
+    """Return the story folders of a spec in sorted order."""
+    entries = _list_dir(spec_path / "specs")
+    return [Path(e.path) for name, e in sorted(entries.items()) if e.is_dir()]
+
+
+def scan_story(story_dir: Path, cache: FileCache | None = None) -> StoryStatus:
+    """Scan a single story folder.
+
+    The folder is listed once; file presence comes from that listing and
+    its markdown documents are stat'ed and (if not cached) read.
+    """
+    entries = _list_dir(story_dir)
+    story = StoryStatus(folder=story_dir.name, name=story_dir.name)
+    docs = _document_facts(entries, cache)
+    functional = docs.get("functional-spec.md")
+    technical = docs.get("technical-spec.md")
+    tasks = docs.get("tasks.md")
+    story.has_functional_spec = functional is not None
+    story.has_technical_spec = technical is not None
+    story.has_data_model = "data-model.md" in entries
+    story.has_api_contract = "api-contract.md" in entries
+    story.has_test_plan = "test-automation-plan.md" in entries
+    story.has_manual_test_plan = "manual-testing-plan.md" in entries
+    story.has_tasks = tasks is not None
+    if tasks is not None:
+        story.tasks_total, story.tasks_done = tasks["tasks"]
+    story.functional_spec_status = _facts_status(functional)
+    story.technical_spec_status = _facts_status(technical)
+    story.tasks_status = _facts_status(tasks)
+    story.documents = _document_sizes(docs)
+    story.bytes = sum(d.bytes for d in story.documents)
+    story.approx_tokens = sum(d.approx_tokens for d in story.documents)
+    return story
+
+
+def list_stories(spec_path: Path, cache: FileCache | None = None) -> list[StoryStatus]:
+    """List all stories in a spec directory."""
+    return [scan_story(child, cache) for child in _story_dirs(spec_path)]
 
 
 def count_tasks(tasks_path: Path) -> tuple[int, int]:
     """Count total and completed tasks in a tasks.md file."""
     if not tasks_path.exists():
         return 0, 0
-    content = tasks_path.read_text(encoding="utf-8")
-    total = len(re.findall(r"^- \[[ x]\]", content, re.MULTILINE))
-    done = len(re.findall(r"^- \[x\]", content, re.MULTILINE))
-    return total, done
+    return parse_task_counts(read_text(tasks_path))
 
 
-def update_index_task_counts(spec_path: Path) -> list[tuple[str, int, int]]:
+def parse_task_counts(content: str) -> tuple[int, int]:
+    """Count total and completed tasks in tasks.md content."""
+    index = parse_tasks(content)
+    return index.total, index.done
+
+
+# A tasks.md entry in index.md followed by its "(done/total tasks complete)" marker
+_INDEX_COUNT_RE = re.compile(
+    r"(\[tasks\.md\]\(specs/(?P<folder>[^/)]+)/tasks\.md\))\s*\(\d+/\d+ tasks complete\)"
+)
+
+
+def update_index_task_counts(
+    spec_path: Path,
+    stories: list[StoryStatus] | None = None,
+) -> IndexCountSync:
     """Update task counts in index.md from actual tasks.md files.
 
-    Returns a list of (story_folder, total, done) for each updated story.
+    ``stories`` may be passed in from an existing scan to avoid re-reading
+    every tasks.md.  All count markers are rewritten in a single pass and
+    index.md is replaced atomically, and only if its content changed.
     """
+    result = IndexCountSync()
     index_path = spec_path / "index.md"
     if not index_path.exists():
-        return []
-
-    content = index_path.read_text(encoding="utf-8")
-    updated: list[tuple[str, int, int]] = []
-
-    stories = list_stories(spec_path)
-    for story in stories:
-        if not story.has_tasks:
-            continue
-        total, done = story.tasks_total, story.tasks_done
-        # Match the tasks.md line with any existing count
-        pattern = (
-            r"(\[tasks\.md\]\(specs/"
-            + re.escape(story.folder)
-            + r"/tasks\.md\))\s*\(\d+/\d+ tasks complete\)"
-        )
-        replacement = rf"\g<1> ({done}/{total} tasks complete)"
-        new_content = re.sub(pattern, replacement, content)
-        if new_content != content:
-            content = new_content
-            updated.append((story.folder, total, done))
-
-    if updated:
-        index_path.write_text(content, encoding="utf-8")
+        return result
+
+    if stories is None:
+        stories = list_stories(spec_path)
+    counts = {s.folder: (s.tasks_total, s.tasks_done) for s in stories if s.has_tasks}
+    changed: set[str] = set()
+    seen: set[str] = set()
+
+    def replace(match: re.Match) -> str:
+        folder = match.group("folder")
+        if folder not in counts:
+            return match.group(0)
+        seen.add(folder)
+        total, done = counts[folder]
+        new = f"{match.group(1)} ({done}/{total} tasks complete)"
+        if new != match.group(0):
+            changed.add(folder)
+        return new
+
+    # Bytes round-trip keeps the file's own line endings
+    content = read_bytes(index_path).decode("utf-8")
+    new_content = _INDEX_COUNT_RE.sub(replace, content)
+    if new_content != content:
+        atomic_write_text(index_path, new_content)
+
+    for folder, (total, done) in counts.items():
+        if folder in changed:
+            result.updated.append((folder, total, done))
+        elif folder not in seen:
+            result.missing.append(folder)
+    return result
 
-    return updated
 
+def scan_spec_docs(
+    spec_path: Path,
+    cache: FileCache | None = None,
+) -> tuple[SpecStatus, list[Path]]:
+    """Scan the spec-level documents and return the spec plus its story folders.
 
-def get_spec_status(spec_path: Path) -> SpecStatus:
-    """Get full status of a spec."""
-    phase = detect_phase(spec_path)
-    stories = list_stories(spec_path)
-    return SpecStatus(
+    The returned spec has no stories yet and its phase is not resolved.
+    """
+    entries = _list_dir(spec_path)
+    docs = _document_facts(entries, cache)
+    proposal_status = _facts_status(docs.get("proposal.md"))
+    spec = SpecStatus(
         name=spec_path.name,
         path=spec_path,
-        phase=phase,
-        has_proposal=(spec_path / "proposal.md").exists(),
-        has_index=(spec_path / "index.md").exists(),
-        has_research=(spec_path / "research.md").exists(),
-        proposal_status=read_doc_status(spec_path / "proposal.md"),
-        stories=stories,
+        phase=Phase.PROPOSAL,
+        has_proposal=proposal_status != DocStatus.EMPTY,
+        has_index="index.md" in entries,
+        has_research="research.md" in entries,
+        proposal_status=proposal_status,
+        documents=_document_sizes(docs),
     )
+    story_dirs = _story_dirs(spec_path) if "specs" in entries else []
+    return spec, story_dirs
+
 
+def scan_specs(
+    spec_paths: list[Path],
+    cache: FileCache | None = None,
+    jobs: int = 1,
+) -> list[SpecStatus]:
+    """Scan several specs, spreading the work over one bounded thread pool.
 
-def list_ongoing_specs(root: Path) -> list[SpecStatus]:
-    """List all ongoing specs with their status."""
+    Spec-level documents are scanned first, then every story of every spec
+    is scanned as a separate work item, so a single spec with many stories
+    parallelises as well as many small specs.  Results are returned in the
+    order of ``spec_paths`` regardless of ``jobs``.
+    """
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    run = pool.map if pool else map
+    try:
+        heads = list(run(partial(scan_spec_docs, cache=cache), spec_paths))
+        story_dirs = [d for _, dirs in heads for d in dirs]
+        stories = iter(list(run(partial(scan_story, cache=cache), story_dirs)))
+    finally:
+        if pool:
+            pool.shutdown()
+
+    specs = []
+    for spec, dirs in heads:
+        spec.stories = [next(stories) for _ in dirs]
+        spec.phase = resolve_phase(spec)
+        specs.append(spec)
+    return specs
+
+
+def get_spec_status(spec_path: Path, cache: FileCache | None = None) -> SpecStatus:
+    """Get full status of a spec.
+
+    Every document is read exactly once (or not at all when ``cache`` holds
+    its facts); the phase is derived afterwards from the resulting in-memory
+    snapshot.
+    """
+    return scan_specs([spec_path], cache)[0]
+
+
+def list_ongoing_specs(
+    root: Path,
+    use_cache: bool = True,
+    jobs: int = 1,
+) -> list[SpecStatus]:
+    """List all ongoing specs with their status.
+
+    Parsed document facts are kept in ``.cache/status.json`` unless
+    ``use_cache`` is False, in which case every file is parsed from scratch.
+    ``jobs`` > 1 scans documents on that many threads.
+    """
     ongoing = root / ONGOING_DIR
     if not ongoing.exists():
         return []
-    results = []
-    for child in sorted(ongoing.iterdir()):
-        if child.is_dir():
-            results.append(get_spec_status(child))
+    cache = FileCache.load(root, STATUS_CACHE) if use_cache else None
+    with span("walk", dir=ONGOING_DIR):
+        spec_paths = [child for child in sorted(ongoing.iterdir()) if child.is_dir()]
+    results = scan_specs(spec_paths, cache, jobs)
+    if cache is not None:
+        cache.save()
     return results
 
 
-def print_status(root: Path) -> None:
+@traced("render")
+def print_status(root: Path, specs: list[SpecStatus] | None = None) -> None:
     """Print a rich status table of all ongoing specs."""
-    specs = list_ongoing_specs(root)
+    if specs is None:
+        specs = list_ongoing_specs(root)
     if not specs:
         console.print("[dim]No ongoing specs found.[/dim]")
         return
@@ -241,12 +417,15 @@ def print_status(root: Path) -> None:
         console.print(f"  Research: {'yes' if spec.has_research else 'no'}")
 
         if spec.stories:
+            from rich.table import Table
+
             table = Table(show_header=True, header_style="bold")
             table.add_column("Story")
             table.add_column("Functional")
             table.add_column("Technical")
             table.add_column("Tasks")
             table.add_column("Progress")
+            table.add_column("~Tokens", justify="right")
 
             for story in spec.stories:
                 func = "yes" if story.has_functional_spec else "no"
@@ -257,50 +436,74 @@ def print_status(root: Path) -> None:
                     if story.has_tasks
                     else "-"
                 )
-                table.add_row(story.folder, func, tech, tasks, progress)
+                table.add_row(
+                    story.folder, func, tech, tasks, progress, str(story.approx_tokens)
+                )
 
             console.print(table)
 
 
-def print_status_json(root: Path) -> dict:
-    """Return status as a dict (for TOON output consumed by AI agents)."""
-    specs = list_ongoing_specs(root)
-    result = []
-    for spec in specs:
-        stories_data = []
-        for s in spec.stories:
-            stories_data.append(
-                {
-                    "folder": s.folder,
-                    "name": s.name,
-                    "has_functional_spec": s.has_functional_spec,
-                    "has_technical_spec": s.has_technical_spec,
-                    "has_data_model": s.has_data_model,
-                    "has_api_contract": s.has_api_contract,
-                    "has_test_plan": s.has_test_plan,
-                    "has_manual_test_plan": s.has_manual_test_plan,
-                    "has_tasks": s.has_tasks,
-                    "tasks_total": s.tasks_total,
-                    "tasks_done": s.tasks_done,
-                    "functional_spec_status": s.functional_spec_status.value,
-                    "technical_spec_status": s.technical_spec_status.value,
-                    "tasks_status": s.tasks_status.value,
-                }
-            )
-        result.append(
+def print_status_json(root: Path, specs: list[SpecStatus] | None = None) -> dict:
+    """Return status as a dict (for TOON output consumed by AI agents).
+
+    Pass ``specs`` from an earlier ``list_ongoing_specs`` call to reuse that
+    scan instead of walking ``ongoing/`` again.
+    """
+    if specs is None:
+        specs = list_ongoing_specs(root)
+    return {"ongoing": [spec_to_dict(spec) for spec in specs]}
+
+
+def spec_to_dict(spec: SpecStatus) -> dict:
+    """Return the TOON/JSON representation of a single spec."""
+    stories_data = []
+    for s in spec.stories:
+        stories_data.append(
             {
-                "name": spec.name,
-                "path": str(spec.path),
-                "phase": spec.phase.value,
-                "has_proposal": spec.has_proposal,
-                "has_index": spec.has_index,
-                "has_research": spec.has_research,
-                "proposal_status": spec.proposal_status.value,
-                "stories": stories_data,
+                "folder": s.folder,
+                "name": s.name,
+                "has_functional_spec": s.has_functional_spec,
+                "has_technical_spec": s.has_technical_spec,
+                "has_data_model": s.has_data_model,
+                "has_api_contract": s.has_api_contract,
+                "has_test_plan": s.has_test_plan,
+                "has_manual_test_plan": s.has_manual_test_plan,
+                "has_tasks": s.has_tasks,
+                "tasks_total": s.tasks_total,
+                "tasks_done": s.tasks_done,
+                "functional_spec_status": s.functional_spec_status.value,
+                "technical_spec_status": s.technical_spec_status.value,
+                "tasks_status": s.tasks_status.value,
+                "bytes": s.bytes,
+                "approx_tokens": s.approx_tokens,
             }
         )
-    return {"ongoing": result}
-
+    documents = [
+        {"path": d.name, "bytes": d.bytes, "approx_tokens": d.approx_tokens}
+        for d in spec.documents
+    ]
+    for s in spec.stories:
+        documents += [
+            {
+                "path": f"specs/{s.folder}/{d.name}",
+                "bytes": d.bytes,
+                "approx_tokens": d.approx_tokens,
+            }
+            for d in s.documents
+        ]
+    return {
+        "name": spec.name,
+        "path": str(spec.path),
+        "phase": spec.phase.value,
+        "has_proposal": spec.has_proposal,
+        "has_index": spec.has_index,
+        "has_research": spec.has_research,
+        "proposal_status": spec.proposal_status.value,
+        "bytes": sum(d["bytes"] for d in documents),
+        "approx_tokens": sum(d["approx_tokens"] for d in documents),
+        "stories": stories_data,
+        "documents": documents,
+    }
 
 
 def stories_needing_work(spec: SpecStatus) -> list[dict]:
@@ -339,60 +542,14 @@ def extract_next_task(content: str) -> dict | None:
     - description: expanded description if available (under ### Details)
     - context: context/implementation notes if available (under ### Implementation Context)
     """
-    lines = content.split("\n")
-
-    for i, line in enumerate(lines):
-        # Look for unchecked task boxes
-        if re.match(r"^- \[ \]", line):
-            task_text = line.replace("- [ ] ", "").strip()
-            current_task: dict = {
-                "task_text": task_text,
-                "description": None,
-                "context": None,
-            }
-
-            # Look ahead for details and context
-            j = i + 1
-            current_section = None
-            section_content: list[str] = []
-
-            while j < len(lines):
-                next_line = lines[j]
-
-                # Stop at next task
-                if re.match(r"^- \[[ x]\]", next_line):
-                    break
-
-                # Check for section headers
-                if next_line.startswith("### "):
-                    if current_section and section_content:
-                        content_text = "\n".join(section_content).strip()
-                        if current_section == "Details":
-                            current_task["description"] = content_text
-                        elif current_section in (
-                            "Context",
-                            "Implementation Context",
-                        ):
-                            current_task["context"] = content_text
-
-                    current_section = next_line.replace("### ", "").strip()
-                    section_content = []
-                elif current_section and next_line.strip():
-                    section_content.append(next_line)
-
-                j += 1
-
-            # Save last section
-            if current_section and section_content:
-                content_text = "\n".join(section_content).strip()
-                if current_section == "Details":
-                    current_task["description"] = content_text
-                elif current_section in ("Context", "Implementation Context"):
-                    current_task["context"] = content_text
-
-            return current_task
-
-    return None
+    task = parse_tasks(content).next_open()
+    if task is None:
+        return None
+    return {
+        "task_text": task.text,
+        "description": task.details,
+        "context": task.context,
+    }
 
 
 def list_story_files(story_dir: Path) -> list[dict]:
@@ -419,15 +576,96 @@ def list_story_files(story_dir: Path) -> list[dict]:
 
 
 # ---------------------------------------------------------------------------
-# Truth tree display (moved from commands/truth.py)
+# Truth tree walking
 # ---------------------------------------------------------------------------
 
 
-def build_truth_tree(directory: Path, tree: Tree) -> None:
-    """Recursively build a rich Tree from a directory."""
-    for child in sorted(directory.iterdir()):
-        if child.is_dir():
-            branch = tree.add(f"[bold]{child.name}/[/bold]")
-            build_truth_tree(child, branch)
-        else:
-            tree.add(child.name)
+def _sorted_entries(directory: Path) -> list[os.DirEntry]:
+    """List a directory in name order, without hidden entries."""
+    iostats.count("scandir")
+    try:
+        with os.scandir(directory) as it:
+            return sorted((e for e in it if not e.name.startswith(".")), key=lambda e: e.name)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _matches(rel: str, glob: str | None) -> bool:
+    """Match a file against ``glob``: by name, or by path if it has a slash."""
+    if glob is None:
+        return True
+    return fnmatch(rel if "/" in glob else rel.rsplit("/", 1)[-1], glob)
+
+
+def _count_tree(directory: Path, rel: str, glob: str | None) -> tuple[int, int]:
+    """Count (matching files, directories) below a directory."""
+    files = dirs = 0
+    for entry in _sorted_entries(directory):
+        child = f"{rel}/{entry.name}"
+        if entry.is_dir():
+            sub_files, sub_dirs = _count_tree(Path(entry.path), child, glob)
+            files += sub_files
+            dirs += sub_dirs + 1
+        elif _matches(child, glob):
+            files += 1
+    return files, dirs
+
+
+def iter_truth_tree(
+    truth_dir: Path,
+    prefix: str = "",
+    max_depth: int | None = None,
+    glob: str | None = None,
+    max_entries: int | None = None,
+) -> Iterator[TruthTreeEntry]:
+    """Walk truth/ depth-first, yielding one row per entry as it is visited.
+
+    Only the listings of the directories on the current path are held, so
+    output can be streamed.  ``prefix`` keeps paths that start with it (e.g.
+    ``platform`` or ``tenant/inv``); directories at ``max_depth`` are
+    summarised by ``collapsed`` rows; ``glob`` keeps matching files and the
+    directories containing them; ``max_entries`` cuts long directories short
+    with a ``more`` row.
+    """
+    prefix = prefix.strip("/")
+
+    def walk(directory: Path, rel: str, depth: int) -> Iterator[TruthTreeEntry]:
+        shown = 0
+        left_files = left_dirs = 0
+        for entry in _sorted_entries(directory):
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            is_dir = entry.is_dir()
+            if prefix and not (
+                child.startswith(prefix) or (is_dir and prefix.startswith(f"{child}/"))
+            ):
+                continue
+            if not is_dir and not _matches(child, glob):
+                continue
+            if max_entries is not None and shown >= max_entries:
+                if is_dir:
+                    left_dirs += 1
+                else:
+                    left_files += 1
+                continue
+            if not is_dir:
+                shown += 1
+                yield TruthTreeEntry(child, depth, "file")
+            elif max_depth is not None and depth >= max_depth:
+                files, dirs = _count_tree(Path(entry.path), child, glob)
+                if files or glob is None:
+                    shown += 1
+                    yield TruthTreeEntry(child, depth, "collapsed", files, dirs)
+            else:
+                rows = walk(Path(entry.path), child, depth + 1)
+                first = next(rows, None)
+                # With a glob, directories without matches are left out
+                if first is not None or glob is None:
+                    shown += 1
+                    yield TruthTreeEntry(child, depth, "dir")
+                    if first is not None:
+                        yield first
+                        yield from rows
+        if left_files or left_dirs:
+            yield TruthTreeEntry(rel, depth, "more", left_files, left_dirs)
+
+    yield from walk(truth_dir, "", 0)
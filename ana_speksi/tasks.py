@@ -0,0 +1,129 @@
+"""Single-pass parser for tasks.md files.
+
+``parse_tasks`` walks the file once and returns a ``TaskIndex`` that answers
+the questions the CLI asks about a task list -- how many tasks, how many are
+done, which one is next -- and can toggle a checkbox without rescanning.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+_TASK_RE = re.compile(r"- \[([ x])\](.*)")
+_HEADING_RE = re.compile(r"(#{1,3}) (.*)")
+_TASK_ID_RE = re.compile(r"P\d+\.T\d+")
+
+# ``### <name>`` blocks below a task that belong to that task.
+_DETAIL_SECTIONS = {
+    "Details": "details",
+    "Context": "context",
+    "Implementation Context": "context",
+}
+
+
+@dataclass
+class Task:
+    """A single checkbox task in tasks.md."""
+
+    line: int
+    offset: int
+    checked: bool
+    text: str
+    section: str | None = None
+    details: str | None = None
+    context: str | None = None
+
+    @property
+    def task_id(self) -> str | None:
+        """Return the ``P##.T###`` identifier of the task, if any."""
+        match = _TASK_ID_RE.match(self.text)
+        return match.group(0) if match else None
+
+
+@dataclass
+class TaskIndex:
+    """All tasks of a tasks.md file, in file order."""
+
+    content: str
+    tasks: list[Task] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def done(self) -> int:
+        return sum(1 for t in self.tasks if t.checked)
+
+    def next_open(self) -> Task | None:
+        """Return the first unchecked task."""
+        return next((t for t in self.tasks if not t.checked), None)
+
+    def find(self, task_id: str) -> Task | None:
+        """Return the task with the given ``P##.T###`` identifier."""
+        return next((t for t in self.tasks if t.task_id == task_id), None)
+
+    def toggle(self, task: Task, checked: bool = True) -> str:
+        """Return the file content with ``task``'s checkbox set to ``checked``.
+
+        The index itself is updated in place so further queries stay valid.
+        """
+        mark = "x" if checked else " "
+        pos = task.offset + 3
+        self.content = self.content[:pos] + mark + self.content[pos + 1 :]
+        task.checked = checked
+        return self.content
+
+
+def parse_tasks(content: str) -> TaskIndex:
+    """Parse tasks.md content into a ``TaskIndex`` in a single pass.
+
+    Each task records the heading it sits under and the text of any
+    ``### Details`` / ``### Implementation Context`` blocks that follow it
+    before the next task.  Only ``#`` to ``###`` headings outside code
+    fences start a new block; deeper headings and fenced lines (such as
+    shell comments) are block content.
+    """
+    index = TaskIndex(content=content)
+    current: Task | None = None
+    heading: str | None = None
+    block: str | None = None
+    block_lines: list[str] = []
+    in_fence = False
+
+    def flush_block() -> None:
+        if current is not None and block in _DETAIL_SECTIONS and block_lines:
+            setattr(current, _DETAIL_SECTIONS[block], "\n".join(block_lines).strip())
+
+    offset = 0
+    for lineno, raw in enumerate(content.splitlines(keepends=True)):
+        line = raw.rstrip("\r\n")
+        task = None if in_fence else _TASK_RE.match(line)
+        head = None if in_fence else _HEADING_RE.match(line)
+        if task:
+            flush_block()
+            current = Task(
+                line=lineno,
+                offset=offset,
+                checked=task.group(1) == "x",
+                text=task.group(2).strip(),
+                section=heading,
+            )
+            index.tasks.append(current)
+            block, block_lines = None, []
+        elif head:
+            name = head.group(2).strip()
+            flush_block()
+            is_block = current is not None and len(head.group(1)) == 3
+            block, block_lines = (name if is_block else None), []
+            if name not in _DETAIL_SECTIONS:
+                heading = name
+        else:
+            if line.lstrip().startswith("```"):
+                in_fence = not in_fence
+            if block is not None and line.strip():
+                block_lines.append(line)
+        offset += len(raw)
+    flush_block()
+    return index
@@ -0,0 +1,257 @@
+"""Full-text index over ``truth/`` with BM25-ranked search.
+
+Every truth document is split into sections at its markdown headings, and
+each section is the unit that is ranked.  The index is kept in
+``.cache/truth-index.json``:
+
+- ``files`` maps a truth path to its stat key and content hash, so a warm
+  run reads no documents at all;
+- ``docs`` maps a content hash to the document's sections (heading, line,
+  length in terms) and its postings (term -> [[section, term frequency]]).
+
+Documents are keyed by hash, so a file that is moved or copied (e.g. by
+as-truth-rearrange) is not tokenized again, and only new or changed files
+are read and tokenized on a refresh.  Snippets are cut from the matching
+documents at query time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from ana_speksi import iostats
+from ana_speksi.cache import get_cache_dir, stat_key
+from ana_speksi.fsutil import atomic_write_text, read_bytes, read_text, walk_files
+from ana_speksi.models import CACHE_DIR, TRUTH_DIR
+from ana_speksi.profiling import span, traced
+
+TRUTH_INDEX = "truth-index.json"
+
+# Bump when tokenization or the stored shape changes.
+TRUTH_INDEX_VERSION = 1
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SNIPPET_CHARS = 200
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have if in is it its of on or "
+    "that the this to was were will with".split()
+)
+
+
+@dataclass
+class SearchHit:
+    """One ranked section of a truth document."""
+
+    file: str
+    heading: str
+    line: int
+    score: float
+    snippet: str = ""
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-case word tokens, without stopwords and single characters."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def split_sections(content: str) -> list[tuple[str, int, str]]:
+    """Split markdown into ``(heading, first line, text)`` sections.
+
+    Text before the first heading forms a section with an empty heading.
+    Headings inside fenced code blocks do not start a section.
+    """
+    sections: list[tuple[str, int, list[str]]] = [("", 1, [])]
+    in_fence = False
+    for number, line in enumerate(content.split("\n"), start=1):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match:
+            sections.append((match.group(2), number, [line]))
+        else:
+            sections[-1][2].append(line)
+    return [
+        (heading, line, "\n".join(lines))
+        for heading, line, lines in sections
+        if heading or any(l.strip() for l in lines)
+    ]
+
+
+def index_document(content: str) -> dict:
+    """Build the stored index entry for one document."""
+    sections = []
+    postings: dict[str, list[list[int]]] = {}
+    for number, (heading, line, text) in enumerate(split_sections(content)):
+        counts = Counter(tokenize(text))
+        sections.append([heading, line, sum(counts.values())])
+        for term, tf in counts.items():
+            postings.setdefault(term, []).append([number, tf])
+    return {"sections": sections, "postings": postings}
+
+
+class TruthIndex:
+    """The loaded index: truth path -> hash and hash -> indexed document."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.files: dict[str, dict] = {}
+        self.docs: dict[str, dict] = {}
+        self._dirty = False
+
+    @property
+    def path(self) -> Path:
+        return self.root / CACHE_DIR / TRUTH_INDEX
+
+    @classmethod
+    @traced("truth index load")
+    def load(cls, root: Path) -> TruthIndex:
+        index = cls(root)
+        try:
+            data = json.loads(read_text(index.path))
+            if data.get("version") == TRUTH_INDEX_VERSION:
+                index.files = data["files"]
+                index.docs = data["docs"]
+        except Exception:
+            pass
+        return index
+
+    @traced("truth index refresh")
+    def refresh(self) -> None:
+        """Bring the index in line with truth/, re-indexing changed files only."""
+        files: dict[str, dict] = {}
+        for rel, entry in walk_files(self.root / TRUTH_DIR):
+            iostats.count("stat")
+            key = stat_key(entry.stat())
+            known = self.files.get(rel)
+            if known is not None and known["key"] == key and known["hash"] in self.docs:
+                files[rel] = known
+                continue
+            data = read_bytes(Path(entry.path))
+            digest = hashlib.sha1(data).hexdigest()
+            if digest not in self.docs:
+                with span("parse", file=rel):
+                    self.docs[digest] = index_document(
+                        data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+                    )
+            files[rel] = {"key": key, "hash": digest}
+            self._dirty = True
+
+        if files.keys() != self.files.keys():
+            self._dirty = True
+        self.files = files
+        used = {f["hash"] for f in files.values()}
+        self.docs = {h: doc for h, doc in self.docs.items() if h in used}
+
+    def content_hash(self) -> str:
+        """Identify the indexed content: every truth path and its content hash."""
+        digest = hashlib.sha1()
+        for rel in sorted(self.files):
+            digest.update(f"{rel}\0{self.files[rel]['hash']}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def save(self) -> None:
+        """Write the index back if the refresh changed anything."""
+        if not self._dirty:
+            return
+        try:
+            get_cache_dir(self.root)
+            atomic_write_text(
+                self.path,
+                json.dumps({"version": TRUTH_INDEX_VERSION, "files": self.files, "docs": self.docs}),
+            )
+        except OSError:
+            return
+        self._dirty = False
+
+    @traced("truth search")
+    def search(self, query: str, limit: int = 5) -> list[SearchHit]:
+        """Return the best ``limit`` sections for ``query``, ranked by BM25."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.files:
+            return []
+
+        # Collection statistics count a document once per file holding it
+        copies = Counter(f["hash"] for f in self.files.values())
+        sections = 0
+        length = 0
+        for digest, n in copies.items():
+            doc_sections = self.docs[digest]["sections"]
+            sections += n * len(doc_sections)
+            length += n * sum(s[2] for s in doc_sections)
+        avg_length = length / sections if sections else 1.0
+
+        matches: dict[str, list[tuple[str, int, int]]] = {}
+        for term in terms:
+            found = matches.setdefault(term, [])
+            for digest in copies:
+                for section, tf in self.docs[digest]["postings"].get(term, ()):
+                    found.append((digest, section, tf))
+
+        scores: Counter[tuple[str, int]] = Counter()
+        for term, found in matches.items():
+            df = sum(copies[digest] for digest, _, _ in found)
+            idf = math.log(1 + (sections - df + 0.5) / (df + 0.5))
+            for digest, section, tf in found:
+                doc_length = self.docs[digest]["sections"][section][2]
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * doc_length / avg_length)
+                scores[(digest, section)] += idf * tf * (BM25_K1 + 1) / norm
+
+        by_hash: dict[str, list[str]] = {}
+        for rel, f in self.files.items():
+            by_hash.setdefault(f["hash"], []).append(rel)
+        hits = []
+        for (digest, section), score in scores.most_common():
+            heading, line, _ = self.docs[digest]["sections"][section]
+            for rel in by_hash[digest]:
+                hits.append(SearchHit(f"{TRUTH_DIR}/{rel}", heading, line, round(score, 3)))
+            if len(hits) >= limit:
+                break
+        hits = hits[:limit]
+        for hit in hits:
+            hit.snippet = self._snippet(hit, terms)
+        return hits
+
+    def _snippet(self, hit: SearchHit, terms: list[str]) -> str:
+        """Cut a short excerpt around the first query term in the hit's section."""
+        try:
+            content = read_text(self.root / hit.file, errors="replace")
+        except OSError:
+            return ""
+        lines = content.split("\n")
+        body = next((body for _, line, body in split_sections(content) if line == hit.line), "")
+        if hit.heading:
+            body = body.partition("\n")[2]
+        text = " ".join(body.split())
+        if not text:
+            # A heading directly followed by subsections: show what follows
+            text = " ".join(" ".join(lines[hit.line : hit.line + 20]).split())
+        lowered = text.lower()
+        positions = [p for p in (lowered.find(t) for t in terms) if p >= 0]
+        start = max(0, min(positions) - SNIPPET_CHARS // 4) if positions else 0
+        snippet = text[start : start + SNIPPET_CHARS]
+        if start > 0:
+            snippet = "..." + snippet.split(" ", 1)[-1]
+        if start + SNIPPET_CHARS < len(text):
+            snippet = snippet.rsplit(" ", 1)[0] + "..."
+        return snippet
+
+
+def search_truth(root: Path, query: str, limit: int = 5) -> list[SearchHit]:
+    """Refresh the truth index as needed and search it."""
+    index = TruthIndex.load(root)
+    index.refresh()
+    index.save()
+    return index.search(query, limit)
@@ -0,0 +1,131 @@
+"""Content-addressed manifest of truth/ documents.
+
+Each truth file is described by its content hash, size, approximate token
+count and top-level (``#`` and ``##``) headings.  The per-file facts live in
+the stat-keyed ``.cache/manifest.json``, so only changed files are read.
+
+The manifest as a whole is identified by a hash over its (path, content
+hash) pairs.  Every manifest handed out is also stored as a snapshot in
+``.cache/manifests/<hash>.json``, so a later call given that hash can return
+only the entries that changed since.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from ana_speksi import iostats
+from ana_speksi.cache import FileCache, get_cache_dir
+from ana_speksi.fsutil import atomic_write_text, read_bytes, read_text, walk_files
+from ana_speksi.models import CACHE_DIR, TRUTH_DIR
+from ana_speksi.profiling import traced
+from ana_speksi.tokens import approx_tokens
+
+MANIFEST_CACHE = "manifest.json"
+SNAPSHOT_DIR = "manifests"
+
+# Snapshots kept; older ones are deleted when a new one is written
+MAX_SNAPSHOTS = 20
+
+# Hex digits of the content and manifest hashes
+HASH_CHARS = 16
+
+_TOP_HEADING_RE = re.compile(r"^#{1,2}\s+(.*?)\s*#*\s*$")
+
+
+def top_headings(content: str) -> list[str]:
+    """Return the ``#`` and ``##`` headings, skipping fenced code blocks."""
+    headings = []
+    in_fence = False
+    for line in content.split("\n"):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("#"):
+            match = _TOP_HEADING_RE.match(line)
+            if match:
+                headings.append(match.group(1))
+    return headings
+
+
+def file_facts(data: bytes) -> dict:
+    """Describe one file's content."""
+    return {
+        "hash": hashlib.sha1(data).hexdigest()[:HASH_CHARS],
+        "bytes": len(data),
+        "approx_tokens": approx_tokens(data),
+        "headings": top_headings(
+            data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+        ),
+    }
+
+
+@traced("truth manifest")
+def build_manifest(root: Path) -> list[dict]:
+    """Return a manifest entry (path relative to root plus facts) per truth file."""
+    cache = FileCache.load(root, MANIFEST_CACHE)
+    entries = []
+    for rel, entry in walk_files(root / TRUTH_DIR):
+        path = Path(entry.path)
+        iostats.count("stat")
+        st = entry.stat()
+        facts = cache.get(path, st)
+        if facts is None:
+            facts = file_facts(read_bytes(path))
+            cache.put(path, st, facts)
+        entries.append({"path": f"{TRUTH_DIR}/{rel}", **facts})
+    cache.save()
+    return entries
+
+
+def manifest_hash(entries: list[dict]) -> str:
+    """Identify a manifest by its paths and content hashes."""
+    digest = hashlib.sha1()
+    for entry in sorted(entries, key=lambda e: e["path"]):
+        digest.update(f"{entry['path']}\0{entry['hash']}\n".encode("utf-8"))
+    return digest.hexdigest()[:HASH_CHARS]
+
+
+def save_snapshot(root: Path, digest: str, entries: list[dict]) -> None:
+    """Store path -> content hash for ``digest`` and drop the oldest snapshots.
+
+    Nothing is stored when ``root`` is not an initialized ana-speksi folder.
+    """
+    if not root.is_dir():
+        return
+    try:
+        directory = get_cache_dir(root) / SNAPSHOT_DIR
+        path = directory / f"{digest}.json"
+        if path.exists():
+            os.utime(path)
+            return
+        directory.mkdir(exist_ok=True)
+        atomic_write_text(path, json.dumps({e["path"]: e["hash"] for e in entries}))
+        snapshots = sorted(directory.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+        for old in snapshots[:-MAX_SNAPSHOTS]:
+            old.unlink()
+    except OSError:
+        pass
+
+
+def load_snapshot(root: Path, digest: str) -> dict[str, str] | None:
+    """Return path -> content hash of an earlier manifest, or None if unknown."""
+    if not re.fullmatch(r"[0-9a-f]+", digest):
+        return None
+    try:
+        return json.loads(read_text(root / CACHE_DIR / SNAPSHOT_DIR / f"{digest}.json"))
+    except (OSError, ValueError):
+        return None
+
+
+def manifest_delta(
+    entries: list[dict], previous: dict[str, str]
+) -> tuple[list[dict], list[str]]:
+    """Return (new or changed entries, removed paths) relative to ``previous``."""
+    changed = [e for e in entries if previous.get(e["path"]) != e["hash"]]
+    current = {e["path"] for e in entries}
+    removed = sorted(p for p in previous if p not in current)
+    return changed, removed
@@ -0,0 +1,298 @@
+"""Incremental workspace model and file watching for ``status --watch``.
+
+``WorkspaceModel`` keeps every ongoing spec in memory and, given a set of
+changed paths, re-scans only the affected story folders or spec-level
+documents.  Changes are detected with inotify on Linux (through ctypes, no
+extra dependency) and by periodic stat polling everywhere else.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from ana_speksi.cache import FileCache, stat_key
+from ana_speksi.models import ONGOING_DIR, SpecStatus
+from ana_speksi.status import (
+    resolve_phase,
+    scan_spec_docs,
+    scan_specs,
+    scan_story,
+    spec_to_dict,
+    update_index_task_counts,
+)
+
+# Changes arriving within this window are handled as one batch, so an editor
+# writing a temp file and renaming it over the original triggers one update.
+DEBOUNCE_SECONDS = 0.02
+
+
+# ---------------------------------------------------------------------------
+# In-memory model
+# ---------------------------------------------------------------------------
+
+
+class WorkspaceModel:
+    """Parsed state of all ongoing specs, updated incrementally."""
+
+    def __init__(self, root: Path, cache: FileCache | None = None) -> None:
+        self.root = root
+        self.ongoing = root / ONGOING_DIR
+        self.cache = cache
+        self.specs: dict[str, SpecStatus] = {}
+
+    def load(self) -> None:
+        """Scan all ongoing specs from scratch and sync their index.md counts.
+
+        The sync runs once here because counts may already disagree with
+        tasks.md before the first change is seen.
+        """
+        paths = sorted(p for p in self.ongoing.iterdir() if p.is_dir())
+        self.specs = {s.name: s for s in scan_specs(paths, self.cache)}
+        for spec in self.specs.values():
+            update_index_task_counts(spec.path, spec.stories)
+
+    def sorted_specs(self) -> list[SpecStatus]:
+        return [self.specs[name] for name in sorted(self.specs)]
+
+    def apply(self, paths: set[Path]) -> tuple[list[SpecStatus], list[str]]:
+        """Re-scan what ``paths`` touched and return (changed, removed) specs.
+
+        A spec is only reported as changed when its serialized status differs
+        from before, so e.g. rewriting index.md counts is not a change.  When
+        a tasks.md changed or a new spec appeared, the spec's index.md counts
+        are synced as well.
+        """
+        dirty: dict[str, set[str] | None] = {}
+        tasks_changed: set[str] = set()
+        for path in paths:
+            try:
+                parts = path.relative_to(self.ongoing).parts
+            except ValueError:
+                continue
+            if not parts:
+                # Event queue overflow or similar -- rescan everything
+                dirty = {name: None for name in self.specs}
+                for child in self.ongoing.iterdir():
+                    if child.is_dir():
+                        dirty[child.name] = None
+                break
+            name = parts[0]
+            if len(parts) == 1:
+                dirty[name] = None
+                continue
+            stories = dirty.setdefault(name, set())
+            if stories is not None and len(parts) >= 3 and parts[1] == "specs":
+                stories.add(parts[2])
+            if path.name == "tasks.md":
+                tasks_changed.add(name)
+
+        changed: list[SpecStatus] = []
+        removed: list[str] = []
+        for name, stories in sorted(dirty.items()):
+            before = self.specs.get(name)
+            after = self._rescan_spec(name, stories)
+            if after is None:
+                if before is not None:
+                    removed.append(name)
+                continue
+            if name in tasks_changed or before is None:
+                update_index_task_counts(after.path, after.stories)
+            if before is None or spec_to_dict(before) != spec_to_dict(after):
+                changed.append(after)
+        return changed, removed
+
+    def _rescan_spec(self, name: str, stories: set[str] | None) -> SpecStatus | None:
+        """Re-scan a spec, reusing unchanged stories unless ``stories`` is None."""
+        spec_path = self.ongoing / name
+        if not spec_path.is_dir():
+            self.specs.pop(name, None)
+            return None
+        spec, story_dirs = scan_spec_docs(spec_path, self.cache)
+        previous = self.specs.get(name)
+        known = {s.folder: s for s in previous.stories} if previous else {}
+        for story_dir in story_dirs:
+            folder = story_dir.name
+            if stories is not None and folder in known and folder not in stories:
+                spec.stories.append(known[folder])
+            else:
+                spec.stories.append(scan_story(story_dir, self.cache))
+        spec.phase = resolve_phase(spec)
+        self.specs[name] = spec
+        return spec
+
+
+# ---------------------------------------------------------------------------
+# Watchers
+# ---------------------------------------------------------------------------
+
+
+class PollingWatcher:
+    """Detect changes by comparing stat keys of all files every ``interval``."""
+
+    def __init__(self, directory: Path, interval: float = 0.5) -> None:
+        self.directory = directory
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> dict[str, list[int]]:
+        snapshot: dict[str, list[int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            snapshot[dirpath] = []
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    snapshot[path] = stat_key(os.stat(path))
+                except FileNotFoundError:
+                    pass
+        return snapshot
+
+    def wait(self) -> set[Path]:
+        """Block until something changed and return the changed paths."""
+        while True:
+            time.sleep(self.interval)
+            current = self._take_snapshot()
+            changed = {
+                Path(p)
+                for p in current.keys() | self._snapshot.keys()
+                if current.get(p) != self._snapshot.get(p)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Recursive directory watcher on top of Linux inotify."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+    MASK = (
+        IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+    )
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watches: dict[int, Path] = {}
+        self._add_tree(directory)
+
+    @classmethod
+    def available(cls) -> bool:
+        return sys.platform.startswith("linux") and bool(ctypes.util.find_library("c"))
+
+    def _add_tree(self, directory: Path) -> None:
+        for dirpath, _, _ in os.walk(directory):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(dirpath), self.MASK
+            )
+            if wd >= 0:
+                self._watches[wd] = Path(dirpath)
+
+    def _read_events(self) -> set[Path]:
+        changed: set[Path] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                changed.add(self.directory)
+                continue
+            base = self._watches.get(wd)
+            if base is None:
+                continue
+            if mask & self.IN_DELETE_SELF:
+                self._watches.pop(wd, None)
+            path = base / os.fsdecode(name) if name else base
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                self._add_tree(path)
+            changed.add(path)
+        return changed
+
+    def wait(self) -> set[Path]:
+        """Block until something changed and return the changed paths."""
+        while True:
+            select.select([self._fd], [], [])
+            changed = self._read_events()
+            # Collect the rest of a burst (temp file + rename, several files)
+            while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+                changed |= self._read_events()
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(
+    directory: Path,
+    poll: bool = False,
+    interval: float = 0.5,
+) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher when possible, else a polling watcher."""
+    if not poll and InotifyWatcher.available():
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, interval)
+
+
+def watch_status(
+    root: Path,
+    on_change,
+    cache: FileCache | None = None,
+    poll: bool = False,
+    interval: float = 0.5,
+) -> None:
+    """Keep the workspace model up to date until interrupted.
+
+    ``on_change(model, changed, removed)`` is called once with every spec
+    after the initial scan and then after each batch of changes that
+    altered at least one spec.
+    """
+    model = WorkspaceModel(root, cache)
+    model.load()
+    on_change(model, model.sorted_specs(), [])
+    watcher = make_watcher(model.ongoing, poll, interval)
+    try:
+        while True:
+            changed, removed = model.apply(watcher.wait())
+            if changed or removed:
+                on_change(model, changed, removed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if cache is not None:
+            cache.save()
@@ -0,0 +1,439 @@
+"""Synthetic workspaces for benchmarks and profiling.
+
+``generate_workspace`` fills the real skill templates with seeded content:
+ongoing specs spread over every phase, a deep truth/ hierarchy and a large
+archive/.  The same arguments always produce byte-identical files, so runs
+against generated workspaces are comparable.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+from ana_speksi.models import (
+    ANA_SPEKSI_DIR,
+    ARCHIVE_DIR,
+    ONGOING_DIR,
+    PHASE_ORDER,
+    SUBDIRS,
+    TRUTH_DATA_MODELS_DIR,
+    TRUTH_DIR,
+    TRUTH_ENUMS_DIR,
+    GeneratedWorkspace,
+    Phase,
+)
+from ana_speksi.resources import read_resource
+
+WORDS = (
+    "account", "audit", "billing", "booking", "cache", "calendar", "catalog",
+    "checkout", "contract", "customer", "dashboard", "delivery", "document",
+    "export", "feedback", "import", "inventory", "invoice", "ledger", "login",
+    "message", "notification", "order", "payment", "permission", "pricing",
+    "profile", "project", "report", "review", "schedule", "search", "session",
+    "settings", "shipment", "subscription", "survey", "tenant", "ticket",
+    "upload", "user", "voucher", "warehouse", "webhook", "workflow",
+)
+
+# Distinct feature names available per truth/ level
+MAX_TRUTH_BREADTH = len(WORDS)
+
+# Relative weights of the phases ongoing specs are generated in; most real
+# work sits in codify.
+PHASE_WEIGHTS = {
+    Phase.PROPOSAL: 1,
+    Phase.STORIFY: 1,
+    Phase.RESEARCH: 1,
+    Phase.TECHIFY: 1,
+    Phase.TASKIFY: 1,
+    Phase.CODIFY: 4,
+    Phase.DOCUFY: 1,
+}
+
+BASE_DATE = date(2025, 1, 1)
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_STATUS_RE = re.compile(r"^\*\*Status\*\*: .*$", re.MULTILINE)
+_FENCE = "````markdown\n"
+_DOC_LINK_RE = re.compile(r"\]\((?P<target>[^)#\s]+\.md)\)")
+
+
+class _KeepMissing(dict):
+    """``format_map`` mapping that leaves unknown placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+class _Builder:
+    """Seeded content source that also counts the files it writes."""
+
+    def __init__(self, seed: int) -> None:
+        self.rng = random.Random(seed)
+        self.files = 0
+
+    def words(self, count: int) -> list[str]:
+        return self.rng.sample(WORDS, count)
+
+    def slug(self) -> str:
+        return "-".join(self.words(2))
+
+    def day(self) -> str:
+        return (BASE_DATE + timedelta(days=self.rng.randint(0, 365))).isoformat()
+
+    def sentence(self) -> str:
+        words = [self.rng.choice(WORDS) for _ in range(self.rng.randint(6, 14))]
+        return " ".join(words).capitalize() + "."
+
+    def paragraph(self) -> str:
+        return " ".join(self.sentence() for _ in range(self.rng.randint(2, 6)))
+
+    def render(self, skill: str, filename: str, **values: str) -> str:
+        """Fill a skill template; guidance comments become generated prose."""
+        content = read_resource(skill, filename)
+        if content.startswith(_FENCE):
+            # Truth templates are wrapped in a markdown code fence
+            content = content[len(_FENCE) :].rstrip().removesuffix("````") + "\n"
+        content = content.format_map(_KeepMissing(values))
+        return _COMMENT_RE.sub(lambda _: self.paragraph(), content)
+
+    def write(self, path: Path, content: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8", newline="\n")
+        self.files += 1
+
+
+def _with_status(content: str, status: str) -> str:
+    return _STATUS_RE.sub(f"**Status**: {status}", content, count=1)
+
+
+def _mixed_statuses(b: _Builder, count: int) -> list[str]:
+    """Statuses for a phase in progress: at least one document is a Draft."""
+    statuses = [b.rng.choice(("Draft", "Accepted")) for _ in range(count)]
+    statuses[b.rng.randrange(count)] = "Draft"
+    return statuses
+
+
+def _tasks_body(b: _Builder, template: str, tasks: int, done: int) -> str:
+    """Replace the template's example phases with ``tasks`` generated tasks."""
+    head, _, rest = template.partition("## Phase 1: Setup")
+    _, _, tail = rest.partition("## Phase 4: Manual Verification")
+    lines: list[str] = []
+    numbers: dict[int, int] = {}
+    titles = {1: "Setup", 2: "Implementation", 3: "Test Automation"}
+    for i in range(tasks):
+        phase = 1 + i * 3 // tasks
+        if phase not in numbers:
+            lines.append(f"## Phase {phase}: {titles[phase]}\n")
+        numbers[phase] = numbers.get(phase, 0) + 1
+        mark = "x" if i < done else " "
+        module, name = b.words(2)
+        lines.append(
+            f"- [{mark}] P{phase:02d}.T{numbers[phase]:03d} {b.sentence()[:-1]} "
+            f"in `src/{module}/{name}.py` **Mandatory to use skills: /{module}-patterns**"
+        )
+        if i + 1 == tasks or 1 + (i + 1) * 3 // tasks != phase:
+            lines.append("")
+    return head + "\n".join(lines) + "\n## Phase 4: Manual Verification" + tail
+
+
+def _index(
+    b: _Builder,
+    name: str,
+    ticket: str,
+    created: str,
+    phase: Phase,
+    stories: list[dict],
+) -> str:
+    """Render index.md with one story block per story and the phase table."""
+    progress: dict[str, str] = {}
+    for p, key in zip(
+        PHASE_ORDER,
+        ("proposal", "storify", "research", "techify", "taskify", "codify", "docufy"),
+    ):
+        if PHASE_ORDER.index(p) < PHASE_ORDER.index(phase):
+            progress[f"{key}_status"] = "Done"
+        elif p == phase:
+            progress[f"{key}_status"] = "In Progress"
+        else:
+            progress[f"{key}_status"] = "Not Started"
+    content = b.render(
+        "as-storify",
+        "index-template.md",
+        name=name,
+        date=created,
+        phase=phase.value,
+        ticket_id=ticket,
+        generated_with="as-storify",
+        **{k: v for k, v in progress.items() if k != "proposal_status"},
+    )
+    # {proposal_status} is both the document marker and the phase table cell
+    content = content.replace("- [{proposal_status}]", "- [Accepted]").replace(
+        "{proposal_status}", progress["proposal_status"]
+    )
+    head, _, rest = content.partition("#### {NN}-{story-name}")
+    block, _, tail = rest.partition("\n\n## Phase Progress")
+    block = block.split("\n\n", 1)[1].rsplit("\n\n", 1)[0]  # drop trailing prose
+
+    blocks = []
+    for story in stories:
+        text = f"#### {story['folder']}\n\n" + block.replace(
+            "{NN}-{story-name}", story["folder"]
+        )
+        text = text.replace("Not Started", story["implementation"])
+        for doc in ("functional-spec.md", "technical-spec.md", "tasks.md"):
+            status = story.get(doc, "")
+            text = text.replace(f"- [] [{doc}]", f"- [{status}] [{doc}]")
+        if "tasks.md" in story:
+            link = f"[tasks.md](specs/{story['folder']}/tasks.md)"
+            text = text.replace(
+                link, f"{link} ({story['done']}/{story['total']} tasks complete)"
+            )
+        blocks.append(text)
+    return head + "\n\n".join(blocks) + "\n\n## Phase Progress" + tail
+
+
+def _drop_missing_links(content: str, directory: Path) -> str:
+    """Remove the lines linking to documents that were not generated."""
+    return "\n".join(
+        line
+        for line in content.split("\n")
+        if not (m := _DOC_LINK_RE.search(line)) or (directory / m.group("target")).exists()
+    )
+
+
+def _write_spec(
+    b: _Builder,
+    spec_dir: Path,
+    ticket: str,
+    phase: Phase,
+    stories: int,
+    tasks: int,
+) -> None:
+    """Write a spec folder whose documents put it in ``phase``."""
+    name = spec_dir.name
+    created = b.day()
+    order = PHASE_ORDER.index(phase)
+
+    def reached(p: Phase) -> bool:
+        return order >= PHASE_ORDER.index(p)
+
+    def past(p: Phase) -> bool:
+        return order > PHASE_ORDER.index(p)
+
+    proposal = b.render(
+        "as-new",
+        "proposal-template.md",
+        name=name,
+        ticket_id=ticket,
+        date=created,
+        prompt=b.paragraph(),
+        generated_with="as-new",
+    )
+    b.write(
+        spec_dir / "proposal.md",
+        _with_status(proposal, "Accepted" if past(Phase.PROPOSAL) else "Draft"),
+    )
+    if not reached(Phase.STORIFY):
+        return
+
+    def statuses(p: Phase) -> list[str]:
+        return ["Accepted"] * stories if past(p) else _mixed_statuses(b, stories)
+
+    functional = statuses(Phase.STORIFY)
+    technical = statuses(Phase.TECHIFY) if reached(Phase.TECHIFY) else []
+    task_docs = statuses(Phase.TASKIFY) if reached(Phase.TASKIFY) else []
+    if phase == Phase.DOCUFY:
+        done = [tasks] * stories
+    elif phase == Phase.CODIFY:
+        done = [b.rng.randint(0, tasks) for _ in range(stories)]
+        done[b.rng.randrange(stories)] = b.rng.randint(0, tasks - 1)
+    else:
+        done = [0] * stories
+
+    if reached(Phase.TECHIFY):
+        b.write(
+            spec_dir / "research.md",
+            b.render("as-techify", "research-template.md", spec_name=name, date=created),
+        )
+
+    index_stories = []
+    for i in range(stories):
+        story_name = b.slug()
+        folder = f"{i + 1:02d}-{story_name}"
+        story_dir = spec_dir / "specs" / folder
+        values = {
+            "story_name": story_name.replace("-", " ").title(),
+            "spec_name": name,
+            "story_num": f"{i + 1:02d}",
+            "date": created,
+        }
+        entry = {"folder": folder, "implementation": "Not Started"}
+
+        content = b.render(
+            "as-storify", "functional-spec-template.md", generated_with="as-storify", **values
+        )
+        b.write(story_dir / "functional-spec.md", _with_status(content, functional[i]))
+        entry["functional-spec.md"] = functional[i]
+
+        if technical:
+            content = b.render(
+                "as-techify", "technical-spec-template.md", generated_with="as-techify", **values
+            )
+            b.write(story_dir / "technical-spec.md", _with_status(content, technical[i]))
+            entry["technical-spec.md"] = technical[i]
+            for resource in ("test-automation-plan", "manual-testing-plan"):
+                b.write(
+                    story_dir / f"{resource}.md",
+                    b.render("as-techify", f"{resource}-template.md", **values),
+                )
+
+        if task_docs:
+            content = b.render(
+                "as-taskify", "tasks-template.md", generated_with="as-taskify", **values
+            )
+            content = _tasks_body(b, content, tasks, done[i])
+            b.write(story_dir / "tasks.md", _with_status(content, task_docs[i]))
+            entry.update({"tasks.md": task_docs[i], "done": done[i], "total": tasks})
+            if done[i] == tasks:
+                entry["implementation"] = "Done"
+            elif done[i]:
+                entry["implementation"] = "In Progress"
+        index_stories.append(entry)
+
+    index = _index(b, name, ticket, created, phase, index_stories)
+    b.write(spec_dir / "index.md", _drop_missing_links(index, spec_dir))
+
+
+def _write_truth_level(
+    b: _Builder,
+    directory: Path,
+    domain: list[str],
+    depth: int,
+    breadth: int,
+) -> list[str]:
+    """Write ``breadth`` features under ``directory``, recursing ``depth`` levels."""
+    names = b.words(b.rng.randint(1, breadth) if domain else breadth)
+    for name in names:
+        path = domain + [name]
+        values = {
+            "feature_name": name.title(),
+            "domain_path": "/".join(path),
+            "date": b.day(),
+        }
+        for doc in ("functional-spec.md", "technical-spec.md"):
+            b.write(
+                directory / name / doc,
+                b.render("as-docufy", doc.replace(".md", "-template.md"), **values),
+            )
+        if depth > 1:
+            _write_truth_level(b, directory / name, path, depth - 1, breadth)
+    return names
+
+
+def _write_truth(b: _Builder, truth: Path, depth: int, breadth: int) -> None:
+    """Write platform docs, data models, enums and a feature hierarchy."""
+    features = _write_truth_level(b, truth, [], depth, breadth)
+    domains = b.words(breadth)
+    enums = [f"{w}-status" for w in b.words(breadth)]
+
+    b.write(
+        truth / "platform" / "architecture.md",
+        "# Architecture\n\n" + "\n\n".join(b.paragraph() for _ in range(6)) + "\n",
+    )
+    for domain in domains:
+        b.write(
+            truth / TRUTH_DATA_MODELS_DIR / f"{domain}.md",
+            b.render("as-docufy", "data-model-template.md", domain_name=domain.title()),
+        )
+    for enum in enums:
+        b.write(
+            truth / TRUTH_ENUMS_DIR / f"{enum}.md",
+            b.render(
+                "as-docufy",
+                "enum-template.md",
+                enum_name=enum.replace("-", " ").title().replace(" ", ""),
+                domain_name=enum.split("-")[0].title(),
+            ),
+        )
+
+    index = b.render("as-docufy", "index-template.md", date=b.day())
+    entries = {
+        "- [{feature-name}]({feature-name}/)": [f"- [{f}]({f}/)" for f in features],
+        "- [{domain}](data-models/{domain}.md)": [
+            f"- [{d}](data-models/{d}.md)" for d in domains
+        ],
+        "- [{enum-name}](enums/{enum-name}.md)": [f"- [{e}](enums/{e}.md)" for e in enums],
+    }
+    lines = []
+    for line in index.splitlines():
+        for placeholder, links in entries.items():
+            if line.startswith(placeholder):
+                description = line[len(placeholder) :]
+                lines.extend(link + description for link in links)
+                break
+        else:
+            lines.append(line)
+    b.write(truth / "index.md", "\n".join(lines) + "\n")
+
+
+def generate_workspace(
+    target: Path,
+    specs: int = 20,
+    stories: int = 4,
+    tasks: int = 20,
+    archived: int = 50,
+    truth_depth: int = 4,
+    truth_breadth: int = 4,
+    seed: int = 0,
+) -> GeneratedWorkspace:
+    """Create a synthetic ana-speksi/ folder under ``target``.
+
+    Ongoing specs are spread over all phases (the first one is always in
+    codify, so benchmarks have a spec to work on), archive/ holds
+    ``archived`` completed specs and truth/ is ``truth_depth`` levels deep.
+    ``truth_breadth`` is capped at the size of the word list.  Raises
+    ValueError for fewer than one story, task, truth level or truth feature,
+    and FileExistsError if ``target`` already has an ana-speksi/ folder.
+    """
+    for label, value in (
+        ("stories", stories),
+        ("tasks", tasks),
+        ("truth_depth", truth_depth),
+        ("truth_breadth", truth_breadth),
+    ):
+        if value < 1:
+            raise ValueError(f"{label} must be at least 1, got {value}")
+    if specs < 0 or archived < 0:
+        raise ValueError("specs and archived must not be negative")
+    truth_breadth = min(truth_breadth, MAX_TRUTH_BREADTH)
+
+    root = target / ANA_SPEKSI_DIR
+    if root.exists():
+        raise FileExistsError(f"{root} already exists")
+    for sub in SUBDIRS:
+        (root / sub).mkdir(parents=True)
+
+    b = _Builder(seed)
+    result = GeneratedWorkspace(root=root)
+    for i in range(specs):
+        if i == 0:
+            phase = Phase.CODIFY
+        else:
+            phase = b.rng.choices(PHASE_ORDER, [PHASE_WEIGHTS[p] for p in PHASE_ORDER])[0]
+        ticket = f"GEN-{100 + i}"
+        name = f"{ticket}.{b.slug()}"
+        _write_spec(b, root / ONGOING_DIR / name, ticket, phase, stories, tasks)
+        result.phases[name] = phase
+
+    for i in range(archived):
+        ticket = f"GEN-{100 + specs + i}"
+        name = f"{b.day()}-{ticket}.{b.slug()}"
+        _write_spec(b, root / ARCHIVE_DIR / name, ticket, Phase.DOCUFY, stories, tasks)
+        result.archived.append(name)
+
+    _write_truth(b, root / TRUTH_DIR, truth_depth, truth_breadth)
+    result.files = b.files
+    return result
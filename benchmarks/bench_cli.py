@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+End-to-end CLI latency benchmark replaying the command sequences of the skills.
+
+Each session is the list of commands a skill tells the agent to run (e.g. the
+as-codify loop).  Sessions are replayed against generated workspaces
+(ana_speksi.workspace_generator) with an increasing number of ongoing specs,
+every command in a fresh `ana-speksi` process, and wall-clock time and peak
+RSS are recorded per command:
+
+- cold: ana-speksi/.cache is removed right before the command
+- warm: the same command run again straight after, with the caches in place
+
+Before every round one open task is ticked, as the agent would while coding.
+Results are written to a JSON file; pass a previous file with --compare to
+print the p50 change per command.
+Run with: uv run benchmarks/bench_cli.py [--sizes 5,20,80] [--rounds 5] [--out bench-cli.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ana_speksi.models import Phase
+from ana_speksi.workspace_generator import generate_workspace
+
+# Command sequences issued by the shipped skills; {spec} is the spec being coded.
+SESSIONS = {
+    "as-codify": [
+        "accept {spec} --toon",
+        "status --toon",
+        "what-to-code-next {spec} --toon",
+        "sync-counts {spec} --toon",
+        "status --toon",
+    ],
+    "as-continue": [
+        "status --toon",
+        "accept {spec} --toon",
+        "what-to-code-next {spec} --toon",
+    ],
+    "as-status": [
+        "accept {spec} --toon",
+        "status --toon",
+    ],
+}
+
+RUNNER = "import sys; from ana_speksi.launcher import main; sys.argv[0] = 'ana-speksi'; main()"
+
+
+def tick_next_task(spec_dir):
+    """Check the first open task of the spec, like an agent finishing it."""
+    for tasks_file in sorted(spec_dir.glob("specs/*/tasks.md")):
+        content = tasks_file.read_text()
+        updated = re.sub(r"^- \[ \]", "- [x]", content, count=1, flags=re.MULTILINE)
+        if updated != content:
+            tasks_file.write_text(updated)
+            return
+
+
+def run_command(command, cwd):
+    """Run one CLI command in a fresh process.
+
+    Returns (seconds, peak RSS in KiB, exit code).  A non-zero exit code is
+    not an error: e.g. `accept` exits 1 when the phase has nothing to accept.
+    """
+    env = dict(os.environ, ANA_SPEKSI_NO_DAEMON="1")
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", RUNNER, *command.split()],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    rss = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    return elapsed, rss, proc.returncode
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def bench_size(size, args):
+    """Replay every session against a workspace with `size` specs."""
+    samples = {}  # (session, command, mode) -> [(seconds, rss, exit code)]
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = Path(tmp)
+        workspace = generate_workspace(
+            cwd, specs=size, stories=args.stories, tasks=args.tasks, archived=args.archived, seed=args.seed
+        )
+        spec = next(name for name, phase in workspace.phases.items() if phase == Phase.CODIFY)
+        spec_dir = cwd / "ana-speksi" / "ongoing" / spec
+        for _ in range(args.rounds):
+            tick_next_task(spec_dir)
+            for session, commands in SESSIONS.items():
+                for command in commands:
+                    command = command.format(spec=spec)
+                    for mode in ("cold", "warm"):
+                        if mode == "cold":
+                            shutil.rmtree(cwd / "ana-speksi" / ".cache", ignore_errors=True)
+                        key = (session, command.replace(spec, "{spec}"), mode)
+                        samples.setdefault(key, []).append(run_command(command, cwd))
+
+    results = []
+    for (session, command, mode), runs in samples.items():
+        times = [t * 1000 for t, _, _ in runs]
+        results.append(
+            {
+                "specs": size,
+                "session": session,
+                "command": command,
+                "mode": mode,
+                "runs": len(runs),
+                "p50_ms": round(percentile(times, 50), 2),
+                "p95_ms": round(percentile(times, 95), 2),
+                "max_rss_kib": max(rss for _, rss, _ in runs),
+                "exit_codes": sorted({code for _, _, code in runs}),
+            }
+        )
+    return results
+
+
+def compare(results, previous_path):
+    """Print the p50 change of every command against an earlier results file."""
+    previous = json.loads(Path(previous_path).read_text())["results"]
+    key = lambda r: (r["specs"], r["session"], r["command"], r["mode"])
+    before = {key(r): r for r in previous}
+    print(f"\n{'specs':>5} {'mode':<5} {'session':<12} {'command':<34} {'before':>8} {'after':>8} {'change':>7}")
+    for r in results:
+        old = before.get(key(r))
+        if old is None:
+            continue
+        change = (r["p50_ms"] - old["p50_ms"]) / old["p50_ms"] * 100
+        print(
+            f"{r['specs']:>5} {r['mode']:<5} {r['session']:<12} {r['command']:<34} "
+            f"{old['p50_ms']:>8.1f} {r['p50_ms']:>8.1f} {change:>+6.0f}%"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="5,20,80")
+    parser.add_argument("--stories", type=int, default=4)
+    parser.add_argument("--tasks", type=int, default=30)
+    parser.add_argument("--archived", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--out", default="bench-cli.json")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results to compare against")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'specs':>5} {'mode':<5} {'session':<12} {'command':<34} {'p50 ms':>8} {'p95 ms':>8} {'RSS MiB':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        for r in bench_size(size, args):
+            results.append(r)
+            print(
+                f"{r['specs']:>5} {r['mode']:<5} {r['session']:<12} {r['command']:<34} "
+                f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['max_rss_kib'] / 1024:>8.1f}"
+            )
+
+    try:
+        from importlib.metadata import version
+
+        ana_speksi_version = version("ana-speksi")
+    except Exception:
+        ana_speksi_version = None
+    meta = {
+        "ana_speksi": ana_speksi_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stories": args.stories,
+        "tasks": args.tasks,
+        "archived": args.archived,
+        "seed": args.seed,
+        "rounds": args.rounds,
+    }
+    Path(args.out).write_text(json.dumps({"meta": meta, "results": results}, indent=2) + "\n")
+    print(f"\nWrote {args.out}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
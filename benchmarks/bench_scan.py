@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark list_ongoing_specs() serial vs. threaded against spec count.
+
+Generates throwaway workspaces (ana_speksi.workspace_generator) with an
+increasing number of ongoing specs and times an uncached scan with --jobs 1
+and with --jobs N.  On a local disk with a warm page cache threads mostly add
+overhead; use --latency-ms to add a per-stat delay that approximates a
+network-mounted checkout.
+Run with: uv run benchmarks/bench_scan.py [--jobs 8] [--latency-ms 2]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from ana_speksi.status import list_ongoing_specs
+from ana_speksi.workspace_generator import generate_workspace
+
+def add_stat_latency(latency_ms):
+    """Make every Path.stat() sleep first, like a round trip to a file server."""
+    original = Path.stat
+
+    def slow_stat(self, *args, **kwargs):
+        time.sleep(latency_ms / 1000)
+        return original(self, *args, **kwargs)
+
+    Path.stat = slow_stat
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--stories", type=int, default=5)
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sizes", default="10,30,60,120")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    original_stat = Path.stat
+    print(f"{'specs':>6} {'jobs=1 (ms)':>12} {f'jobs={args.jobs} (ms)':>12} {'speedup':>8}")
+    for size in (int(n) for n in args.sizes.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = generate_workspace(
+                Path(tmp), specs=size, stories=args.stories, tasks=args.tasks, archived=0, seed=args.seed
+            ).root
+            if args.latency_ms:
+                add_stat_latency(args.latency_ms)
+            serial = best_of(lambda: list_ongoing_specs(root, use_cache=False, jobs=1), args.repeat)
+            threaded = best_of(lambda: list_ongoing_specs(root, use_cache=False, jobs=args.jobs), args.repeat)
+            if args.latency_ms:
+                Path.stat = original_stat
+        print(f"{size:>6} {serial * 1000:>12.1f} {threaded * 1000:>12.1f} {serial / threaded:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
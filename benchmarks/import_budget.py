@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Check the import-time budget of the agent-facing CLI commands.
+
+Runs each command under `python -X importtime` in a throwaway workspace and
+fails when the total import time exceeds its budget or when a module that
+the command has no use for (rich, yaml, the skill generator) gets imported.
+Import time is noisy, so the best of several runs is compared.
+Run with: uv run benchmarks/import_budget.py [--repeat 5] [--scale 1.5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Budgets in milliseconds of total import time per command.
+BUDGETS = {
+    "status --toon": 150,
+    "status --json": 150,
+    "what-to-code-next --toon": 150,
+    "sync-counts --toon": 150,
+    "lint --toon": 150,
+}
+
+# Modules none of the budgeted commands may import.
+FORBIDDEN = ("rich", "yaml", "ana_speksi.skill_generator", "ana_speksi.watch")
+
+RUNNER = "import sys; from ana_speksi.launcher import main; sys.argv[0] = 'ana-speksi'; main()"
+
+DOC = "# {title}\n\n**Created**: 2026-01-01\n**Status**: {status}\n\n## Body\n"
+
+
+def build_workspace(root):
+    """Create a single ongoing spec in the codify phase."""
+    spec = root / "ana-speksi" / "ongoing" / "BENCH-1.budget"
+    story = spec / "specs" / "01-story"
+    story.mkdir(parents=True)
+    (root / "ana-speksi" / "config.yml").write_text("auto_confirm: false\n")
+    (spec / "proposal.md").write_text(DOC.format(title="Proposal", status="Accepted"))
+    (spec / "index.md").write_text("# Index\n")
+    (spec / "research.md").write_text(DOC.format(title="Research", status="Accepted"))
+    for name in ("functional-spec.md", "technical-spec.md"):
+        (story / name).write_text(DOC.format(title=name, status="Accepted"))
+    (story / "tasks.md").write_text(
+        DOC.format(title="Tasks", status="Accepted") + "\n- [ ] P01.T001 task\n"
+    )
+
+
+def import_profile(command, cwd):
+    """Return (total import ms, imported module names) for one CLI run."""
+    env = dict(os.environ, ANA_SPEKSI_NO_DAEMON="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, *command.split()],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    total = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):  # top level, nested imports included
+            total += int(cumulative)
+    return total / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply all budgets (slow machines)")
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        build_workspace(Path(tmp))
+        # Warm the caches (bytecode, status and config caches) first
+        for command in BUDGETS:
+            import_profile(command, tmp)
+
+        print(f"{'command':<28} {'best ms':>8} {'budget':>8}  forbidden imports")
+        for command, budget in BUDGETS.items():
+            best = float("inf")
+            modules = set()
+            for _ in range(args.repeat):
+                total, modules = import_profile(command, tmp)
+                best = min(best, total)
+            limit = budget * args.scale
+            forbidden = [m for m in FORBIDDEN if m in modules]
+            ok = best <= limit and not forbidden
+            failures += not ok
+            print(
+                f"{command:<28} {best:>8.1f} {limit:>8.0f}  "
+                f"{', '.join(forbidden) or '-'}{'' if ok else '  FAIL'}"
+            )
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Hatch build hook that compiles the packaged skills into one bundle file.
+
+The bundle (see ``ana_speksi/skill_bundle.py``) is written to a temporary
+directory and force-included into the wheel, so the source tree stays
+clean.  Editable installs get no bundle and keep reading ``skills/``
+directly, so edits to a skill show up without a rebuild.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class SkillBundleBuildHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        if self.target_name != "wheel" or version == "editable":
+            return
+        sys.path.insert(0, self.root)
+        try:
+            from ana_speksi.skill_bundle import BUNDLE_NAME, write_bundle
+        finally:
+            sys.path.remove(self.root)
+
+        self._tmp_dir = tempfile.mkdtemp(prefix="ana-speksi-bundle-")
+        bundle = Path(self._tmp_dir) / BUNDLE_NAME
+        write_bundle(bundle, Path(self.root) / "ana_speksi" / "skills")
+        build_data["force_include"][str(bundle)] = f"ana_speksi/{BUNDLE_NAME}"
+
+    def finalize(self, version: str, build_data: dict, artifact_path: str) -> None:
+        tmp_dir = getattr(self, "_tmp_dir", None)
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)